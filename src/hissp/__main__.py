@@ -2,20 +2,33 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import argparse
+import os
 import sys
 
-import hissp.repl
+from hissp.compiler import format_macro_stats, profiling
 from hissp.reader import Lissp
 
 
 def main():
     ns = arg_parser().parse_args()
     sys.argv = ['']
-    if ns.c is not None:
+    if ns.serve is not None:
+        import hissp.server
+
+        hissp.server.serve(ns.serve or None)
+    elif ns.watch:
+        if ns.file is None:
+            arg_parser().error("--watch requires a file")
+        import hissp.watch
+
+        hissp.watch.watch(ns.file)
+    elif ns.c is not None:
         _cmd(ns)
     elif ns.file is not None:
         _with_args(ns)
     else:
+        import hissp.repl
+
         hissp.repl.main()
 
 
@@ -23,28 +36,70 @@ def _cmd(ns):
     sys.argv = ["-c"]
     if ns.file is not None:
         sys.argv.extend([ns.file, *ns.args])
-    ns.i("(hissp.basic.._macro_.prelude)\n"+ns.c)
+    import hissp.prelude
+
+    ns.i(ns.c, ns, hissp.prelude.namespace())
 
 
 def _with_args(ns):
     with argparse.FileType('r')(ns.file) as file:
         sys.argv = [file.name, *ns.args]
         code = file.read()
-    ns.i(code)
+    ns.i(code, ns)
 
 
-def _interact(code):
-    repl = hissp.repl.REPL()
+def _interact(code, ns, env=None):
+    import hissp.repl
+
+    repl = hissp.repl.REPL(env)
     repl.lissp.compiler.evaluate = True
     try:
-        repl.lissp.compile(code)
+        _compile(repl.lissp, code, ns)
     finally:
         repl.lissp.compiler.evaluate = False
         repl.interact()
 
 
-def _no_interact(code):
-    Lissp(evaluate=True).compile(code)
+def _no_interact(code, ns, env=None):
+    if ns.macro_stats or ns.profile is not None:
+        _compile(Lissp(ns=env, evaluate=True), code, ns)
+    elif os.environ.get("HISSP_CACHE_DIR"):  # See hissp.cache.cache_dir.
+        import hissp.cache
+
+        hissp.cache.run(code, env)
+    else:
+        Lissp(ns=env, evaluate=True).compile(code)
+
+
+def _compile(lissp, code, ns):
+    if ns.profile is not None:
+        with profiling(memory=True) as lissp.compiler.profile:
+            try:
+                return _compile_stats(lissp, code, ns)
+            finally:
+                _write_profile(lissp.compiler.profile, ns.profile)
+    _compile_stats(lissp, code, ns)
+
+
+def _compile_stats(lissp, code, ns):
+    if ns.macro_stats:
+        lissp.compiler.macro_stats = {}
+    try:
+        lissp.compile(code)
+    finally:
+        if ns.macro_stats:
+            print(format_macro_stats(lissp.compiler.macro_stats), file=sys.stderr)
+
+
+def _write_profile(profile, path):
+    import json
+
+    if path == "-":
+        json.dump(profile.to_json(), sys.stderr, indent=1)
+        print(file=sys.stderr)
+    else:
+        with open(path, "w") as file:
+            json.dump(profile.to_json(), file, indent=1)
 
 
 def arg_parser():
@@ -58,6 +113,28 @@ def arg_parser():
         help="Drop into REPL after the script."
     )
     _("-c", help="Run main script (with prelude) from this string.", metavar='cmd')
+    _(
+        "--macro-stats",
+        action="store_true",
+        help="Print macro expansion statistics of the script to stderr.",
+    )
+    _(
+        "--profile",
+        metavar="json",
+        help="Write the script's compile phase profile as JSON here. (- for stderr.)",
+    )
+    _(
+        "--watch",
+        action="store_true",
+        help="Recompile the file's changed forms whenever it's saved.",
+    )
+    _(
+        "--serve",
+        nargs="?",
+        const="",
+        metavar="socket",
+        help="Run a compile server on this Unix socket. (See hissp.client.)",
+    )
     _("file", nargs="?", help="Run main script from this file. (- for stdin.)")
     _("args", nargs="*", help="Arguments for the script.")
     return root
@@ -0,0 +1,95 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+"""
+Asynchronous counterpart of `hissp.reader.transpile`.
+
+`transpile` is an async generator of progress `Event` s. Modules are
+read, compiled and written in the given executor (or the loop's default
+one), so the event loop is never blocked. The output is written just as
+`hissp.reader.transpile` writes it (by the same code), including
+``.pyc`` files and incremental builds.
+
+At most ``limit`` modules are in progress at a time. Pass the same
+`asyncio.Semaphore` as the ``limit`` of several calls to share one
+limit among them, e.g. to transpile many packages concurrently::
+
+    limit = asyncio.Semaphore(8)
+    async for event in transpile("foo", "bar", "baz", limit=limit):
+        print(event)
+
+Compiling a module evaluates it. In the default thread pool, modules
+compile concurrently in one process, which suits modules that don't
+depend on each other. Use a `ProcessPoolExecutor` to isolate them.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from importlib import resources
+from pathlib import Path
+from typing import AsyncIterator, NamedTuple, Optional, Union
+
+from hissp.reader import _write_py, transpile_module
+
+
+class Event(NamedTuple):
+    """Progress of a module. Kind is "started", "finished", or "failed"."""
+
+    kind: str
+    qualname: str
+    out: Optional[Path] = None
+    error: Optional[BaseException] = None
+
+
+async def transpile(
+    package: Optional[str],
+    *modules: str,
+    limit: Union[int, asyncio.Semaphore] = 4,
+    executor: Optional[Executor] = None,
+    fold=False,
+    compact=False,
+    incremental=False,
+) -> AsyncIterator[Event]:
+    """Transpile the modules concurrently, yielding progress events."""
+    if isinstance(limit, int):
+        limit = asyncio.Semaphore(limit)
+    events: asyncio.Queue = asyncio.Queue()
+    options = executor, fold, compact, incremental
+    tasks = [
+        asyncio.ensure_future(_transpile(package, m, limit, events, *options))
+        for m in modules
+    ]
+    try:
+        for _ in tasks:
+            while (event := await events.get()).kind == "started":
+                yield event
+            yield event
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _transpile(package, module, limit, events, executor, *options):
+    loop = asyncio.get_running_loop()
+    qualname = f"{package}.{module}" if package else module
+    async with limit:
+        events.put_nowait(Event("started", qualname))
+        try:
+            out = await loop.run_in_executor(executor, _transpile_module, package, module, *options)
+        except Exception as e:
+            events.put_nowait(Event("failed", qualname, error=e))
+        else:
+            events.put_nowait(Event("finished", qualname, out))
+
+
+def _transpile_module(package, module, *options) -> Path:
+    """Transpile one module like `hissp.reader.transpile`. Returns the output path."""
+    if package:
+        resource = module + ".lissp"
+        with resources.path(package, resource) as path:
+            out = path.with_suffix(".py")
+            transpile_module(package, resource, out, *options)  # While the path exists.
+        return out
+    with open(module + ".lissp") as f:
+        code = f.read()
+    _write_py(module + ".py", module, code, *options)
+    return Path(module + ".py")
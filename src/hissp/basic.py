@@ -0,0 +1,1528 @@
+(" Hissp's basic macros.\n"
+ '\n'
+ 'These are automatically made available as unqualified macros in the\n'
+ 'basic REPL. To use them in a Hissp module, use the ``prelude`` macro or\n'
+ 'fully-qualified names. You can abbreviate qualifiers with reader macros:\n'
+ '\n'
+ '.. code-block:: Lissp\n'
+ '\n'
+ '  (hissp.basic.._macro_.alias b/ hissp.basic.._macro_.)\n'
+ '  ;; Now the same as (hissp.basic.._macro_.define foo 2).\n'
+ '  (b/#define foo 2)\n'
+ '\n'
+ 'The basic macros are deliberately restricted in design.\n'
+ '\n'
+ 'They have NO DEPENDENCIES in their expansions;\n'
+ 'they use only the standard library with no extra helper functions.\n'
+ 'This means that the compiled code does not require Hissp to be installed\n'
+ 'to work, but all helper code must be inlined, resulting in larger\n'
+ 'expansions than might otherwise be necessary.\n'
+ '\n'
+ 'They also have no prerequisite initialization, beyond what is available\n'
+ 'in a standard Python module. Their Python compilation would work\n'
+ 'directly in an ``exec()``. For example, a ``_macro_`` namespace need not\n'
+ "be available for ``defmacro``. It's smart enough to check for the\n"
+ 'presence of ``_macro_`` in its expanson context, and inline the\n'
+ 'initialization code when required.\n'
+ '\n'
+ 'With the exception of ``prelude`` (which is only meant for the top\n'
+ 'level), they also eschew text substitutions, relying only on the\n'
+ 'built-in special forms ``quote`` and ``lambda``, which makes their\n'
+ 'expansions compatible with advanced rewriting macros that process the\n'
+ 'expansions of other macros.\n'
+ '\n'
+ 'To help keep macros and their expansions manageable in size, these basic\n'
+ 'macros lack some of the advanced bells and whistles that their\n'
+ 'equivalents have in Python or other Lisps.\n')
+
+__import__('operator').setitem(
+  globals(),
+  '_macro_',
+  __import__('types').ModuleType(
+    '_macro_'))
+
+setattr(
+  _macro_,
+  'defmacro',
+  (lambda name,parameters,docstring,*body:
+    (lambda *xAUTO0_:xAUTO0_)(
+      (lambda *xAUTO0_:xAUTO0_)(
+        'lambda',
+        (lambda *xAUTO0_:xAUTO0_)(
+          ':',
+          '_GxAUTO1_3221665387_',
+          (lambda *xAUTO0_:xAUTO0_)(
+            'lambda',
+            parameters,
+            *body)),
+        (lambda *xAUTO0_:xAUTO0_)(
+          'builtins..setattr',
+          '_GxAUTO1_3221665387_',
+          (lambda *xAUTO0_:xAUTO0_)(
+            'quote',
+            '__doc__'),
+          docstring),
+        (lambda *xAUTO0_:xAUTO0_)(
+          'builtins..setattr',
+          '_GxAUTO1_3221665387_',
+          (lambda *xAUTO0_:xAUTO0_)(
+            'quote',
+            '__qualname__'),
+          (lambda *xAUTO0_:xAUTO0_)(
+            '.join',
+            ('quote', '.', {':str': True}),
+            (lambda *xAUTO0_:xAUTO0_)(
+              'quote',
+              (lambda *xAUTO0_:xAUTO0_)(
+                '_macro_',
+                name)))),
+        (lambda *xAUTO0_:xAUTO0_)(
+          'builtins..setattr',
+          'hissp.basic.._macro_',
+          (lambda *xAUTO0_:xAUTO0_)(
+            'quote',
+            name),
+          '_GxAUTO1_3221665387_')))))
+
+# defmacro
+(lambda _GxAUTO1_3221665387_=(lambda test,then,otherwise:
+  (lambda *xAUTO0_:xAUTO0_)(
+    (lambda *xAUTO0_:xAUTO0_)(
+      'lambda',
+      (lambda *xAUTO0_:xAUTO0_)(
+        'test',
+        ':',
+        ':*',
+        'thenxH_else'),
+      (lambda *xAUTO0_:xAUTO0_)(
+        (lambda *xAUTO0_:xAUTO0_)(
+          'operator..getitem',
+          'thenxH_else',
+          (lambda *xAUTO0_:xAUTO0_)(
+            'operator..not_',
+            'test')))),
+    test,
+    (lambda *xAUTO0_:xAUTO0_)(
+      'lambda',
+      (),
+      then),
+    (lambda *xAUTO0_:xAUTO0_)(
+      'lambda',
+      (),
+      otherwise))):(
+  __import__('builtins').setattr(
+    _GxAUTO1_3221665387_,
+    '__doc__',
+    ('``if-else`` Basic ternary branching construct.\n'
+     '\n'
+     "  Like Python's conditional expressions, the 'else' clause is required.\n"
+     '  ')),
+  __import__('builtins').setattr(
+    _GxAUTO1_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'ifxH_else'))),
+  __import__('builtins').setattr(
+    __import__('builtins').globals()['_macro_'],
+    'ifxH_else',
+    _GxAUTO1_3221665387_))[-1])()
+
+# defmacro
+(lambda _GxAUTO1_3221665387_=(lambda *body:
+  (lambda *xAUTO0_:xAUTO0_)(
+    (lambda *xAUTO0_:xAUTO0_)(
+      'lambda',
+      (),
+      *body))):(
+  __import__('builtins').setattr(
+    _GxAUTO1_3221665387_,
+    '__doc__',
+    ('Evaluates each form in sequence for side effects.\n'
+     '\n'
+     '  Evaluates to the same value as its last form (or ``()`` if empty).\n'
+     '  ')),
+  __import__('builtins').setattr(
+    _GxAUTO1_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'progn'))),
+  __import__('builtins').setattr(
+    __import__('builtins').globals()['_macro_'],
+    'progn',
+    _GxAUTO1_3221665387_))[-1])()
+
+# defmacro
+(lambda _GxAUTO1_3221665387_=(lambda condition,*body:
+  (lambda *xAUTO0_:xAUTO0_)(
+    'hissp.basic.._macro_.ifxH_else',
+    condition,
+    (lambda *xAUTO0_:xAUTO0_)(
+      'hissp.basic.._macro_.progn',
+      *body),
+    ())):(
+  __import__('builtins').setattr(
+    _GxAUTO1_3221665387_,
+    '__doc__',
+    'Evaluates the body when condition is true.'),
+  __import__('builtins').setattr(
+    _GxAUTO1_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'when'))),
+  __import__('builtins').setattr(
+    __import__('builtins').globals()['_macro_'],
+    'when',
+    _GxAUTO1_3221665387_))[-1])()
+
+# defmacro
+(lambda _GxAUTO1_3221665387_=(lambda condition,*body:
+  (lambda *xAUTO0_:xAUTO0_)(
+    'hissp.basic.._macro_.ifxH_else',
+    condition,
+    (),
+    (lambda *xAUTO0_:xAUTO0_)(
+      'hissp.basic.._macro_.progn',
+      *body))):(
+  __import__('builtins').setattr(
+    _GxAUTO1_3221665387_,
+    '__doc__',
+    'Evaluates the body unless condition is true.'),
+  __import__('builtins').setattr(
+    _GxAUTO1_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'unless'))),
+  __import__('builtins').setattr(
+    __import__('builtins').globals()['_macro_'],
+    'unless',
+    _GxAUTO1_3221665387_))[-1])()
+
+# defmacro
+(lambda _GxAUTO1_3221665387_=(lambda pairs,*body:
+  (lambda *xAUTO0_:xAUTO0_)(
+    (lambda *xAUTO0_:xAUTO0_)(
+      'lambda',
+      (lambda *xAUTO0_:xAUTO0_)(
+        ':',
+        *pairs),
+      *body))):(
+  __import__('builtins').setattr(
+    _GxAUTO1_3221665387_,
+    '__doc__',
+    'Creates locals. Pairs are implied. Locals are not in scope until the body.'),
+  __import__('builtins').setattr(
+    _GxAUTO1_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'let'))),
+  __import__('builtins').setattr(
+    __import__('builtins').globals()['_macro_'],
+    'let',
+    _GxAUTO1_3221665387_))[-1])()
+
+# defmacro
+(lambda _GxAUTO1_3221665387_=(lambda name,parameters,docstring=(),*body:
+  # let
+  (lambda xDOLR_fn='_fnxAUTO7_3221665387_':
+    # let
+    (lambda fn=(lambda *xAUTO0_:xAUTO0_)(
+      'lambda',
+      parameters,
+      docstring,
+      *body),ns=# unless
+    # hissp.basic.._macro_.ifxH_else
+    (()
+     if __import__('operator').contains(
+        __import__('hissp.compiler',fromlist='?').NS.get(),
+        '_macro_')
+     else # hissp.basic.._macro_.progn
+      (lambda :
+        (lambda *xAUTO0_:xAUTO0_)(
+          (lambda *xAUTO0_:xAUTO0_)(
+            'operator..setitem',
+            (lambda *xAUTO0_:xAUTO0_)(
+              'builtins..globals'),
+            (lambda *xAUTO0_:xAUTO0_)(
+              'quote',
+              '_macro_'),
+            (lambda *xAUTO0_:xAUTO0_)(
+              'types..ModuleType',
+              (lambda *xAUTO0_:xAUTO0_)(
+                'quote',
+                '_macro_')))))()),dc=# when
+    # hissp.basic.._macro_.ifxH_else
+    (# hissp.basic.._macro_.progn
+      (lambda :
+        (lambda *xAUTO0_:xAUTO0_)(
+          (lambda *xAUTO0_:xAUTO0_)(
+            'builtins..setattr',
+            xDOLR_fn,
+            (lambda *xAUTO0_:xAUTO0_)(
+              'quote',
+              '__doc__'),
+            docstring)))()
+     if __import__('hissp.reader',fromlist='?').is_string(
+        docstring)
+     else ()),qn=(lambda *xAUTO0_:xAUTO0_)(
+      'builtins..setattr',
+      xDOLR_fn,
+      (lambda *xAUTO0_:xAUTO0_)(
+        'quote',
+        '__qualname__'),
+      (lambda *xAUTO0_:xAUTO0_)(
+        '.join',
+        ('quote', '.', {':str': True}),
+        (lambda *xAUTO0_:xAUTO0_)(
+          'quote',
+          (lambda *xAUTO0_:xAUTO0_)(
+            '_macro_',
+            name)))):
+      # ifxH_else
+      ((lambda *xAUTO0_:xAUTO0_)(
+          '.defer',
+          '_macro_',
+          (lambda *xAUTO0_:xAUTO0_)(
+            'quote',
+            name),
+          (lambda *xAUTO0_:xAUTO0_)(
+            'quote',
+            __import__('hissp.compiler',fromlist='?').LazyMacros.compile(
+              fn)),
+          (lambda *xAUTO0_:xAUTO0_)(
+            'builtins..globals'),
+          # ifxH_else
+          (docstring
+           if __import__('hissp.reader',fromlist='?').is_string(
+              docstring)
+           else None))
+       if __import__('hissp.compiler',fromlist='?').LazyMacros.targeted()
+       else (lambda *xAUTO0_:xAUTO0_)(
+          'hissp.basic.._macro_.let',
+          (lambda *xAUTO0_:xAUTO0_)(
+            xDOLR_fn,
+            fn),
+          *ns,
+          *dc,
+          qn,
+          (lambda *xAUTO0_:xAUTO0_)(
+            'builtins..setattr',
+            '_macro_',
+            (lambda *xAUTO0_:xAUTO0_)(
+              'quote',
+              name),
+            xDOLR_fn))))())()):(
+  __import__('builtins').setattr(
+    _GxAUTO1_3221665387_,
+    '__doc__',
+    ('Creates a new macro for the current module.\n'
+     '\n'
+     "  If there's no _macro_, creates one (using ModuleType).\n"
+     "  If there's a docstring, stores it as the new lambda's __doc__.\n"
+     "  Adds the _macro_ prefix to the lambda's qualname.\n"
+     '  Saves the lambda in _macro_ using the given attribute name.\n'
+     '\n'
+     '  If _macro_ is a `hissp.compiler.LazyMacros` and this is a top-level\n'
+     "  form, saves the lambda's compiled Python instead, to be built on first\n"
+     '  use.\n'
+     '  ')),
+  __import__('builtins').setattr(
+    _GxAUTO1_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'defmacro'))),
+  __import__('builtins').setattr(
+    __import__('builtins').globals()['_macro_'],
+    'defmacro',
+    _GxAUTO1_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda name,value:(
+  'Assigns a global in the current module.',
+  (lambda *xAUTO0_:xAUTO0_)(
+    'operator..setitem',
+    (lambda *xAUTO0_:xAUTO0_)(
+      'builtins..globals'),
+    (lambda *xAUTO0_:xAUTO0_)(
+      'quote',
+      name),
+    value))[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    'Assigns a global in the current module.'),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'define'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'define',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda name,bases,*body:(
+  ('Defines a type (class) in the current module.\n'
+   '\n'
+   '  Key-value pairs are implied in the body.\n'
+   '  '),
+  (lambda *xAUTO0_:xAUTO0_)(
+    'hissp.basic.._macro_.define',
+    name,
+    (lambda *xAUTO0_:xAUTO0_)(
+      'builtins..type',
+      (lambda *xAUTO0_:xAUTO0_)(
+        'quote',
+        name),
+      (lambda *xAUTO0_:xAUTO0_)(
+        (lambda *xAUTO0_:xAUTO0_)(
+          'lambda',
+          (lambda *xAUTO0_:xAUTO0_)(
+            ':',
+            ':*',
+            'xAUTO0_'),
+          'xAUTO0_'),
+        *bases),
+      (lambda *xAUTO0_:xAUTO0_)(
+        'builtins..dict',
+        ':',
+        *body))))[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    ('Defines a type (class) in the current module.\n'
+     '\n'
+     '  Key-value pairs are implied in the body.\n'
+     '  ')),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'deftype'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'deftype',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda sequence:(
+  'The first item of a sequence.',
+  (lambda *xAUTO0_:xAUTO0_)(
+    'operator..getitem',
+    sequence,
+    (0)))[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    'The first item of a sequence.'),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'car'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'car',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda sequence:(
+  'Slice of the sequence without the first item.',
+  (lambda *xAUTO0_:xAUTO0_)(
+    'operator..getitem',
+    sequence,
+    (lambda *xAUTO0_:xAUTO0_)(
+      'builtins..slice',
+      (1),
+      None)))[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    'Slice of the sequence without the first item.'),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'cdr'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'cdr',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda xss:(
+  'The first item of the first item. Short for ``(car (car xss))``.',
+  (lambda *xAUTO0_:xAUTO0_)(
+    'hissp.basic.._macro_.car',
+    (lambda *xAUTO0_:xAUTO0_)(
+      'hissp.basic.._macro_.car',
+      xss)))[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    'The first item of the first item. Short for ``(car (car xss))``.'),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'caar'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'caar',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda xss:(
+  ('The slice of the first item without its first item.\n'
+   '\n'
+   '  Short for ``(cdr (car xss))``.\n'
+   '  '),
+  (lambda *xAUTO0_:xAUTO0_)(
+    'hissp.basic.._macro_.cdr',
+    (lambda *xAUTO0_:xAUTO0_)(
+      'hissp.basic.._macro_.car',
+      xss)))[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    ('The slice of the first item without its first item.\n'
+     '\n'
+     '  Short for ``(cdr (car xss))``.\n'
+     '  ')),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'cdar'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'cdar',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda sequence:(
+  ('The second item of a sequence.\n'
+   '\n'
+   '  Like ``(car (cdr sequence))``, but more efficient.\n'
+   '  '),
+  (lambda *xAUTO0_:xAUTO0_)(
+    'operator..getitem',
+    sequence,
+    (1)))[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    ('The second item of a sequence.\n'
+     '\n'
+     '  Like ``(car (cdr sequence))``, but more efficient.\n'
+     '  ')),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'cadr'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'cadr',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda sequence:(
+  ('Slice of the sequence without the first two items.\n'
+   '\n'
+   '  Like ``(cdr (cdr sequence))``, but more efficient.\n'
+   '  '),
+  (lambda *xAUTO0_:xAUTO0_)(
+    'operator..getitem',
+    sequence,
+    (lambda *xAUTO0_:xAUTO0_)(
+      'builtins..slice',
+      (2),
+      None)))[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    ('Slice of the sequence without the first two items.\n'
+     '\n'
+     '  Like ``(cdr (cdr sequence))``, but more efficient.\n'
+     '  ')),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'cddr'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'cddr',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda target,*args:(
+  ('Attaches the named variables as attributes of the target.\n'
+   '\n'
+   '  Positional arguments use the same name as the variable.\n'
+   '  Names after the ``:`` are key-value pairs.\n'
+   '  '),
+  # let
+  (lambda iargs=iter(
+    args),xDOLR_target='_targetxAUTO22_3221665387_':
+    # let
+    (lambda args=__import__('itertools').takewhile(
+      (lambda a:
+        __import__('operator').ne(
+          a,
+          ':')),
+      iargs):
+      (lambda *xAUTO0_:xAUTO0_)(
+        'hissp.basic.._macro_.let',
+        (lambda *xAUTO0_:xAUTO0_)(
+          xDOLR_target,
+          target),
+        *map(
+          (lambda arg:
+            (lambda *xAUTO0_:xAUTO0_)(
+              'builtins..setattr',
+              xDOLR_target,
+              (lambda *xAUTO0_:xAUTO0_)(
+                'quote',
+                arg),
+              arg)),
+          args),
+        *map(
+          (lambda kw:
+            (lambda *xAUTO0_:xAUTO0_)(
+              'builtins..setattr',
+              xDOLR_target,
+              (lambda *xAUTO0_:xAUTO0_)(
+                'quote',
+                kw),
+              next(
+                iargs))),
+          iargs),
+        xDOLR_target))())())[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    ('Attaches the named variables as attributes of the target.\n'
+     '\n'
+     '  Positional arguments use the same name as the variable.\n'
+     '  Names after the ``:`` are key-value pairs.\n'
+     '  ')),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'attach'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'attach',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda thing,*calls:(
+  ('Call multiple methods on one object.\n'
+   '\n'
+   '  Evaluates the given thing then uses it as the first argument to a\n'
+   '  sequence of calls. Used for initialization. Evaluates to the thing.\n'
+   '  '),
+  # let
+  (lambda xDOLR_thing='_thingxAUTO26_3221665387_':
+    (lambda *xAUTO0_:xAUTO0_)(
+      (lambda *xAUTO0_:xAUTO0_)(
+        'lambda',
+        (lambda *xAUTO0_:xAUTO0_)(
+          ':',
+          xDOLR_thing,
+          thing),
+        *map(
+          (lambda call:
+            (lambda *xAUTO0_:xAUTO0_)(
+              # car
+              __import__('operator').getitem(
+                call,
+                (0)),
+              xDOLR_thing,
+              *# cdr
+              __import__('operator').getitem(
+                call,
+                __import__('builtins').slice(
+                  (1),
+                  None)))),
+          calls),
+        xDOLR_thing)))())[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    ('Call multiple methods on one object.\n'
+     '\n'
+     '  Evaluates the given thing then uses it as the first argument to a\n'
+     '  sequence of calls. Used for initialization. Evaluates to the thing.\n'
+     '  ')),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'cascade'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'cascade',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda expr,*forms:(
+  ("``->`` 'Thread-first'.\n"
+   '\n'
+   '  Converts a pipeline to function calls by threading each form as the\n'
+   '  first argument of the next.\n'
+   '  E.g. ``(-> x (A b) (C d e))`` is ``(C (A x b) d e)``\n'
+   '  Makes chained method calls easier to read.\n'
+   '  '),
+  # let
+  (lambda xDOLR_x='_xxAUTO29_3221665387_',thread=(lambda expr,forms:
+    __import__('functools').reduce(
+      (lambda acc,form:
+        (lambda *xAUTO0_:xAUTO0_)(
+          # car
+          __import__('operator').getitem(
+            form,
+            (0)),
+          acc,
+          *# cdr
+          __import__('operator').getitem(
+            form,
+            __import__('builtins').slice(
+              (1),
+              None)))),
+      forms,
+      expr)):
+    # ifxH_else
+    (thread(
+        expr,
+        forms)
+     if __import__('operator').le(
+        len(
+          forms),
+        (16))
+     else (lambda *xAUTO0_:xAUTO0_)(
+        'functools..reduce',
+        (lambda *xAUTO0_:xAUTO0_)(
+          'lambda',
+          (lambda *xAUTO0_:xAUTO0_)(
+            '_xxAUTO31_3221665387_',
+            '_fxAUTO31_3221665387_'),
+          (lambda *xAUTO0_:xAUTO0_)(
+            '_fxAUTO31_3221665387_',
+            '_xxAUTO31_3221665387_')),
+        (lambda *xAUTO0_:xAUTO0_)(
+          (lambda *xAUTO0_:xAUTO0_)(
+            'lambda',
+            (lambda *xAUTO0_:xAUTO0_)(
+              ':',
+              ':*',
+              'xAUTO0_'),
+            'xAUTO0_'),
+          *map(
+            (lambda i:
+              (lambda *xAUTO0_:xAUTO0_)(
+                'lambda',
+                (lambda *xAUTO0_:xAUTO0_)(
+                  xDOLR_x),
+                thread(
+                  xDOLR_x,
+                  __import__('operator').getitem(
+                    forms,
+                    slice(
+                      i,
+                      __import__('operator').add(
+                        i,
+                        (16))))))),
+            range(
+              (0),
+              len(
+                forms),
+              (16)))),
+        expr)))())[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    ("``->`` 'Thread-first'.\n"
+     '\n'
+     '  Converts a pipeline to function calls by threading each form as the\n'
+     '  first argument of the next.\n'
+     '  E.g. ``(-> x (A b) (C d e))`` is ``(C (A x b) d e)``\n'
+     '  Makes chained method calls easier to read.\n'
+     '  ')),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'xH_xGT_'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'xH_xGT_',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda expr,*forms:(
+  ("``->>`` 'Thread-last'.\n"
+   '\n'
+   '  Converts a pipeline to function calls by threading each form as the\n'
+   '  last argument of the next.\n'
+   '  E.g. ``(->> x (A b) (C d e))`` is ``(C d e (A b x))``.\n'
+   '  Can replace partial application in some cases.\n'
+   '  Also works inside a ``->`` pipeline.\n'
+   '  E.g. ``(-> x (A a) (->> B b) (C c))`` is ``(C (B b (A x a)) c)``.\n'
+   '  '),
+  # let
+  (lambda xDOLR_x='_xxAUTO33_3221665387_',thread=(lambda expr,forms:
+    __import__('functools').reduce(
+      (lambda acc,form:
+        (lambda *xAUTO0_:xAUTO0_)(
+          *form,
+          acc)),
+      forms,
+      expr)):
+    # ifxH_else
+    (thread(
+        expr,
+        forms)
+     if __import__('operator').le(
+        len(
+          forms),
+        (16))
+     else (lambda *xAUTO0_:xAUTO0_)(
+        'functools..reduce',
+        (lambda *xAUTO0_:xAUTO0_)(
+          'lambda',
+          (lambda *xAUTO0_:xAUTO0_)(
+            '_xxAUTO35_3221665387_',
+            '_fxAUTO35_3221665387_'),
+          (lambda *xAUTO0_:xAUTO0_)(
+            '_fxAUTO35_3221665387_',
+            '_xxAUTO35_3221665387_')),
+        (lambda *xAUTO0_:xAUTO0_)(
+          (lambda *xAUTO0_:xAUTO0_)(
+            'lambda',
+            (lambda *xAUTO0_:xAUTO0_)(
+              ':',
+              ':*',
+              'xAUTO0_'),
+            'xAUTO0_'),
+          *map(
+            (lambda i:
+              (lambda *xAUTO0_:xAUTO0_)(
+                'lambda',
+                (lambda *xAUTO0_:xAUTO0_)(
+                  xDOLR_x),
+                thread(
+                  xDOLR_x,
+                  __import__('operator').getitem(
+                    forms,
+                    slice(
+                      i,
+                      __import__('operator').add(
+                        i,
+                        (16))))))),
+            range(
+              (0),
+              len(
+                forms),
+              (16)))),
+        expr)))())[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    ("``->>`` 'Thread-last'.\n"
+     '\n'
+     '  Converts a pipeline to function calls by threading each form as the\n'
+     '  last argument of the next.\n'
+     '  E.g. ``(->> x (A b) (C d e))`` is ``(C d e (A b x))``.\n'
+     '  Can replace partial application in some cases.\n'
+     '  Also works inside a ``->`` pipeline.\n'
+     '  E.g. ``(-> x (A a) (->> B b) (C c))`` is ``(C (B b (A x a)) c)``.\n'
+     '  ')),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'xH_xGT_xGT_'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'xH_xGT_xGT_',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda *pairs:(
+  ('Multiple condition branching.\n'
+   '\n'
+   '  Pairs are implied. Default is (); use :else to change it.\n'
+   '  For example::\n'
+   '\n'
+   '   (cond)  ; ()\n'
+   "   ;; Assume some number 'x\n"
+   '   (cond (operator..gt x 0) (print "positive")\n'
+   '         (operator..lt x 0) (print "negative")\n'
+   '         (operator..eq x 0) (print "zero")\n'
+   '         :else (print "not a number"))\n'
+   '\n'
+   "  Up to 16 pairs expand to a chain of nested `if-else` s. Python's parser\n"
+   "  can't nest much deeper than that, so longer chains are cut into runs of\n"
+   '  16, each evaluating to a 1-tuple of its result, or to () if none of its\n'
+   '  tests pass. The runs are joined by `||`, which balances them.\n'
+   '  '),
+  # when
+  # hissp.basic.._macro_.ifxH_else
+  (# hissp.basic.._macro_.progn
+    (lambda :
+      exec(
+        "raise TypeError('cond needs an even number of arguments (test-branch pairs)')"))()
+   if __import__('operator').mod(
+      len(
+        pairs),
+      (2))
+   else ()),
+  # let
+  (lambda chain=(lambda lo,hi,wrap,otherwise:
+    __import__('functools').reduce(
+      (lambda acc,i:
+        (lambda *xAUTO0_:xAUTO0_)(
+          'hissp.basic.._macro_.ifxH_else',
+          __import__('operator').getitem(
+            pairs,
+            i),
+          wrap(
+            __import__('operator').getitem(
+              pairs,
+              __import__('operator').add(
+                i,
+                (1)))),
+          acc)),
+      range(
+        __import__('operator').sub(
+          hi,
+          (2)),
+        __import__('operator').sub(
+          lo,
+          (1)),
+        (-2)),
+      otherwise)):
+    # ifxH_else
+    (chain(
+        (0),
+        len(
+          pairs),
+        (lambda x:x),
+        ())
+     if __import__('operator').le(
+        len(
+          pairs),
+        (32))
+     else (lambda *xAUTO0_:xAUTO0_)(
+        'operator..getitem',
+        (lambda *xAUTO0_:xAUTO0_)(
+          'hissp.basic..xAUTO_.xBAR_xBAR_',
+          *map(
+            (lambda lo:
+              chain(
+                lo,
+                min(
+                  len(
+                    pairs),
+                  __import__('operator').add(
+                    lo,
+                    (32))),
+                (lambda x:
+                  (lambda *xAUTO0_:xAUTO0_)(
+                    (lambda *xAUTO0_:xAUTO0_)(
+                      'lambda',
+                      (lambda *xAUTO0_:xAUTO0_)(
+                        ':',
+                        ':*',
+                        'xAUTO0_'),
+                      'xAUTO0_'),
+                    x)),
+                ())),
+            range(
+              (0),
+              len(
+                pairs),
+              (32))),
+          (lambda *xAUTO0_:xAUTO0_)(
+            (lambda *xAUTO0_:xAUTO0_)(
+              'lambda',
+              (lambda *xAUTO0_:xAUTO0_)(
+                ':',
+                ':*',
+                'xAUTO0_'),
+              'xAUTO0_'),
+            ())),
+        (0))))())[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    ('Multiple condition branching.\n'
+     '\n'
+     '  Pairs are implied. Default is (); use :else to change it.\n'
+     '  For example::\n'
+     '\n'
+     '   (cond)  ; ()\n'
+     "   ;; Assume some number 'x\n"
+     '   (cond (operator..gt x 0) (print "positive")\n'
+     '         (operator..lt x 0) (print "negative")\n'
+     '         (operator..eq x 0) (print "zero")\n'
+     '         :else (print "not a number"))\n'
+     '\n'
+     "  Up to 16 pairs expand to a chain of nested `if-else` s. Python's parser\n"
+     "  can't nest much deeper than that, so longer chains are cut into runs of\n"
+     '  16, each evaluating to a 1-tuple of its result, or to () if none of its\n'
+     '  tests pass. The runs are joined by `||`, which balances them.\n'
+     '  ')),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'cond'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'cond',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda item,iterable,*body:(
+  '``any-for`` Evaluate body for each item in iterable until any result is true.',
+  (lambda *xAUTO0_:xAUTO0_)(
+    'builtins..any',
+    (lambda *xAUTO0_:xAUTO0_)(
+      'builtins..map',
+      (lambda *xAUTO0_:xAUTO0_)(
+        'lambda',
+        (lambda *xAUTO0_:xAUTO0_)(
+          item),
+        *body),
+      iterable)))[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    '``any-for`` Evaluate body for each item in iterable until any result is true.'),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'anyxH_for'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'anyxH_for',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda item,iterable,*body:(
+  ('``for-each`` Evaluate body for each item in iterable, for side effects.\n'
+   '\n'
+   "  Like Python's ``for`` statement, but evaluates to None.\n"
+   '  '),
+  (lambda *xAUTO0_:xAUTO0_)(
+    '.clear',
+    (lambda *xAUTO0_:xAUTO0_)(
+      'collections..deque',
+      (lambda *xAUTO0_:xAUTO0_)(
+        'builtins..map',
+        (lambda *xAUTO0_:xAUTO0_)(
+          'lambda',
+          (lambda *xAUTO0_:xAUTO0_)(
+            item),
+          *body),
+        iterable),
+      ':',
+      'maxlen',
+      (0))))[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    ('``for-each`` Evaluate body for each item in iterable, for side effects.\n'
+     '\n'
+     "  Like Python's ``for`` statement, but evaluates to None.\n"
+     '  ')),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'forxH_each'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'forxH_each',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda condition,*body:(
+  ('``loop-while`` Evaluate body while condition is true.\n'
+   '\n'
+   "  Like Python's ``while`` statement, but evaluates to None.\n"
+   '  For example::\n'
+   '\n'
+   '   (let (xs [1,2,3])\n'
+   '     (loop-while xs\n'
+   '       (print (.pop xs))))\n'
+   '  '),
+  (lambda *xAUTO0_:xAUTO0_)(
+    '.clear',
+    (lambda *xAUTO0_:xAUTO0_)(
+      'collections..deque',
+      (lambda *xAUTO0_:xAUTO0_)(
+        'builtins..map',
+        (lambda *xAUTO0_:xAUTO0_)(
+          'lambda',
+          (lambda *xAUTO0_:xAUTO0_)(
+            '__xAUTO42_3221665387_'),
+          *body),
+        (lambda *xAUTO0_:xAUTO0_)(
+          'builtins..iter',
+          (lambda *xAUTO0_:xAUTO0_)(
+            'lambda',
+            (),
+            (lambda *xAUTO0_:xAUTO0_)(
+              'hissp.basic.._macro_.ifxH_else',
+              condition,
+              True,
+              False)),
+          False)),
+      ':',
+      'maxlen',
+      (0))))[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    ('``loop-while`` Evaluate body while condition is true.\n'
+     '\n'
+     "  Like Python's ``while`` statement, but evaluates to None.\n"
+     '  For example::\n'
+     '\n'
+     '   (let (xs [1,2,3])\n'
+     '     (loop-while xs\n'
+     '       (print (.pop xs))))\n'
+     '  ')),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'loopxH_while'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'loopxH_while',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda *exprs:(
+  "``&&`` 'and'. Like Python's ``and`` operator, but for any number of arguments.",
+  # let
+  (lambda tree=(lambda tree,lo,hi:
+    # ifxH_else
+    (__import__('operator').getitem(
+        exprs,
+        lo)
+     if __import__('operator').eq(
+        (1),
+        __import__('operator').sub(
+          hi,
+          lo))
+     else # let
+      (lambda xDOLR_G='_GxAUTO43_3221665387_',mid=__import__('operator').floordiv(
+        __import__('operator').add(
+          lo,
+          hi),
+        (2)):
+        (lambda *xAUTO0_:xAUTO0_)(
+          'hissp.basic.._macro_.let',
+          (lambda *xAUTO0_:xAUTO0_)(
+            xDOLR_G,
+            tree(
+              tree,
+              lo,
+              mid)),
+          _macro_.ifxH_else(
+            xDOLR_G,
+            tree(
+              tree,
+              mid,
+              hi),
+            xDOLR_G)))())):
+    # ifxH_else
+    (tree(
+        tree,
+        (0),
+        len(
+          exprs))
+     if exprs
+     else True))())[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    "``&&`` 'and'. Like Python's ``and`` operator, but for any number of arguments."),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'xET_xET_'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'xET_xET_',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda first=(),*rest:(
+  "``||`` 'or'. Like Python's ``or`` operator, but for any number of arguments.",
+  # let
+  (lambda exprs=(lambda *xAUTO0_:xAUTO0_)(
+    first,
+    *rest):
+    # let
+    (lambda tree=(lambda tree,lo,hi:
+      # ifxH_else
+      (__import__('operator').getitem(
+          exprs,
+          lo)
+       if __import__('operator').eq(
+          (1),
+          __import__('operator').sub(
+            hi,
+            lo))
+       else # let
+        (lambda xDOLR_first='_firstxAUTO46_3221665387_',mid=__import__('operator').floordiv(
+          __import__('operator').add(
+            lo,
+            hi),
+          (2)):
+          (lambda *xAUTO0_:xAUTO0_)(
+            'hissp.basic.._macro_.let',
+            (lambda *xAUTO0_:xAUTO0_)(
+              xDOLR_first,
+              tree(
+                tree,
+                lo,
+                mid)),
+            _macro_.ifxH_else(
+              xDOLR_first,
+              xDOLR_first,
+              tree(
+                tree,
+                mid,
+                hi))))())):
+      tree(
+        tree,
+        (0),
+        len(
+          exprs)))())())[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    "``||`` 'or'. Like Python's ``or`` operator, but for any number of arguments."),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'xBAR_xBAR_'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'xBAR_xBAR_',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda key,default,*pairs:(
+  ("Switches on the key's value with one dict lookup.\n"
+   '\n'
+   '  The default is required. Pairs are implied. The first of each pair is\n'
+   '  a literal (quoted, not evaluated; symbols are their strings), matched\n'
+   '  by equality and hash. The first of duplicates wins.\n'
+   '  For example::\n'
+   '\n'
+   '   (case x (print "unknown")\n'
+   '     0 (print "zero")\n'
+   '     one (print "the string \'one\'")\n'
+   '     "two" (print "the string \'two\'"))\n'
+   '\n'
+   "  Python can't make a dict constant, so the lookup table is built on\n"
+   "  first use and kept in the module's globals, under a name derived from\n"
+   '  its keys. The lookup finds the index of the branch, which is then\n'
+   '  reached through nested `if-else` s, a binary search, so only about\n'
+   "  log2(N) index comparisons are made, rather than `cond`'s N tests of\n"
+   '  the key. See ``tests/bench_case.py`` for the crossover.\n'
+   '  '),
+  # when
+  # hissp.basic.._macro_.ifxH_else
+  (# hissp.basic.._macro_.progn
+    (lambda :
+      exec(
+        "raise TypeError('case needs an even number of arguments after the default')"))()
+   if __import__('operator').mod(
+      len(
+        pairs),
+      (2))
+   else ()),
+  # let
+  (lambda xDOLR_i='_ixAUTO48_3221665387_',keys=list(
+    map(
+      (lambda k:
+        # ifxH_else
+        (__import__('operator').getitem(
+            k,
+            (1))
+         if __import__('hissp.reader',fromlist='?').is_string(
+            k)
+         else k)),
+      __import__('operator').getitem(
+        pairs,
+        slice(
+          None,
+          None,
+          (2))))):
+    # let
+    (lambda table=dict(
+      reversed(
+        list(
+          zip(
+            keys,
+            range(
+              (1),
+              __import__('operator').add(
+                (1),
+                len(
+                  keys))))))):
+      # let
+      (lambda name='_casexAUTO{}_'.format(
+        __import__('operator').getitem(
+          __import__('hashlib').sha1(
+            repr(
+              table).encode()).hexdigest(),
+          slice(
+            None,
+            (12)))),search=(lambda search,lo,branches:
+        # ifxH_else
+        (# car
+          __import__('operator').getitem(
+            branches,
+            (0))
+         if __import__('operator').eq(
+            (1),
+            len(
+              branches))
+         else # let
+          (lambda mid=__import__('operator').floordiv(
+            len(
+              branches),
+            (2)):
+            (lambda *xAUTO0_:xAUTO0_)(
+              'hissp.basic.._macro_.ifxH_else',
+              (lambda *xAUTO0_:xAUTO0_)(
+                '.__lt__',
+                xDOLR_i,
+                __import__('operator').add(
+                  lo,
+                  mid)),
+              search(
+                search,
+                lo,
+                __import__('operator').getitem(
+                  branches,
+                  slice(
+                    None,
+                    mid))),
+              search(
+                search,
+                __import__('operator').add(
+                  lo,
+                  mid),
+                __import__('operator').getitem(
+                  branches,
+                  slice(
+                    mid,
+                    None)))))())):
+        (lambda *xAUTO0_:xAUTO0_)(
+          'hissp.basic.._macro_.let',
+          (lambda *xAUTO0_:xAUTO0_)(
+            xDOLR_i,
+            (lambda *xAUTO0_:xAUTO0_)(
+              '.get',
+              (lambda *xAUTO0_:xAUTO0_)(
+                'hissp.basic.._macro_.xBAR_xBAR_',
+                (lambda *xAUTO0_:xAUTO0_)(
+                  '.get',
+                  (lambda *xAUTO0_:xAUTO0_)(
+                    'globals'),
+                  (lambda *xAUTO0_:xAUTO0_)(
+                    'quote',
+                    name)),
+                (lambda *xAUTO0_:xAUTO0_)(
+                  '.setdefault',
+                  (lambda *xAUTO0_:xAUTO0_)(
+                    'globals'),
+                  (lambda *xAUTO0_:xAUTO0_)(
+                    'quote',
+                    name),
+                  (lambda *xAUTO0_:xAUTO0_)(
+                    'builtins..dict',
+                    (lambda *xAUTO0_:xAUTO0_)(
+                      'quote',
+                      tuple(
+                        table.items()))))),
+              key,
+              (0))),
+          search(
+            search,
+            (0),
+            (lambda *xAUTO0_:xAUTO0_)(
+              default,
+              *__import__('operator').getitem(
+                pairs,
+                slice(
+                  (1),
+                  None,
+                  (2)))))))())())())[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    ("Switches on the key's value with one dict lookup.\n"
+     '\n'
+     '  The default is required. Pairs are implied. The first of each pair is\n'
+     '  a literal (quoted, not evaluated; symbols are their strings), matched\n'
+     '  by equality and hash. The first of duplicates wins.\n'
+     '  For example::\n'
+     '\n'
+     '   (case x (print "unknown")\n'
+     '     0 (print "zero")\n'
+     '     one (print "the string \'one\'")\n'
+     '     "two" (print "the string \'two\'"))\n'
+     '\n'
+     "  Python can't make a dict constant, so the lookup table is built on\n"
+     "  first use and kept in the module's globals, under a name derived from\n"
+     '  its keys. The lookup finds the index of the branch, which is then\n'
+     '  reached through nested `if-else` s, a binary search, so only about\n'
+     "  log2(N) index comparisons are made, rather than `cond`'s N tests of\n"
+     '  the key. See ``tests/bench_case.py`` for the crossover.\n'
+     '  ')),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'case'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'case',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda expr1,*body:(
+  ('Evaluates each expression in sequence (for side effects),\n'
+   '  resulting in the value of the first.'),
+  (lambda *xAUTO0_:xAUTO0_)(
+    'hissp.basic.._macro_.let',
+    (lambda *xAUTO0_:xAUTO0_)(
+      '_value1xAUTO52_3221665387_',
+      expr1),
+    *body,
+    '_value1xAUTO52_3221665387_'))[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    ('Evaluates each expression in sequence (for side effects),\n'
+     '  resulting in the value of the first.')),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'prog1'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'prog1',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda :(
+  ('Grants unqualified access to the basics.\n'
+   '\n'
+   '  Star imports from operator and itertools.\n'
+   '  And adds the basic macros, if available.\n'
+   '  '),
+  (lambda *xAUTO0_:xAUTO0_)(
+    'builtins..exec',
+    ('quote',
+     '\n'
+     'from operator import *\n'
+     'from itertools import *\n'
+     'try:\n'
+     '    from hissp.basic import _macro_\n'
+     "    _macro_ = __import__('types').SimpleNamespace(**vars(_macro_))\n"
+     'except ModuleNotFoundError:\n'
+     '    pass',
+     {':str': True})))[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    ('Grants unqualified access to the basics.\n'
+     '\n'
+     '  Star imports from operator and itertools.\n'
+     '  And adds the basic macros, if available.\n'
+     '  ')),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'prelude'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'prelude',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda alias,module:(
+  'Defines a reader macro abbreviation of a qualifier.',
+  (lambda *xAUTO0_:xAUTO0_)(
+    'hissp.basic.._macro_.defmacro',
+    alias,
+    (lambda *xAUTO0_:xAUTO0_)(
+      '_GxAUTO54_3221665387_'),
+    (lambda *xAUTO0_:xAUTO0_)(
+      'quote',
+      'Aliases {} as {}#'.format(
+        module,
+        alias)),
+    (lambda *xAUTO0_:xAUTO0_)(
+      '.format',
+      ('quote', '{}{}', {':str': True}),
+      (lambda *xAUTO0_:xAUTO0_)(
+        'quote',
+        module),
+      '_GxAUTO54_3221665387_')))[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    'Defines a reader macro abbreviation of a qualifier.'),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'alias'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'alias',
+    _fnxAUTO7_3221665387_))[-1])()
\ No newline at end of file
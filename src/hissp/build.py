@@ -0,0 +1,249 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+"""
+Builds whole packages of Lissp modules, in parallel.
+
+`transpile` compiles the modules it's given one after another, in the
+given order. `build` instead finds every ``.lissp`` module in the
+packages (and their subpackages), and scans each one for the qualified
+symbols (``foo.bar..baz``), module handles (``foo.bar.``) and qualified
+reader macros (``foo.bar..baz#``) that refer to the other modules. A
+module is only compiled after the modules it refers to have been
+written, since compiling one evaluates it, which may import them, or
+use their macros. Independent modules compile concurrently in a
+`ProcessPoolExecutor`.
+
+Each `Lissp` instance has its own gensym counter, so the output is
+byte-for-byte the same as compiling the modules sequentially in
+dependency order (which is what ``workers=1`` does).
+
+A cycle among the modules is broken at its first module (in
+alphabetical order). It compiles against whatever version of the rest
+of the cycle is already on disk, just as it would sequentially.
+
+An incremental build (``incremental=True``) skips the modules whose
+inputs haven't changed since their last build. Besides each output
+``.py`` file, it writes a manifest (in ``__pycache__``) recording a hash
+of the source, the Hissp version, the compiler options, and a hash of
+the file of every module whose ``_macro_`` (or reader macros) the
+compiler used, including the compiler's own. Macros are assumed to be
+deterministic. The `transpile` functions take the same flag.
+
+From the command line::
+
+    $ python -m hissp.build foo bar.baz --workers 4 --incremental
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from importlib import invalidate_caches
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set
+
+from hissp.cache import COMPILER, fingerprint
+from hissp.compiler import Compiler
+from hissp.munger import munge
+from hissp.reader import Lexer, Lissp, transpile_module
+
+
+class Module(NamedTuple):
+    """A Lissp module of a package, and the modules it depends on."""
+
+    name: str
+    package: str
+    resource: str
+    dependencies: Set[str]
+
+
+def modules(*packages: str) -> Dict[str, Module]:
+    """Find the Lissp modules in the packages, by qualified name."""
+    found = {}
+    for package in packages:
+        for location in find_spec(package).submodule_search_locations:
+            for directory, dirs, files in os.walk(location):
+                dirs[:] = sorted(d for d in dirs if d.isidentifier())
+                relative = Path(directory).relative_to(location).parts
+                subpackage = ".".join([package, *relative])
+                for file in sorted(f for f in files if f.endswith(".lissp")):
+                    stem = file[: -len(".lissp")]
+                    name = subpackage if stem == "__init__" else f"{subpackage}.{stem}"
+                    with open(os.path.join(directory, file)) as f:
+                        code = f.read()
+                    found[name] = Module(name, subpackage, file, references(code))
+    for module in found.values():
+        module.dependencies.intersection_update(found.keys() - {module.name})
+    return found
+
+
+def references(code: str) -> Set[str]:
+    """Names of the modules (and their packages) referred to by the code."""
+    names = set()
+    for kind, token, _ in Lexer(code):
+        if kind not in {"atom", "macro"} or ".." not in token and not token.endswith("."):
+            continue
+        symbol = munge(Lissp.escape(token[:-1] if kind == "macro" else token))
+        if symbol.startswith("."):
+            continue
+        module = symbol.split("..", 1)[0] if ".." in symbol else symbol[:-1]
+        parts = module.split(".")
+        names.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+    return names
+
+
+def order(graph: Dict[str, Module]) -> Iterator[List[str]]:
+    """Yield batches of modules, each depending only on earlier batches."""
+    done: Set[str] = set()
+    remaining = sorted(graph)
+    while remaining:
+        batch = [m for m in remaining if graph[m].dependencies <= done]
+        batch = batch or remaining[:1]  # Break a cycle.
+        yield batch
+        done.update(batch)
+        remaining = [m for m in remaining if m not in done]
+
+
+def build(
+    *packages: str,
+    workers: Optional[int] = None,
+    fold=False,
+    compact=False,
+    incremental=False,
+):
+    """
+    Transpile every Lissp module in the packages, in dependency order.
+
+    Uses a process pool of the given number of workers
+    (default: one per CPU). With one worker, compiles in this process.
+    """
+    graph = modules(*packages)
+    options = fold, compact, incremental
+    if workers == 1:
+        for batch in order(graph):
+            for name in batch:
+                _transpile(graph[name], *options)
+        return
+    with ProcessPoolExecutor(workers) as executor:
+        done: Set[str] = set()
+        running = {}
+        while len(done) < len(graph):
+            ready = [
+                name
+                for name in sorted(graph.keys() - done - running.keys())
+                if graph[name].dependencies <= done
+            ]
+            if not ready and not running:
+                ready = sorted(graph.keys() - done)[:1]  # Break a cycle.
+            for name in ready:
+                future = executor.submit(_transpile, graph[name], *options)
+                running[name] = future
+            finished, _ = wait(running.values(), return_when=FIRST_COMPLETED)
+            for name, future in [*running.items()]:
+                if future in finished:
+                    future.result()  # Raise any compile error.
+                    done.add(name)
+                    del running[name]
+
+
+def _transpile(module: Module, fold, compact, incremental):
+    transpile_module(
+        module.package,
+        module.resource,
+        fold=fold,
+        compact=compact,
+        incremental=incremental,
+    )
+    # Dependents compiled later in this process must import the new version.
+    sys.modules.pop(module.name, None)
+    invalidate_caches()
+
+
+def manifest(out) -> Path:
+    """The manifest file recording the inputs of the output file."""
+    out = Path(out)
+    return out.parent / "__pycache__" / f"{out.stem}.lissp.json"
+
+
+def version() -> Optional[str]:
+    """The installed Hissp version, if known."""
+    from importlib import metadata
+
+    try:
+        return metadata.version("hissp")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def fresh(out, code: str, options: Dict[str, Any]) -> bool:
+    """Whether the output file was built from the same inputs."""
+    try:
+        recorded = json.loads(manifest(out).read_text())
+        return (
+            recorded["source"] == _digest(code)
+            and recorded["hissp"] == version()
+            and recorded["options"] == options
+            and recorded["output"] == fingerprint(out)
+            and all(
+                fingerprint(file) == digest
+                for file, digest in recorded["macros"].values()
+            )
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+
+def record(out, code: str, options: Dict[str, Any], compiler: Compiler) -> None:
+    """Write the manifest of the output file, just built by the compiler."""
+    macros = {}
+    for name in {*COMPILER, *compiler.macro_modules} - {compiler.qualname}:
+        file = getattr(sys.modules.get(name), "__file__", None)
+        if name != "__main__" and file:
+            macros[name] = file, fingerprint(file)
+    path = manifest(out)
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(
+        json.dumps(
+            dict(
+                source=_digest(code),
+                hissp=version(),
+                options=options,
+                output=fingerprint(out),
+                macros=macros,
+            ),
+            indent=1,
+            sort_keys=True,
+        )
+    )
+
+
+def _digest(code: str) -> str:
+    return hashlib.sha256(code.encode("utf8")).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Transpile all Lissp modules of the packages, in parallel."
+    )
+    parser.add_argument("packages", nargs="+", metavar="package")
+    parser.add_argument("--workers", type=int, help="Number of processes.")
+    parser.add_argument("--fold", action="store_true", help="Fold constants.")
+    parser.add_argument("--compact", action="store_true", help="Compact output.")
+    parser.add_argument(
+        "--incremental", action="store_true", help="Skip unchanged modules."
+    )
+    args = parser.parse_args()
+    build(
+        *args.packages,
+        workers=args.workers,
+        fold=args.fold,
+        compact=args.compact,
+        incremental=args.incremental,
+    )
+
+
+if __name__ == "__main__":
+    main()
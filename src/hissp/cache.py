@@ -0,0 +1,155 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+"""
+Code cache for Lissp scripts run by ``python -m hissp``.
+
+A script normally gets read, macroexpanded, compiled, and executed one
+top-level form at a time, on every run. `run` saves the code object of
+each form after a successful run, and the next run of the same script
+executes those instead, skipping the reader and compiler altogether.
+
+The cache is off unless ``$HISSP_CACHE_DIR`` names a directory for it,
+say ``~/.cache/hissp``. Like ``.pyc`` files, entries are not written
+when `sys.dont_write_bytecode` is set, but are still read.
+
+Entries are keyed by a hash of the script text and the Python bytecode
+version (and the names in the namespace it runs in, if one is given,
+like a `hissp.prelude` namespace). Macros defined earlier in the script
+are part of that text.
+Each entry also records the files of the Hissp compiler, and of every
+module that defined a macro or reader macro used while compiling the
+script, with a hash of each. So do the modules those refer to in their
+globals, transitively, like the helpers a macro calls (but not the
+standard library). A change to any of them invalidates the entry.
+
+A cache hit skips reading and expanding, so it skips their side
+effects too. A script that injects Python at read time (``.#``) is
+never cached. Like any Lisp compiler cache, this otherwise assumes that
+macros and reader macros are deterministic, given the same code and
+modules, and don't otherwise depend on files or the environment.
+Don't enable the cache for scripts whose macros do.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+from types import FunctionType, ModuleType
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import hissp.compiler
+import hissp.munger
+import hissp.reader
+from hissp.compiler import Compiler
+from hissp.reader import Lissp
+
+Forms = List[Tuple[str, object]]
+Fingerprints = Dict[str, Tuple[str, str]]
+
+# The compiler itself is an implicit dependency of every entry.
+COMPILER = hissp.compiler.__name__, hissp.reader.__name__, hissp.munger.__name__
+
+
+def cache_dir() -> Optional[Path]:
+    """The cache directory, or None if disabled."""
+    path = os.environ.get("HISSP_CACHE_DIR")
+    return Path(path) if path else None
+
+
+def entry(code: str, ns: Optional[dict] = None) -> Optional[Path]:
+    """The cache file for this script, or None if caching is disabled."""
+    directory = cache_dir()
+    if directory is None:
+        return None
+    if ns is not None:  # What the script may use unqualified.
+        names = sorted(ns)
+        if "_macro_" in ns:
+            names.extend(f"_macro_.{k}" for k in sorted(vars(ns["_macro_"])))
+        code = "\0".join([*names, code])
+    key = hashlib.sha256(MAGIC_NUMBER + code.encode("utf8")).hexdigest()
+    return directory / f"{key}.{sys.implementation.cache_tag}"
+
+
+def run(code: str, ns: Optional[dict] = None) -> None:
+    """Like ``Lissp(ns=ns, evaluate=True).compile(code)``, but cached."""
+    path = entry(code, ns)
+    forms = load(path) if path else None
+    if forms is not None:
+        return replay(forms, ns)
+    lissp = Lissp(ns=ns, evaluate=True)
+    lissp.compiler.executed = []
+    lissp.compile(code)
+    if path and not sys.dont_write_bytecode and not lissp.injected:
+        dump(path, lissp.compiler.executed, {*COMPILER, *lissp.compiler.macro_modules})
+
+
+def replay(forms: Forms, ns: Optional[dict] = None) -> None:
+    """Execute the cached forms like the compiler would have."""
+    compiler = Compiler(ns=ns, evaluate=True)
+    result: List[str] = []
+    for form, code in forms:
+        result.extend(compiler.eval(form, code))
+        if compiler.abort:
+            print("\n\n".join(result), file=sys.stderr)
+            sys.exit(1)
+
+
+def load(path: Path) -> Optional[Forms]:
+    """The cached forms, if their entry exists and is still valid."""
+    try:
+        fingerprints, forms = marshal.loads(path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if all(fingerprint(file) == digest for file, digest in fingerprints.values()):
+        return forms
+
+
+def dump(path: Path, forms: Forms, modules) -> None:
+    """Write a cache entry atomically."""
+    fingerprints: Fingerprints = {}
+    for name in dependencies(modules):
+        file = getattr(sys.modules.get(name), "__file__", None)
+        if name != "__main__" and file:
+            fingerprints[name] = file, fingerprint(file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_suffix(f".{os.getpid()}.tmp")
+    temp.write_bytes(marshal.dumps((fingerprints, forms)))
+    os.replace(temp, path)
+
+
+def dependencies(modules: Iterable[str]) -> Set[str]:
+    """
+    The named modules, and the modules their globals refer to,
+    transitively, except for the standard library.
+    """
+    import sysconfig
+
+    paths = sysconfig.get_paths()
+    stdlib = paths["stdlib"], paths["platstdlib"]
+    site = paths["purelib"], paths["platlib"]
+    found: Set[str] = set()
+    todo = [*modules]
+    while todo:
+        name = todo.pop()
+        file = getattr(sys.modules.get(name), "__file__", None)
+        if name in found or not file:
+            continue
+        if file.startswith(stdlib) and not file.startswith(site):
+            continue
+        found.add(name)
+        for value in vars(sys.modules[name]).values():
+            if type(value) is ModuleType:
+                todo.append(value.__name__)
+            elif isinstance(value, (type, FunctionType)):
+                todo.append(value.__module__)
+    return found
+
+
+def fingerprint(file: str) -> Optional[str]:
+    """Hash of the file's contents, or None if it can't be read."""
+    try:
+        return hashlib.sha256(Path(file).read_bytes()).hexdigest()
+    except OSError:
+        return None
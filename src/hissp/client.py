@@ -0,0 +1,109 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+"""
+Client of the Hissp compile server (`hissp.server`).
+
+Deliberately imports nothing from Hissp, so it starts about as fast as
+the interpreter does, and leaves the compiling to the warm server.
+
+From the command line::
+
+    $ python -m hissp.client compile < foo.lissp
+    $ python -m hissp.client transpile foo bar/baz
+"""
+
+import argparse
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+
+
+class ServerError(Exception):
+    """The server failed to handle a request. Has its traceback."""
+
+
+def default_path() -> str:
+    """
+    The socket path, from ``$HISSP_SOCKET``, or else ``hissp.sock`` in
+    ``$XDG_RUNTIME_DIR``, or else in a ``hissp-<uid>`` directory in the
+    temp directory. Unlike a file directly in the shared temp directory,
+    these can't be taken over by other users. See `private_dir`.
+    """
+    path = os.environ.get("HISSP_SOCKET")
+    if path:
+        return path
+    directory = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(
+        tempfile.gettempdir(), f"hissp-{os.getuid()}"
+    )
+    return os.path.join(directory, "hissp.sock")
+
+
+def private_dir(path: str) -> None:
+    """
+    Make the socket's directory, if need be, and check that it's a
+    directory owned by this user, which no one else may access.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    st = os.lstat(directory)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(f"{directory} must be a directory only you can access.")
+
+
+def request(path=None, **message):
+    """Send the message to the server and return its reply."""
+    if path is None:
+        path = default_path()
+        private_dir(path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(path)
+        s.sendall(json.dumps(message).encode("utf8") + b"\n")
+        with s.makefile("rb") as f:
+            reply = json.loads(f.readline())
+    if "error" in reply:
+        raise ServerError(reply["error"])
+    return reply
+
+
+def compile(code: str, path=None, **options) -> str:
+    """Compile Lissp code to Python, like `Lissp.compile`."""
+    return request(path, op="compile", code=code, **options)["python"]
+
+
+def transpile(package, *modules, path=None, **options) -> None:
+    """Like `hissp.reader.transpile`, but done by the server."""
+    if not package:  # The server has its own working directory.
+        modules = tuple(os.path.abspath(m) for m in modules)
+    request(path, op="transpile", package=package, modules=modules, **options)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile with a Hissp server.")
+    parser.add_argument("--socket", help="Server socket path.")
+    parser.add_argument("--fold", action="store_true", help="Fold constants.")
+    parser.add_argument("--compact", action="store_true", help="Compact output.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("compile", help="Compile stdin to stdout.")
+    _transpile = commands.add_parser("transpile", help="Transpile modules.")
+    _transpile.add_argument("--package", help="Package of the modules.")
+    _transpile.add_argument("modules", nargs="+")
+    commands.add_parser("stop", help="Shut down the server.")
+    args = parser.parse_args()
+    options = dict(fold=args.fold, compact=args.compact)
+    try:
+        if args.command == "compile":
+            print(compile(sys.stdin.read(), args.socket, **options))
+        elif args.command == "transpile":
+            transpile(args.package, *args.modules, path=args.socket, **options)
+        else:
+            request(args.socket, op="stop")
+    except ServerError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
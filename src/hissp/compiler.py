@@ -6,36 +6,88 @@ The Hissp data language compiler and associated helper functions.
 
 Includes the special context variable NS,
 which macros can use to get their expansion context.
+
+A `Compiler` keeps its error state to itself, and NS is set per thread
+(and per context), so separate compilers may work concurrently in
+separate threads, even on macros from the same modules.
 """
 
 import ast
 import builtins
-import pickle
-import pickletools
+import operator
 import re
 import sys
+from collections.abc import KeysView
 from contextlib import contextmanager, suppress
 from contextvars import ContextVar
 from functools import wraps
 from itertools import chain, takewhile
-from pprint import pformat
-from traceback import format_exc
-from types import ModuleType
-from typing import Iterable, List, Optional, Tuple, TypeVar
+from time import perf_counter
+from types import CodeType, ModuleType
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 from warnings import warn
 
+from hissp.munger import demunge
+
 PAIR_WORDS = {":*": "*", ":**": "**", ":?": ""}
 # Module Macro container
 MACROS = "_macro_"
 # Macro from foreign module foo.bar.._macro_.baz
 MACRO = f"..{MACROS}."
 RE_MACRO = re.compile(rf"(\.\.{MACROS}\.|\.\.xAUTO_\.)")
+# Head of hissp.basic's if-else expansion: (IF_ELSE test (lambda () then) (lambda () else))
+IF_ELSE = (
+    "lambda",
+    ("test", ":", ":*", "thenxH_else"),
+    (("operator..getitem", "thenxH_else", ("operator..not_", "test")),),
+)
+RE_GENSYM = re.compile(r"xAUTO\d+_(\d+_)?$")
+# Marks the end of the forms in compile_iter.
+_END = object()
+# Pure functions the compiler may call on literals when folding constants.
+FOLDABLE = {
+    **{
+        f"operator..{name}": getattr(operator, name)
+        for name in """
+        abs add and_ concat contains countOf eq floordiv ge getitem gt index
+        indexOf inv invert le lshift lt mod mul ne neg not_ or_ pos rshift sub
+        truediv truth xor
+        """.split()
+    },
+    **{
+        f"builtins..{name}": getattr(builtins, name)
+        for name in """
+        abs all any ascii bin bool chr divmod float frozenset hex int len max
+        min oct ord repr round sorted str sum tuple
+        """.split()
+    },
+}
+# Pure methods of literals the compiler may call when folding constants.
+FOLDABLE_METHODS = {
+    str: {*"""
+        capitalize casefold center count encode endswith find index join
+        ljust lower lstrip partition replace rfind rindex rjust rpartition
+        rsplit rstrip split splitlines startswith strip swapcase title upper
+        zfill
+        """.split()},
+    bytes: {*"""
+        count decode endswith find hex index join lower lstrip partition
+        replace rfind rindex rsplit rstrip split splitlines startswith strip
+        upper
+        """.split()},
+}
+# Limits on folded results, as in CPython's AST optimizer. Bigger ones
+# are left for run time, so they can't bloat the output or hang the compiler.
+MAX_FOLD_BITS = 128  # Of ints.
+MAX_FOLD_LEN = 4096  # Of strings, bytes and collections.
 
 # Sometimes macros need the current ns when expanding,
 # instead of its defining ns.
 # Rather than pass in an implicit argument, it's available here.
 # readerless() uses this automatically.
 NS = ContextVar("NS", default=())
+# Whether the macro being expanded is a top-level form (or expands from one).
+_TOP_LEVEL = ContextVar("_TOP_LEVEL", default=False)
 
 
 class CompileError(SyntaxError):
@@ -52,6 +104,8 @@ def _trace(method):
             message = f"\nCompiler.{method.__name__}() {type(e).__name__}:\n {e}".replace(
                 "\n", "\n# "
             )
+            from pprint import pformat
+
             return f"(>   >  > >>{pformat(expr)}<< <  <   <){message}"
 
     return tracer
@@ -61,13 +115,334 @@ class PostCompileWarning(Warning):
     pass
 
 
+class MacroStats:
+    """Expansion statistics of one macro. See `Compiler.macro_stats`."""
+
+    __slots__ = "calls", "time", "depth", "size_in", "size_out"
+
+    def __init__(self):
+        self.calls = 0  # Number of expansions.
+        self.time = 0.0  # Cumulative seconds spent in the macro function.
+        self.depth = 0  # Deepest nesting of expansions it was called in.
+        self.size_in = 0  # Cumulative size of the invocation forms.
+        self.size_out = 0  # Cumulative size of the expansions.
+
+    def __repr__(self):
+        return "MacroStats({})".format(
+            ", ".join(f"{k}={getattr(self, k)!r}" for k in self.__slots__)
+        )
+
+
+class PhaseStats:
+    """Statistics of one compile phase. See `Profile`."""
+
+    __slots__ = "calls", "time", "peak"
+
+    def __init__(self):
+        self.calls = 0  # Number of times the phase was entered.
+        self.time = 0.0  # Seconds in the phase, excluding phases nested in it.
+        self.peak = 0  # Most bytes allocated above the phase's start (if traced).
+
+    def __repr__(self):
+        return "PhaseStats({})".format(
+            ", ".join(f"{k}={getattr(self, k)!r}" for k in self.__slots__)
+        )
+
+    def add(self, other: "PhaseStats"):
+        self.calls += other.calls
+        self.time += other.time
+        self.peak = max(self.peak, other.peak)
+
+
+class Profile:
+    """
+    Time (and optionally memory) of each compile phase, per module and
+    per top-level form.
+
+    The phases are ``lex`` (the `hissp.reader.Lexer`), ``parse`` (the
+    rest of reading), ``expand`` (macro functions), ``emit`` (the rest
+    of compiling) and ``exec`` (compiling the Python and executing it).
+    They interleave, so each is timed exclusive of the others nested in
+    it. E.g. a module imported by ``exec`` counts as that module's
+    phases, not as the importer's ``exec``.
+
+    With ``memory``, `tracemalloc` measures the peak allocation of each
+    phase too, which slows everything down considerably.
+
+    Set `Compiler.profile` to record one compiler, or use `profiling`
+    to record all compilers created in the context.
+    """
+
+    PHASES = "lex", "parse", "expand", "emit", "exec"
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        # Phase stats of each top-level form, by module qualname.
+        self.modules: Dict[str, List[Dict[str, PhaseStats]]] = {}
+        self.current: Dict[str, PhaseStats] = {}
+        self._stack: List[list] = []  # [stats, start time, start memory]
+
+    def form(self, qualname: str) -> Dict[str, PhaseStats]:
+        """Start recording a new top-level form of the module."""
+        self.current = {}
+        self.modules.setdefault(qualname, []).append(self.current)
+        return self.current
+
+    @contextmanager
+    def phase(self, name: str):
+        """Record the phase for the current form, pausing the enclosing one."""
+        stats = self.current.get(name) or self.current.setdefault(name, PhaseStats())
+        if self._stack:
+            self._checkpoint(self._stack[-1])
+        frame = [stats, perf_counter(), self._traced()]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            self._checkpoint(frame)
+            stats.calls += 1
+            if self._stack:
+                self._stack[-1][1] = perf_counter()
+
+    def timed(self, name: str, iterator: Iterator) -> Iterator:
+        """Record each step of the iterator as the phase."""
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def _traced(self) -> int:
+        if self.memory:
+            import tracemalloc
+
+            return tracemalloc.get_traced_memory()[0]
+        return 0
+
+    def _checkpoint(self, frame):
+        stats, start, memory = frame
+        stats.time += perf_counter() - start
+        if self.memory:
+            import tracemalloc
+
+            stats.peak = max(stats.peak, tracemalloc.get_traced_memory()[1] - memory)
+            tracemalloc.reset_peak()
+
+    def totals(self, qualname: str) -> Dict[str, PhaseStats]:
+        """Phase stats of the whole module."""
+        totals: Dict[str, PhaseStats] = {}
+        for form in self.modules[qualname]:
+            for name, stats in form.items():
+                totals.setdefault(name, PhaseStats()).add(stats)
+        return totals
+
+    def to_json(self) -> dict:
+        """The stats as JSON-compatible data. Times are in seconds."""
+
+        def phases(stats: Dict[str, PhaseStats]):
+            return {
+                name: {k: getattr(stats[name], k) for k in PhaseStats.__slots__}
+                for name in self.PHASES
+                if name in stats
+            }
+
+        return dict(
+            memory=self.memory,
+            modules={
+                qualname: dict(
+                    total=phases(self.totals(qualname)),
+                    forms=[*map(phases, forms)],
+                )
+                for qualname, forms in self.modules.items()
+            },
+        )
+
+
+# Compilers created in a `profiling` context record into its Profile.
+PROFILE: ContextVar[Optional[Profile]] = ContextVar("PROFILE", default=None)
+
+
+@contextmanager
+def profiling(memory=False) -> Iterator[Profile]:
+    """Profile every compiler created in the context. See `Profile`.
+
+    >>> with profiling() as profile:
+    ...     _ = readerless(('print', 1))
+    >>> [*profile.to_json()["modules"]["__main__"]["total"]]
+    ['emit', 'exec']
+    """
+    profile = Profile(memory)
+    started = False
+    if memory:
+        import tracemalloc
+
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+    token = PROFILE.set(profile)
+    try:
+        yield profile
+    finally:
+        PROFILE.reset(token)
+        if started:
+            tracemalloc.stop()
+
+
+class LazyMacros:
+    """
+    A ``_macro_`` namespace that builds each macro on first use.
+
+    When a module's ``_macro_`` is one of these, ``defmacro`` compiles
+    the macro function to Python source at compile time, and saves
+    that with `defer`. Importing the module then only stores strings.
+    Getting the attribute compiles and evaluates the function (in the
+    module's globals) and keeps it. Looking it up in ``vars()``
+    does the same, so the compiler sees deferred macros too.
+    Deferred names are in ``vars()`` and `dir`, and copying or iterating
+    over the items of ``vars()`` builds them all, so the usual
+    ``SimpleNamespace(**vars(_macro_))`` copy keeps every macro.
+
+    Only top-level ``defmacro`` forms are deferred, since the deferred
+    function can't close over locals. Others register eagerly.
+
+    >>> _macro_ = LazyMacros()
+    >>> _macro_.defer('twice', 'lambda x: x * 2', {}, 'Doubles.')
+    >>> 'twice' in vars(_macro_), dir(_macro_), vars(_macro_).deferred.keys()
+    (True, ['twice'], dict_keys(['twice']))
+    >>> _macro_.twice(21), _macro_.twice.__doc__, _macro_.twice.__qualname__
+    (42, 'Doubles.', '_macro_.twice')
+    >>> vars(_macro_)['twice'] is _macro_.twice
+    True
+    >>> _macro_.defer('half', 'lambda x: x // 2', {})
+    >>> from types import SimpleNamespace
+    >>> SimpleNamespace(**vars(_macro_)).half(42)
+    21
+    """
+
+    class _Namespace(dict):
+        """The built macros, plus the deferred ones as missing keys."""
+
+        def __init__(self):
+            super().__init__()
+            self.deferred: Dict[str, Tuple[str, dict, Optional[str]]] = {}
+
+        def __setitem__(self, name, value):
+            self.deferred.pop(name, None)  # Replaced, so never to be built.
+            super().__setitem__(name, value)
+
+        def __contains__(self, name):
+            return super().__contains__(name) or name in self.deferred
+
+        def __iter__(self):
+            return iter([*super().keys(), *self.deferred])
+
+        def __len__(self):
+            return super().__len__() + len(self.deferred)
+
+        def __eq__(self, other):
+            self.build()
+            return super().__eq__(other)
+
+        __hash__ = None  # type: ignore
+
+        def __repr__(self):
+            self.build()
+            return super().__repr__()
+
+        def keys(self):
+            return KeysView(self)  # Names only. Getting each builds it.
+
+        def items(self):
+            self.build()
+            return super().items()
+
+        def values(self):
+            self.build()
+            return super().values()
+
+        def copy(self):
+            self.build()
+            return dict(super().items())
+
+        def get(self, name, default=None):
+            return self[name] if name in self else default
+
+        def build(self):
+            """Build all the deferred macros."""
+            for name in [*self.deferred]:
+                self[name]
+
+        def __missing__(self, name):
+            try:
+                source, globals_, doc = self.deferred.pop(name)
+            except KeyError:
+                raise KeyError(name) from None
+            macro = eval(compile(source, f"<{MACROS}.{name}>", "eval"), globals_)
+            macro.__qualname__ = f"{MACROS}.{name}"
+            if doc is not None:
+                macro.__doc__ = doc
+            self[name] = macro
+            return macro
+
+    def __init__(self):
+        object.__setattr__(self, "__dict__", self._Namespace())
+
+    def __getattr__(self, name):  # Only if not built (or not there) yet.
+        try:
+            return vars(self)[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        vars(self)[name] = value  # Not the dict's own slot, to drop any deferred one.
+
+    def __dir__(self):
+        return sorted(vars(self))
+
+    def defer(self, name: str, source: str, globals_: dict, doc=None):
+        """Save the macro function's Python expression, to build later."""
+        vars(self).pop(name, None)
+        vars(self).deferred[name] = source, globals_, doc
+
+    @staticmethod
+    def targeted() -> bool:
+        """
+        Whether to defer: the ``_macro_`` of the current `NS` is lazy,
+        and the macro being expanded is at the top level.
+        """
+        return _TOP_LEVEL.get() and isinstance((NS.get() or {}).get(MACROS), LazyMacros)
+
+    @staticmethod
+    def compile(form) -> str:
+        """Compile the macro function form, in the current `NS`."""
+        ns = NS.get()
+        return Compiler(ns["__name__"], ns, evaluate=False).compile([form])
+
+
 class Compiler:
     """
     The Hissp compiler.
 
     Translates the Hissp data language into a functional subset of Python.
+
+    With ``fold``, calls of pure functions on literals are evaluated at
+    compile time (see `constant`). With ``compact``, the output omits
+    the pretty-printed layout and macro comments, but is otherwise the
+    same code. Injected Python text is emitted as-is either way.
+
+    Set `macro_stats` to a dict to record `MacroStats` per macro,
+    and the ``max_expansion_*`` limits to guard against runaway macros.
+    Sizes count the atoms and tuples in a form.
+    Set `profile` to a `Profile` to record the time of each phase.
     """
 
+    # Limits for any single macro expansion. None for no limit.
+    max_expansion_size: Optional[int] = None
+    max_expansion_depth: Optional[int] = None
+
     @staticmethod
     def new_ns(name, doc=None, package=None):
         mod = ModuleType(name, doc)
@@ -76,32 +451,115 @@ class Compiler:
         mod.__builtins__ = builtins
         return vars(mod)
 
-    def __init__(self, qualname="__main__", ns=None, evaluate=True):
+    def __init__(
+        self, qualname="__main__", ns=None, evaluate=True, fold=False, compact=False
+    ):
         self.qualname = qualname
         self.ns = self.new_ns(qualname) if ns is None else ns
         self.evaluate = evaluate
+        self.fold = fold
+        self.compact = compact
+        # Names of the modules defining the macros used so far.
+        self.macro_modules: Set[Optional[str]] = set()
+        # If a list, eval() appends each (form, code object) it executes.
+        self.executed: Optional[List[Tuple[str, CodeType]]] = None
+        # If set, eval() lets exceptions propagate, instead of warning.
+        self.raise_errors = False
+        # If a dict, expand() records statistics by macro name.
+        self.macro_stats: Optional[Dict[str, MacroStats]] = None
+        # If a Profile, records the time of each compile phase.
+        self.profile: Optional[Profile] = PROFILE.get()
+        self.expansion_depth = 0
+        # The form compiled at the top level (or its expansion), if any.
+        self.top_level: object = _END
         self.error = False
         self.abort = False
 
     def compile(self, forms: Iterable) -> str:
+        """
+        Compile (and evaluate, if on) each form in turn.
+
+        Reentrant: a macro may call this on its own compiler,
+        even after a sibling form failed to compile.
+        """
         result: List[str] = []
-        for form in forms:
+        for python in self._compile_iter(forms, result):
+            result.append(python)
+        return ("\n" if self.compact else "\n\n").join(result)
+
+    def compile_iter(self, forms: Iterable) -> Iterator[str]:
+        """
+        Like `compile`, but lazily yields each compiled form in turn.
+
+        Each form is evaluated (if on) before it is yielded. Separate
+        them with a blank line (or just a newline, if compact).
+        If ``__main__`` aborts, only the failed form is printed, since
+        the rest were already yielded.
+        """
+        return self._compile_iter(forms, [])
+
+    def _compile_iter(self, forms: Iterable, done: List[str]) -> Iterator[str]:
+        """Yields each compiled form. An abort prints the done ones too."""
+        outer_error, self.error = self.error, False
+        forms = iter(forms)
+        try:
+            while (result := self._compile_next(forms)) is not None:
+                if self.abort:
+                    print("\n\n".join([*done, *result]), file=sys.stderr)
+                    sys.exit(1)
+                yield from result
+        finally:
+            self.error = outer_error
+
+    def _compile_next(self, forms: Iterator) -> Optional[Tuple[str, ...]]:
+        """Compile and evaluate the next form. None if there are no more."""
+        profile = self.profile
+        if profile is None:
+            form = next(forms, _END)
+            return None if form is _END else self.eval(self._emit(form))
+        outer = profile.current
+        record = profile.form(self.qualname)
+        try:
+            form = next(forms, _END)  # Readers profile themselves.
+            if form is _END:
+                profile.modules[self.qualname].remove(record)
+                return None
+            with profile.phase("emit"):
+                form = self._emit(form)
+            with profile.phase("exec"):
+                return self.eval(form)
+        finally:
+            profile.current = outer
+
+    def _emit(self, form) -> str:
+        outer, self.top_level = self.top_level, form
+        try:
             form = self.form(form)
-            if self.error:
-                e = self.error
-                self.error = False
-                raise CompileError("\n" + form) from e
-            result.extend(self.eval(form))
-            if self.abort:
-                print("\n\n".join(result), file=sys.stderr)
-                sys.exit(1)
-        return "\n\n".join(result)
-
-    def eval(self, form) -> Tuple[str, ...]:
+        finally:
+            self.top_level = outer
+        if self.error:
+            raise CompileError("\n" + form) from self.error
+        return form
+
+    def eval(self, form, code: Optional[CodeType] = None) -> Tuple[str, ...]:
+        """
+        Execute the compiled form, unless evaluate is off.
+
+        Compiles the form first, unless its code object is provided.
+        Returns the form, plus a traceback comment if it raised
+        (or lets the exception propagate, if `raise_errors` is set).
+        """
         try:
             if self.evaluate:
-                exec(compile(form, "<Hissp>", "exec"), self.ns)
+                code = code or compile(form, "<Hissp>", "exec")
+                if self.executed is not None:
+                    self.executed.append((form, code))
+                exec(code, self.ns)
         except Exception as e:
+            if self.raise_errors:
+                raise
+            from traceback import format_exc
+
             exc = format_exc()
             if self.ns.get("__name__") == "__main__":
                 self.abort = True
@@ -129,8 +587,52 @@ class Compiler:
         head, *tail = form
         if type(head) is str:
             return self.special(form)
+        if (result := self.conditional(form)) is not None:
+            return result
         return self.call(form)
 
+    @_trace
+    def conditional(self, form: Tuple) -> Optional[str]:
+        r"""
+        Try to compile as native conditional or boolean expression.
+
+        The ``if-else``, ``&&``, and ``||`` macros in `hissp.basic` expand
+        to lambdas, which work without any help from the compiler. But
+        their expansions have a known shape, which compiles to the
+        equivalent (and much faster) Python expression instead:
+
+        >>> print(readerless(
+        ... (IF_ELSE, 'x', ('lambda',(),1,), ('lambda',(),('print','x',),),),
+        ... ))
+        ((1)
+         if x
+         else print(
+            x))
+
+        ``&&`` and ``||`` bind their first argument to a gensym,
+        which is then used as the test and one of the branches.
+
+        >>> readerless(
+        ... (('lambda',(':','_GxAUTO7_','x',),
+        ...   (IF_ELSE,'_GxAUTO7_',('lambda',(),'y',),('lambda',(),'_GxAUTO7_',),),),),
+        ... )
+        '(x and y)'
+        >>> readerless(
+        ... (('lambda',(':','_GxAUTO7_','x',),
+        ...   (IF_ELSE,'_GxAUTO7_',('lambda',(),'_GxAUTO7_',),('lambda',(),'y',),),),),
+        ... )
+        '(x or y)'
+
+        Evaluation order and short-circuiting are the same either way.
+        Returns None for any other form.
+        """
+        if (branches := _if_else(form)) is not None:
+            test, then, otherwise = map(self.form, branches)
+            return self._operation(then, f"if {test}", f"else {otherwise}")
+        if (boolean := _boolean(form)) is not None:
+            operator, left, right = boolean
+            return self._operation(self.form(left), f"{operator} {self.form(right)}")
+
     @_trace
     def special(self, form: Tuple) -> str:
         """Try to compile as special form, else self.invocation()."""
@@ -144,7 +646,7 @@ class Compiler:
     def invocation(self, form: Tuple) -> str:
         """Try to compile as macro, else normal call."""
         if result := self.macro(form):
-            return f"# {form[0]}\n{result}"
+            return result if self.compact else f"# {form[0]}\n{result}"
         form = form[0].replace("..xAUTO_.", "..", 1), *form[1:]
         return self.call(form)
 
@@ -152,8 +654,50 @@ class Compiler:
     def macro(self, form: Tuple) -> Optional[str]:
         head, *tail = form
         if (macro := self._get_macro(head)) is not None:
-            with self.macro_context():
-                return self.form(macro(*tail))
+            self.macro_modules.add(getattr(macro, "__module__", None))
+            top_level = form is self.top_level
+            with self.macro_context(top_level):
+                expansion = self.expand(macro, form)
+                if top_level:
+                    self.top_level = expansion
+                return self.form(expansion)
+
+    def expand(self, macro, form: Tuple):
+        """Call the macro on the invocation's arguments, with stats and limits."""
+        name = _macro_name(macro) or form[0].replace("..xAUTO_.", MACRO, 1)
+        depth = self.expansion_depth
+        if self.max_expansion_depth is not None and depth > self.max_expansion_depth:
+            raise CompileError(
+                f"Expansion of {name} is nested {depth} deep,"
+                f" over the limit of {self.max_expansion_depth}."
+            )
+        if (
+            self.macro_stats is None
+            and self.max_expansion_size is None
+            and self.profile is None
+        ):
+            return macro(*form[1:])
+        start = perf_counter()
+        if self.profile is None:
+            expansion = macro(*form[1:])
+        else:
+            with self.profile.phase("expand"):
+                expansion = macro(*form[1:])
+        elapsed = perf_counter() - start
+        size = _size(expansion)
+        if self.max_expansion_size is not None and size > self.max_expansion_size:
+            raise CompileError(
+                f"Expansion of {name} has size {size},"
+                f" over the limit of {self.max_expansion_size}."
+            )
+        if self.macro_stats is not None:
+            stats = self.macro_stats.setdefault(name, MacroStats())
+            stats.calls += 1
+            stats.time += elapsed
+            stats.depth = max(stats.depth, depth)
+            stats.size_in += _size(form)
+            stats.size_out += size
+        return expansion
 
     def _get_macro(self, head):
         parts = RE_MACRO.split(head, 1)
@@ -209,10 +753,14 @@ class Compiler:
         case = type(form)
         if case in {int, float, complex}:  # Number literals may need (). E.g. (1).real
             literal = f"({form!r})"
-        elif case in {dict, list, set, tuple, str, bytes}:  # Pretty print collections.
-            literal = pformat(form, sort_dicts=False)
         else:
             literal = repr(form)
+            # Pretty print collections, unless they'd fit on a line anyway.
+            if case in {dict, list, set, tuple, str, bytes} and not self.compact:
+                if len(literal) > 80:
+                    from pprint import pformat
+
+                    literal = pformat(form, sort_dicts=False)
 
         with suppress(ValueError, SyntaxError):
             if ast.literal_eval(literal) == form:
@@ -223,11 +771,16 @@ class Compiler:
     @_trace
     def pickle(self, form) -> str:
         """The final fallback for self.quoted()."""
+        import pickle
+        import pickletools
+
         try:  # Try the more human-readable and backwards-compatible text protocol first.
             dumps = pickle.dumps(form, 0)
         except pickle.PicklingError:  # Fall back to the highest binary protocol if that didn't work.
             dumps = pickle.dumps(form, pickle.HIGHEST_PROTOCOL)
         dumps = pickletools.optimize(dumps)
+        if self.compact:
+            return f"__import__('pickle').loads({dumps!r})"
         return f"__import__('pickle').loads(  # {form!r}\n    {dumps!r}\n)"
 
     @_trace
@@ -320,10 +873,12 @@ class Compiler:
     @_trace
     def body(self, body: list) -> str:
         if len(body) > 1:
-            return f"({_join_args(*map(self.form, body))})[-1]"
+            return f"({self._join_args(*map(self.form, body))})[-1]"
         if not body:
             return "()"
         result = self.form(body[0])
+        if self.compact:
+            return result
         return ("\n" * ("\n" in result) + result).replace("\n", "\n  ")
 
     @_trace
@@ -400,6 +955,8 @@ class Compiler:
         'foo'
 
         """
+        if self.fold and (folded := self.constant(form)) is not None:
+            return folded
         form = iter(form)
         head = next(form)
         args = chain(
@@ -407,8 +964,45 @@ class Compiler:
             (f"{(PAIR_WORDS.get(k, k+'='))}{self.form(v)}" for k, v in _pairs(form)),
         )
         if type(head) is str and head.startswith("."):
-            return "{}.{}({})".format(next(args), head[1:], _join_args(*args))
-        return "{}({})".format(self.form(head), _join_args(*args))
+            return "{}.{}({})".format(next(args), head[1:], self._join_args(*args))
+        return "{}({})".format(self.form(head), self._join_args(*args))
+
+    @_trace
+    def constant(self, form: Tuple) -> Optional[str]:
+        r"""
+        Try to fold a call of pure functions on literals into a literal.
+
+        Only used when the fold option is set. Calls of `FOLDABLE`
+        functions (and of `FOLDABLE_METHODS` on literals) are evaluated
+        at compile time when every argument is a literal or another
+        foldable call. The result is then emitted by `quoted`.
+
+        >>> Compiler(evaluate=False, fold=True).compile([
+        ... ('operator..add',1,('operator..mul',2,3,),),
+        ... ('operator..getitem',('quote',('a','b',),),0,),
+        ... ('.join',('quote',', ',),('quote',('a','b',),),),
+        ... ])
+        "(7)\n\n'a'\n\n'a, b'"
+
+        Calls that raise, that aren't known to be pure, whose results
+        would exceed `MAX_FOLD_BITS` or `MAX_FOLD_LEN`, or whose results
+        have no literal (which would need a pickle), are left for run
+        time:
+
+        >>> print(Compiler(evaluate=False, fold=True).compile([
+        ... ('operator..truediv',1,0,),
+        ... ]))
+        __import__('operator').truediv(
+          (1),
+          (0))
+
+        Returns None if the form can't be folded.
+        """
+        try:
+            result = _constant(form)
+        except _NotConstant:
+            return None
+        return self.quoted(result) if _literal(result) else None
 
     @_trace
     def symbol(self, symbol: str) -> str:
@@ -429,12 +1023,22 @@ class Compiler:
             return f"""__import__({module !r}{",fromlist='?'" if "." in module else ""})"""
         return symbol
 
+    def _join_args(self, *args):
+        return ",".join(args) if self.compact else _join_args(*args)
+
+    def _operation(self, *parts):
+        return "({})".format(" ".join(parts)) if self.compact else _operation(*parts)
+
     @contextmanager
-    def macro_context(self):
+    def macro_context(self, top_level=False):
         token = NS.set(self.ns)
+        top_token = _TOP_LEVEL.set(top_level)
+        self.expansion_depth += 1
         try:
             yield
         finally:
+            self.expansion_depth -= 1
+            _TOP_LEVEL.reset(top_token)
             NS.reset(token)
 
 
@@ -442,6 +1046,153 @@ def _join_args(*args):
     return (("\n" if args else "") + ",\n".join(args)).replace("\n", "\n  ")
 
 
+def _operation(*parts):
+    if any("\n" in part for part in parts):
+        return "({})".format("\n ".join(part.replace("\n", "\n  ") for part in parts))
+    return "({})".format(" ".join(parts))
+
+
+def _if_else(form: Tuple) -> Optional[Tuple[object, object, object]]:
+    """The (test, then, otherwise) of an if-else expansion, else None."""
+    if len(form) == 4 and form[0] == IF_ELSE and _thunk(form[2]) and _thunk(form[3]):
+        return form[1], form[2][2], form[3][2]
+
+
+def _thunk(form) -> bool:
+    return type(form) is tuple and len(form) == 3 and form[:2] == ("lambda", ())
+
+
+def _boolean(form: Tuple) -> Optional[Tuple[str, object, object]]:
+    """The (operator, left, right) of an && or || expansion, else None."""
+    if len(form) != 1 or not _let1(form[0]):
+        return None
+    _, (_, gensym, left), body = form[0]
+    if type(body) is not tuple or (branches := _if_else(body)) is None:
+        return None
+    test, then, otherwise = branches
+    if test != gensym:
+        return None
+    if otherwise == gensym:
+        return "and", left, then
+    if then == gensym:
+        return "or", left, otherwise
+
+
+def _let1(form) -> bool:
+    """Is form a lambda of one body form and one gensym with a default?"""
+    return (
+        type(form) is tuple
+        and len(form) == 3
+        and form[0] == "lambda"
+        and type(form[1]) is tuple
+        and len(form[1]) == 3
+        and form[1][0] == ":"
+        and type(form[1][1]) is str
+        and bool(RE_GENSYM.search(form[1][1]))
+        and form[1][2] != ":?"
+    )
+
+
+def _macro_name(macro) -> Optional[str]:
+    """Qualified name of a macro function, however it was invoked."""
+    module = getattr(macro, "__module__", None)
+    qualname = getattr(macro, "__qualname__", None)
+    if type(module) is str and type(qualname) is str and "<" not in qualname:
+        return f"{module}..{qualname}"
+
+
+def _size(form) -> int:
+    """Count the atoms and tuples in the form."""
+    size, stack = 0, [form]
+    while stack:
+        form = stack.pop()
+        size += 1
+        if type(form) is tuple:
+            stack.extend(form)
+    return size
+
+
+def format_macro_stats(stats: Dict[str, MacroStats]) -> str:
+    """Tabulate macro stats, most expensive first."""
+    lines = [f"{'calls':>7} {'ms':>9} {'depth':>5} {'size in':>9} {'size out':>9}  macro"]
+    for name, s in sorted(stats.items(), key=lambda kv: -kv[1].time):
+        lines.append(
+            f"{s.calls:7} {s.time*1000:9.2f} {s.depth:5} {s.size_in:9} {s.size_out:9}"
+            f"  {demunge(name)}"
+        )
+    return "\n".join(lines)
+
+
+class _NotConstant(Exception):
+    pass
+
+
+def _constant(form):
+    """Evaluate a form made only of literals and foldable calls."""
+    if type(form) is tuple and form:
+        head, *args = form
+        if head == "quote":
+            return args[0]
+        if type(head) is not str or any(type(a) is str and a == ":" for a in args):
+            raise _NotConstant
+        args = [*map(_constant, args)]
+        if not _fold_fits(head, args):
+            raise _NotConstant
+        if head.startswith("."):
+            if not args or head[1:] not in FOLDABLE_METHODS.get(type(args[0]), ()):
+                raise _NotConstant
+            function = getattr(args.pop(0), head[1:])
+        elif head in FOLDABLE:
+            function = FOLDABLE[head]
+        else:
+            raise _NotConstant
+        try:
+            result = function(*args)
+        except Exception as e:
+            raise _NotConstant from e
+        if not _fold_fits("", [result]):
+            raise _NotConstant
+        return result
+    if type(form) is str and not form.startswith(":"):
+        raise _NotConstant  # Symbols aren't literals.
+    return form
+
+
+def _literal(value) -> bool:
+    """Whether the value's repr is a literal evaluating to an equal value."""
+    try:
+        return ast.literal_eval(repr(value)) == value
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return False
+
+
+def _fold_fits(head, args) -> bool:
+    """Check the call's arguments, and its result's size, are within the fold limits."""
+    for arg in args:
+        if type(arg) is int and arg.bit_length() > MAX_FOLD_BITS:
+            return False
+        if type(arg) in {str, bytes, tuple, list, set, frozenset, dict}:
+            if len(arg) > MAX_FOLD_LEN:
+                return False
+    if head in {"operator..mul", "operator..lshift"} and len(args) == 2:
+        a, b = args
+        if type(b) is not int:
+            a, b = b, a
+        if type(b) is not int:
+            return True
+        if type(a) is int:
+            if head.endswith("mul"):
+                return a.bit_length() + b.bit_length() <= MAX_FOLD_BITS
+            return b <= MAX_FOLD_BITS - a.bit_length()
+        return type(a) not in {str, bytes, tuple, list} or len(a) * b <= MAX_FOLD_LEN
+    if head in {".center", ".ljust", ".rjust", ".zfill"} and len(args) > 1:
+        return type(args[1]) is not int or args[1] <= MAX_FOLD_LEN
+    if head == ".replace" and len(args) > 2 and type(args[0]) is type(args[1]):
+        count = args[0].count(args[1])
+        return len(args[0]) + count * len(args[2]) <= MAX_FOLD_LEN
+    return True
+
+
 T = TypeVar("T")
 
 
@@ -0,0 +1,169 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+"""
+Import hook for Lissp modules.
+
+After `install`, ``import foo`` finds ``foo.lissp`` (or
+``foo/__init__.lissp``) on the path and compiles it on the fly, without
+a transpiled ``foo.py``. The hook is a `sys.path_hooks` `FileFinder`,
+so path entries are searched in the usual order. Within a directory,
+a ``.lissp`` file takes precedence over a ``.py`` file of the same
+module, so a stale one can't shadow it.
+
+Like ``.py`` files, compiled modules are cached in ``__pycache__``, as
+``foo.cpython-XY.lissp.pyc``, with source-hash invalidation (PEP 552).
+A warm import only hashes the source and unmarshals the code, like
+ordinary Python. As with transpiled ``.py`` files, a changed macro from
+another module doesn't invalidate the modules that used it.
+Use `hissp.build` for that.
+
+A module is evaluated as it is compiled, a form at a time, so its
+macros are available to its later forms. On a cold import, that's the
+only time it runs, in the module's own namespace. As with a Python
+module, an exception from any form fails the import, and nothing is
+cached.
+
+The module's code object is compiled from its generated Python, under
+the name ``foo.py`` (which isn't written to disk). The cache keeps a
+copy of the Python, registered with `linecache`, so tracebacks from a
+warm import show the right lines of it. (On a cold import, each form
+runs as soon as it's compiled, so tracebacks show ``<Hissp>``, like
+the REPL's.)
+"""
+
+import linecache
+import marshal
+import os
+import sys
+from contextlib import suppress
+from importlib.abc import FileLoader
+from importlib.machinery import (
+    BYTECODE_SUFFIXES,
+    EXTENSION_SUFFIXES,
+    SOURCE_SUFFIXES,
+    ExtensionFileLoader,
+    FileFinder,
+    SourceFileLoader,
+    SourcelessFileLoader,
+)
+from importlib.util import MAGIC_NUMBER, cache_from_source, source_hash
+from pathlib import Path
+from types import CodeType, ModuleType
+from typing import Callable, Dict, Optional, Tuple
+
+from hissp.compiler import Compiler
+from hissp.reader import Lissp
+
+SUFFIX = ".lissp"
+# Hash-based and checked. See PEP 552.
+FLAGS = 0b11
+
+
+class LisspLoader(FileLoader):
+    """Loads a Lissp module, from its cached bytecode if still valid."""
+
+    def exec_module(self, module: ModuleType) -> None:
+        source = self.get_data(self.path)
+        cached = self.cached(source)
+        if cached is None:
+            self.compile(source, vars(module))
+        else:
+            exec(self.register(*cached), vars(module))
+
+    def get_code(self, fullname: str) -> CodeType:
+        """
+        The module's code, for tools like `runpy`.
+
+        Compiling a module also runs it, so if the cache is cold, this
+        runs it in a namespace of its own. An import doesn't need this.
+        """
+        source = self.get_data(self.path)
+        cached = self.cached(source)
+        if cached is None:
+            ns = Compiler.new_ns(fullname)
+            ns["__file__"] = self.path
+            return self.compile(source, ns)
+        return self.register(*cached)
+
+    def get_source(self, fullname: str) -> str:
+        return self.get_data(self.path).decode("utf8")
+
+    def pyc(self) -> Path:
+        """The bytecode cache file of the module."""
+        return Path(cache_from_source(self.path)).with_suffix(f"{SUFFIX}.pyc")
+
+    def python_path(self) -> str:
+        """The file name of the module's compiled Python, for tracebacks."""
+        return self.path[: -len(SUFFIX)] + ".py"
+
+    def cached(self, source: bytes) -> Optional[Tuple[str, CodeType]]:
+        """The cached Python and code object, if compiled from this source."""
+        try:
+            data = self.pyc().read_bytes()
+        except OSError:
+            return None
+        header = MAGIC_NUMBER + FLAGS.to_bytes(4, "little") + source_hash(source)
+        if data[:16] == header:
+            with suppress(EOFError, ValueError, TypeError):
+                python, code = marshal.loads(data[16:])
+                return python, code
+        return None
+
+    def compile(self, source: bytes, ns: Dict) -> CodeType:
+        """
+        Compile (and evaluate) the Lissp source, and cache the code.
+
+        An exception from evaluating a form propagates.
+        """
+        code = source.decode("utf8")
+        if code.startswith("#!"):  # ignore shebang line
+            _, _, code = code.partition("\n")
+        lissp = Lissp(ns["__name__"], ns, evaluate=True, filename=self.path)
+        lissp.compiler.raise_errors = True
+        python = lissp.compile(code)
+        compiled = self.register(python, compile(python, self.python_path(), "exec"))
+        if not sys.dont_write_bytecode:
+            self.write(source, python, compiled)
+        return compiled
+
+    def register(self, python: str, code: CodeType) -> CodeType:
+        """Make the compiled Python available to tracebacks."""
+        path = self.python_path()
+        linecache.cache[path] = len(python), None, python.splitlines(True), path
+        return code
+
+    def write(self, source: bytes, python: str, code: CodeType) -> None:
+        pyc = self.pyc()
+        header = MAGIC_NUMBER + FLAGS.to_bytes(4, "little") + source_hash(source)
+        try:
+            pyc.parent.mkdir(exist_ok=True)
+            temp = pyc.with_suffix(f".{os.getpid()}.tmp")
+            temp.write_bytes(header + marshal.dumps((python, code)))
+            os.replace(temp, pyc)
+        except OSError:
+            pass  # Like Python, don't fail an import over a read-only cache.
+
+
+# The usual loaders of a path entry, but Lissp first.
+LOADERS = [
+    (LisspLoader, [SUFFIX]),
+    (ExtensionFileLoader, EXTENSION_SUFFIXES),
+    (SourceFileLoader, SOURCE_SUFFIXES),
+    (SourcelessFileLoader, BYTECODE_SUFFIXES),
+]
+path_hook = FileFinder.path_hook(*LOADERS)
+
+
+def install() -> Callable:
+    """Make Lissp modules importable. Idempotent. Returns the path hook."""
+    if path_hook not in sys.path_hooks:
+        sys.path_hooks.insert(0, path_hook)
+        sys.path_importer_cache.clear()  # Finders made without the hook.
+    return path_hook
+
+
+def uninstall() -> None:
+    """Undo `install`."""
+    if path_hook in sys.path_hooks:
+        sys.path_hooks.remove(path_hook)
+        sys.path_importer_cache.clear()
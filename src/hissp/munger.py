@@ -2,12 +2,17 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import re
+import sys
 from contextlib import suppress
-from typing import Dict, Hashable, Mapping, Match, TypeVar
+from functools import lru_cache
+from typing import Dict, Hashable, Iterable, Iterator, Mapping, Match, TextIO, TypeVar
 
 import unicodedata
 
 
+# Symbols repeat, so munge is memoized. The bound keeps a long-running
+# process that reads generated symbols from growing without limit.
+@lru_cache(maxsize=1 << 14)
 def munge(s: str) -> str:
     if s.startswith(":"):
         return s  # control word
@@ -15,7 +20,8 @@ def munge(s: str) -> str:
     # >>> 𝐀 = 'MATHEMATICAL BOLD CAPITAL A'
     # >>> 'A' in globals()
     # True
-    s = unicodedata.normalize("NFKC", s)
+    if not s.isascii():  # NFKC doesn't change ASCII.
+        s = unicodedata.normalize("NFKC", s)
     if s.isidentifier():
         return s  # Nothing to munge.
     return ".".join(munge_part(part) for part in s.split('.'))
@@ -23,7 +29,7 @@ def munge(s: str) -> str:
 
 def munge_part(part):
     if part:
-        part = "".join(map(x_quote, part))
+        part = part.translate(QUOTES)
         if not part.isidentifier():
             part = force_x_quote(part[0]) + part[1:]
             assert part.isidentifier(), f"{part!r} is not identifier"
@@ -83,6 +89,19 @@ def force_x_quote(c: str) -> str:
         return f"x{unicodedata.name(c).translate(X_NAME)}_"
     return f"x{ord(c)}_"
 
+
+class _Quotes(dict):
+    """Translation table of code points to their `x_quote`, filled on demand."""
+
+    def __missing__(self, key: int) -> str:
+        self[key] = quote = x_quote(chr(key))
+        return quote
+
+
+# For str.translate(). ASCII is precomputed.
+QUOTES: Dict[int, str] = _Quotes((c, x_quote(chr(c))) for c in range(128))
+
+
 K = TypeVar("K", bound=Hashable)
 V = TypeVar("V")
 
@@ -98,14 +117,115 @@ UN_X_NAME = reversed_1to1(X_NAME)
 
 
 def un_x_quote(match: Match[str]) -> str:
+    return UNQUOTES[match.group()]
+
+
+def _un_x_quote(quoted: str) -> str:
     with suppress(KeyError):
-        return LOOKUP_NAME[match.group()]
+        return LOOKUP_NAME[quoted]
+    name = quoted[1:-1]
     with suppress(KeyError):
-        return unicodedata.lookup(match.group(1).translate(UN_X_NAME))
-    with suppress(ValueError):
-        return chr(int(match.group(1)))
-    return match.group()
+        return unicodedata.lookup(name.translate(UN_X_NAME))
+    with suppress(ValueError, OverflowError):
+        return chr(int(name))
+    return quoted
+
+
+class _Unquotes(dict):
+    """Table of x-quotes to the text they stand for, filled on demand.
+
+    Stops growing at its limit, since demunged text is arbitrary.
+    """
+
+    limit = 1 << 14
+
+    def __missing__(self, key: str) -> str:
+        text = _un_x_quote(key)
+        if len(self) < self.limit:
+            self[key] = text
+        return text
+
+
+UNQUOTES: Dict[str, str] = _Unquotes(LOOKUP_NAME)
+# Splitting on a group alternates text with the x-quotes found in it.
+X_QUOTED = re.compile("(x[0-9A-Zhx]+?_)")
 
 
 def demunge(s: str) -> str:
-    return re.sub("x([0-9A-Zhx]+?)_", un_x_quote, s)
+    if "x" not in s:
+        return s
+    parts = X_QUOTED.split(s)
+    parts[1::2] = map(UNQUOTES.__getitem__, parts[1::2])
+    return "".join(parts)
+
+
+# Longest text held back at a chunk's end, waiting for an x-quote to
+# close. Much longer than any Unicode character name.
+HOLD = 256
+# An x-quote that a later chunk might still close.
+_OPEN_X_QUOTE = re.compile("x[0-9A-Zhx]*\\Z")
+
+
+def demunge_chunks(chunks: Iterable[str]) -> Iterator[str]:
+    """Demunge a stream of text, chunk by chunk.
+
+    The text is demunged as if it were one string, even where chunks
+    split an x-quote, but never more than a chunk and `HOLD` characters
+    of it are in memory.
+    """
+    held = ""
+    for chunk in chunks:
+        text = held + chunk
+        match = _OPEN_X_QUOTE.search(text, max(0, len(text) - HOLD))
+        cut = match.start() if match else len(text)
+        held = text[cut:]
+        if cut:
+            yield demunge(text[:cut])
+    if held:
+        yield demunge(held)
+
+
+def demunge_file(infile: TextIO, outfile: TextIO, size=1 << 16):
+    """Copy infile to outfile, demunged, in chunks of the given size."""
+    outfile.writelines(demunge_chunks(iter(lambda: infile.read(size), "")))
+
+
+def excepthook(type_, value, tb):
+    """`sys.excepthook` that prints the traceback demunged.
+
+    Demunges only when an exception is actually reported::
+
+        sys.excepthook = hissp.munger.excepthook
+    """
+    from traceback import format_exception
+
+    sys.stderr.writelines(demunge_chunks(format_exception(type_, value, tb)))
+
+
+def main():
+    import argparse
+    import io
+
+    parser = argparse.ArgumentParser(
+        prog="python -m hissp.munger",
+        description="Demunge files (or stdin) to stdout, e.g. logs or tracebacks.",
+    )
+    parser.add_argument("files", nargs="*", help="Files to demunge. Default stdin.")
+    args = parser.parse_args()
+    # Pass any bytes through that don't decode.
+    out = io.TextIOWrapper(sys.stdout.buffer, "utf8", "surrogateescape")
+    try:
+        for file in args.files or ["-"]:
+            if file == "-":
+                infile = io.TextIOWrapper(sys.stdin.buffer, "utf8", "surrogateescape")
+                demunge_file(infile, out)
+            else:
+                with open(file, encoding="utf8", errors="surrogateescape") as infile:
+                    demunge_file(infile, out)
+    finally:
+        out.flush()
+        out.detach()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+"""
+Namespaces with the prelude already run in them.
+
+``python -m hissp -c`` runs its command after the
+``hissp.basic.._macro_.prelude`` macro. Rather than reading, expanding,
+and executing it again for each command, `namespace` clones a template
+namespace, which is built once per process, from the prelude's compiled
+code. That code is cached on disk by `hissp.cache` (if enabled), like
+a script's.
+
+Clones get their own copy of ``_macro_``, so macros defined in one
+don't leak into the template.
+"""
+
+import sys
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Dict
+
+from hissp import cache
+from hissp.compiler import Compiler
+from hissp.reader import Lissp
+
+PRELUDE = "(hissp.basic.._macro_.prelude)"
+
+
+@lru_cache(None)
+def template() -> Dict[str, Any]:
+    """The names the prelude defines. Don't mutate it. Clone it."""
+    path = cache.entry(PRELUDE)
+    forms = cache.load(path) if path else None
+    if forms is None:
+        lissp = Lissp(evaluate=True)
+        lissp.compiler.executed = forms = []
+        lissp.compile(PRELUDE)
+        if path and not sys.dont_write_bytecode:
+            cache.dump(path, forms, {*cache.COMPILER, *lissp.compiler.macro_modules})
+    ns: Dict[str, Any] = {}
+    for _, code in forms:
+        exec(code, ns)
+    del ns["__builtins__"]
+    return ns
+
+
+def namespace(name="__main__") -> Dict[str, Any]:
+    """A new module namespace, as if the prelude had just run in it."""
+    ns = Compiler.new_ns(name)
+    ns.update(template())
+    if "_macro_" in ns:
+        ns["_macro_"] = SimpleNamespace(**vars(ns["_macro_"]))
+    return ns
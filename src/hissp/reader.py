@@ -3,20 +3,21 @@
 
 import ast
 import builtins
+import marshal
 import os
 import re
 import sys
+import zlib
+from collections.abc import Generator
 from contextlib import contextmanager, nullcontext
 from functools import reduce
-from importlib import import_module, resources
-from itertools import chain
-from pathlib import Path, PurePath
-from pprint import pprint
+from importlib import import_module
+from importlib.util import MAGIC_NUMBER, cache_from_source
+from itertools import chain, count
 from types import ModuleType
 from typing import Any, Iterable, Iterator, NewType, Optional, Tuple, Union
-from unittest.mock import ANY
 
-from hissp.compiler import Compiler, readerless
+from hissp.compiler import Compiler, LazyMacros, readerless
 from hissp.munger import munge
 
 ENTUPLE = ("lambda", (":", ":*", "xAUTO0_"), "xAUTO0_")
@@ -50,6 +51,9 @@ TOKENS = re.compile(
 
 Token = NewType("Token", Tuple[str, str, int])
 
+# Like importlib.resources.Package, which is only imported when needed.
+Package = Union[str, ModuleType]
+
 DROP = object()
 
 class SoftSyntaxError(SyntaxError):
@@ -89,20 +93,49 @@ class _Unquote(tuple):
         return f"_Unquote{super().__repr__()}"
 
 
-def gensym_counter(count=[0]):
-    count[0] += 1
-    return count[0]
-
-
 class Lissp:
+    """
+    The Lissp reader. Translates Lissp code to Hissp forms,
+    and compiles them with its own `Compiler`.
+
+    All reader and compiler state, including the gensym counter,
+    belongs to the instance, so separate instances may read and compile
+    concurrently in separate threads. (The compiler's NS context
+    variable is per-thread.) Gensym numbers count up from 1 in each
+    instance, so the output doesn't depend on what else was compiled
+    first. Outside of ``__main__``, they're also qualified by a hash of
+    the module name, so templates from different modules don't produce
+    the same gensyms, even when one's expansion contains the other's.
+
+    An instance isn't meant to be shared between threads, but it is
+    reentrant: a macro or reader macro may call its `compile` or `reads`
+    while it's compiling, because each read saves and restores the
+    reader state.
+    """
+
     def __init__(
-        self, qualname="__main__", ns=None, verbose=False, evaluate=False, filename="<?>"
+        self,
+        qualname="__main__",
+        ns=None,
+        verbose=False,
+        evaluate=False,
+        filename="<?>",
+        fold=False,
+        compact=False,
     ):
         self.qualname = qualname
-        self.compiler = Compiler(self.qualname, ns, evaluate)
+        self.compiler = Compiler(self.qualname, ns, evaluate, fold, compact)
         self.ns = self.compiler.ns
         self.verbose = verbose
         self.filename = filename
+        self.gensym_counter = count(1)
+        # Qualifies gensyms by module (except __main__), for hygiene across modules.
+        self.gensym_suffix = ""
+        if qualname != "__main__":
+            self.gensym_suffix = f"{zlib.crc32(qualname.encode())}_"
+        self.tokens: Optional[Lexer] = None
+        # Whether any .# has evaluated Python at read time.
+        self.injected = False
         self.reinit()
 
     def reinit(self):
@@ -208,17 +241,20 @@ class Lissp:
         if tag == "$":
             return self.gensym(form)
         if tag == ".":
+            self.injected = True
             return eval(readerless(form), {})
         if is_string(form):
             form = form[1]
         tag = munge(self.escape(tag))
         if ".." in tag and not tag.startswith(".."):
             module, function = tag.split("..", 1)
-            return reduce(getattr, function.split("."), import_module(module))(form)
-        try:
-            m = getattr(self.ns["_macro_"], tag)
-        except (AttributeError, KeyError):
-            raise SyntaxError(f"Unknown reader macro {tag}", self.position())
+            m = reduce(getattr, function.split("."), import_module(module))
+        else:
+            try:
+                m = getattr(self.ns["_macro_"], tag)
+            except (AttributeError, KeyError):
+                raise SyntaxError(f"Unknown reader macro {tag}", self.position())
+        self.compiler.macro_modules.add(getattr(m, "__module__", None))
         return m(form)
 
     @staticmethod
@@ -257,7 +293,7 @@ class Lissp:
             invocation = False
 
     def qualify(self, symbol: str, invocation=False) -> str:
-        if re.search(r"^\.|\.$|^quote$|^lambda$|^__import__$|xAUTO\d+_$|\.\.", symbol):
+        if re.search(r"^\.|\.$|^quote$|^lambda$|^__import__$|xAUTO\d+_(\d+_)?$|\.\.", symbol):
             return symbol  # Not qualifiable.
         if invocation and "_macro_" in self.ns and self._macro_has(symbol):
             return f"{self.qualname}.._macro_.{symbol}"
@@ -273,33 +309,62 @@ class Lissp:
         # __contains__ or __dir__ and exotic _macro_ objects might
         # override __getattribute__. The only way to tell if _macro_ has
         # a name is getattr().
+        macros = self.ns["_macro_"]
+        if isinstance(macros, LazyMacros) and symbol in vars(macros):
+            return True  # Without building it.
         try:
-            getattr(self.ns["_macro_"], symbol)
+            getattr(macros, symbol)
         except AttributeError:
             return False
         return True
 
     def reads(self, code: str) -> Iterable:
-        res: Iterable[object] = self.parse(Lexer(code, self.filename))
-        self.reinit()
+        res: Iterable[object] = self._reads(Lexer(code, self.filename))
         if self.verbose:
+            from pprint import pprint
+
             res = list(res)
             pprint(res)
         return res
 
+    def _reads(self, tokens: Lexer) -> Iterator:
+        outer = self.tokens, self.depth, self._p, self.gensym_stack
+        self.reinit()
+        try:
+            if (profile := self.compiler.profile) is None:
+                yield from self.parse(tokens)
+            else:
+                tokens.it = profile.timed("lex", tokens.it)
+                yield from profile.timed("parse", self.parse(tokens))
+        finally:
+            self.tokens, self.depth, self._p, self.gensym_stack = outer
+
     def compile(self, code: str) -> str:
         hissp = self.reads(code)
-        return self.compiler.compile(hissp)
+        try:
+            return self.compiler.compile(hissp)
+        finally:
+            if isinstance(hissp, Generator):
+                hissp.close()  # Restores reader state, even if it didn't finish.
+
+    def compile_iter(self, code: str) -> Iterator[str]:
+        """Read and compile the code lazily, yielding each compiled form."""
+        hissp = self.reads(code)
+        try:
+            yield from self.compiler.compile_iter(hissp)
+        finally:
+            if isinstance(hissp, Generator):
+                hissp.close()
 
     def gensym(self, form: str):
         try:
-            return f"_{munge(form)}xAUTO{self.gensym_stack[-1]}_"
+            return f"_{munge(form)}xAUTO{self.gensym_stack[-1]}_{self.gensym_suffix}"
         except IndexError:
             raise SyntaxError("Gensym outside of template.", self.position()) from None
 
     @contextmanager
     def gensym_context(self):
-        self.gensym_stack.append(gensym_counter())
+        self.gensym_stack.append(next(self.gensym_counter))
         try:
             yield
         finally:
@@ -318,44 +383,124 @@ class Lissp:
 
 
 def is_string(form):
-    return form == ("quote", ANY, ANY) and form[2].get(":str")
-
-
-def transpile(package: Optional[resources.Package], *modules: Union[str, PurePath]):
+    return (
+        isinstance(form, tuple)
+        and len(form) == 3
+        and form[0] == "quote"
+        and form[2].get(":str")
+    )
+
+
+def transpile(
+    package: Optional[Package],
+    *modules: Union[str, os.PathLike],
+    fold=False,
+    compact=False,
+    incremental=False,
+):
     # TODO: allow pathname without + ".lissp"?
     if package:
         for module in modules:
-            transpile_module(package, module + ".lissp")
+            transpile_module(
+                package,
+                module + ".lissp",
+                fold=fold,
+                compact=compact,
+                incremental=incremental,
+            )
     else:
         for module in modules:
             with open(module+'.lissp') as f:
                 code = f.read()
             out = module + '.py'
-            _write_py(out, module, code)
+            _write_py(out, module, code, fold, compact, incremental)
 
 
 def transpile_module(
-    package: resources.Package,
-    resource: Union[str, PurePath],
-    out: Union[None, str, bytes, Path] = None,
+    package: Package,
+    resource: Union[str, os.PathLike],
+    out: Union[None, str, bytes, os.PathLike] = None,
+    fold=False,
+    compact=False,
+    incremental=False,
 ):
+    from importlib import resources
+
     code = resources.read_text(package, resource)
-    path: Path
     with resources.path(package, resource) as path:
         out = out or path.with_suffix(".py")
         if isinstance(package, ModuleType):
             package = package.__package__
         if isinstance(package, os.PathLike):
             resource = resource.stem
-        _write_py(out, f"{package}.{resource.split('.')[0]}", code)
-
-
-def _write_py(out, qualname, code):
-    with open(out, "w") as f:
-        print(f"compiling {qualname} as", out, file=sys.stderr)
-        if code.startswith('#!'):  # ignore shebang line
-            _, _, code = code.partition('\n')
-        f.write(Lissp(qualname, evaluate=True, filename=str(out)).compile(code))
+        qualname = f"{package}.{resource.split('.')[0]}"
+        _write_py(out, qualname, code, fold, compact, incremental)
+
+
+def _write_py(out, qualname, code, fold=False, compact=False, incremental=False):
+    if incremental:
+        from hissp import build  # Circular import.
+
+        options = dict(fold=fold, compact=compact)
+        if build.fresh(out, code, options):
+            return
+    out = os.fsdecode(out)
+    print(f"compiling {qualname} as", out, file=sys.stderr)
+    source = code
+    if code.startswith('#!'):  # ignore shebang line
+        _, _, code = code.partition('\n')
+    lissp = Lissp(qualname, evaluate=True, filename=out, fold=fold, compact=compact)
+    separator = "\n" if compact else "\n\n"
+    # Stream the forms to disk, replacing the old output only once complete.
+    temp = f"{out}.{os.getpid()}.tmp"
+    try:
+        with open(temp, "w") as f:
+            for i, python in enumerate(lissp.compile_iter(code)):
+                if i:
+                    f.write(separator)
+                f.write(python)
+        if os.path.exists(out):
+            import shutil
+
+            shutil.copymode(out, temp)  # Keep the old output's permissions.
+        os.replace(temp, out)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+    if not sys.dont_write_bytecode:
+        with open(out) as f:
+            _write_pyc(out, f.read())
+    if incremental:
+        build.record(out, source, options, lissp.compiler)
+
+
+def _write_pyc(out: str, python: str):
+    """
+    Cache the compiled module, so the first import needn't compile it again.
+
+    Skipped if the Python doesn't compile (say, after a form that failed
+    to), since the import will report that anyway. Written atomically,
+    like importlib's own cache.
+    """
+    try:
+        code = compile(python, out, "exec")
+    except (SyntaxError, ValueError):
+        return
+    stat = os.stat(out)
+    pyc = cache_from_source(out)
+    os.makedirs(os.path.dirname(pyc), exist_ok=True)
+    temp = f"{pyc}.{os.getpid()}.tmp"
+    try:
+        with open(temp, "wb") as f:
+            f.write(MAGIC_NUMBER)
+            f.write((0).to_bytes(4, "little"))  # Flags. Timestamp-based invalidation.
+            f.write((int(stat.st_mtime) & 0xFFFFFFFF).to_bytes(4, "little"))
+            f.write((stat.st_size & 0xFFFFFFFF).to_bytes(4, "little"))
+            f.write(marshal.dumps(code))
+        os.replace(temp, pyc)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
 
 def main():
     transpile(*sys.argv[1:])
@@ -0,0 +1,144 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+"""
+Persistent compile server, listening on a Unix domain socket.
+
+Starting an interpreter and importing the compiler and macro modules
+costs much more than compiling a typical module. The server pays that
+once, and keeps them loaded between requests. Each request gets a fresh
+`Lissp` instance, so requests don't see each other's definitions.
+Connections are handled in threads, but requests run one at a time,
+since imports (and forgetting stale modules) change `sys.modules` for
+the whole process.
+
+Before each request, modules whose files changed since they were
+imported are dropped from `sys.modules`, so edited macros are imported
+again, rather than used stale.
+
+The protocol is a line of JSON per request, and one per reply.
+`hissp.client` implements it. Requests are one of::
+
+    {"op": "compile", "code": "...", "qualname": "__main__", "evaluate": false}
+    {"op": "transpile", "package": null, "modules": ["/abs/foo"]}
+    {"op": "stop"}
+
+and may include the ``fold`` and ``compact`` options. A failed request
+replies ``{"error": "<traceback>"}``.
+
+The default socket (see `hissp.client.default_path`) is in a directory
+only the user may access. An existing file at the socket path is only
+replaced if it's a socket of the same user.
+
+From the command line::
+
+    $ python -m hissp --serve [socket]
+"""
+
+import json
+import os
+import socketserver
+import stat
+import sys
+import threading
+from traceback import format_exc
+from typing import Dict, Tuple
+
+import hissp.basic  # noqa: F401  # Warm up the usual macros.
+from hissp.client import default_path, private_dir
+from hissp.reader import Lissp, transpile
+
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                reply = self.server.dispatch(json.loads(line))
+            except (Exception, SystemExit):  # An evaluated __main__ may exit.
+                reply = dict(error=format_exc())
+            self.wfile.write(json.dumps(reply).encode("utf8") + b"\n")
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    """Compiles Lissp on request, with the compiler kept warm."""
+
+    daemon_threads = True
+
+    def __init__(self, path=None):
+        if path is None:
+            path = default_path()
+            private_dir(path)
+        self.path = path
+        if os.path.lexists(path):  # Stale, from a server that didn't stop cleanly?
+            st = os.lstat(path)
+            if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+                raise FileExistsError(f"{path} exists, and isn't one of your sockets.")
+            os.remove(path)
+        super().__init__(self.path, Handler)
+        self.stamps: Dict[str, Tuple[int, int]] = {}
+        self.lock = threading.Lock()
+        self.refresh()
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def dispatch(self, message: dict) -> dict:
+        with self.lock:  # One request at a time.
+            self.refresh()
+            try:
+                return self._dispatch(message)
+            finally:
+                self.refresh()  # Note the modules this request imported.
+
+    def _dispatch(self, message: dict) -> dict:
+        op = message.pop("op")
+        if op == "compile":
+            lissp = Lissp(
+                message.get("qualname", "__main__"),
+                evaluate=message.get("evaluate", False),
+                fold=message.get("fold", False),
+                compact=message.get("compact", False),
+            )
+            return dict(python=lissp.compile(message["code"]))
+        if op == "transpile":
+            transpile(
+                message.get("package"),
+                *message["modules"],
+                fold=message.get("fold", False),
+                compact=message.get("compact", False),
+                incremental=message.get("incremental", False),
+            )
+            return {}
+        if op == "stop":
+            threading.Thread(target=self.shutdown).start()
+            return {}
+        raise ValueError(f"Unknown op {op!r}")
+
+    def refresh(self):
+        """
+        Forget the modules whose files changed since they were loaded.
+        Call it with the lock held (or before serving).
+        """
+        for name, module in [*sys.modules.items()]:
+            file = getattr(module, "__file__", None)
+            if not file:
+                continue
+            try:
+                st = os.stat(file)
+            except OSError:
+                continue
+            stamp = st.st_mtime_ns, st.st_size
+            if self.stamps.setdefault(name, stamp) != stamp:
+                sys.modules.pop(name, None)
+                del self.stamps[name]
+
+
+def serve(path=None):
+    """Serve compile requests on the socket until stopped."""
+    with Server(path) as server:
+        print("Hissp server listening on", server.path, file=sys.stderr)
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
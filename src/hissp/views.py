@@ -0,0 +1,74 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+"""
+Copy-free views of sequences, for linked-list style processing.
+
+The ``cdr`` family of `hissp.basic` macros slice, and slicing a tuple
+copies it, so recursing down a sequence with them is quadratic. Slicing
+a `View` makes another view of the same sequence instead, in constant
+time, so the same macros become linear on views:
+
+>>> from hissp.reader import Lissp
+>>> length = eval(Lissp().compile('''
+... (lambda (xs : n 0)
+...   (hissp.basic.._macro_.if-else xs
+...     (length (hissp.basic.._macro_.cdr xs) (operator..add n 1))
+...     n))
+... '''))
+>>> length(View(range(5)))
+5
+
+Views are meant for macros (and other code that may depend on Hissp).
+A view is not a tuple, so the compiler won't read one as code. Convert
+it with ``tuple()`` before returning it from a macro. The expansions of
+`hissp.basic` don't use views, since they must run without Hissp.
+"""
+
+from collections.abc import Sequence
+from operator import eq
+from typing import Iterator, Optional, Union
+
+
+class View(Sequence):
+    """Read-only view of a sequence. Slices are views, not copies.
+
+    >>> v = View((1, 2, 3, 4))[1:]
+    >>> v
+    View((2, 3, 4))
+    >>> v[::2], v[0], len(v)
+    (View((2, 4)), 2, 3)
+
+    A view of a view shares the underlying sequence. Views compare
+    equal to tuples with the same items.
+    """
+
+    __slots__ = ("_sequence", "_range")
+
+    def __init__(self, sequence: Sequence, indexes: Optional[range] = None):
+        if type(sequence) is View:
+            indexes = sequence._range if indexes is None else sequence._range[indexes]
+            sequence = sequence._sequence
+        self._sequence = sequence
+        self._range = range(len(sequence)) if indexes is None else indexes
+
+    def __getitem__(self, index: Union[int, slice]):
+        if type(index) is slice:
+            return View(self._sequence, self._range[index])
+        return self._sequence[self._range[index]]
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __iter__(self) -> Iterator:
+        return map(self._sequence.__getitem__, self._range)
+
+    def __eq__(self, other):
+        if isinstance(other, (View, tuple)):
+            return len(self) == len(other) and all(map(eq, self, other))
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return f"View({tuple(self)!r})"
@@ -0,0 +1,139 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+"""
+Watch mode. Hot reloads a Lissp module as it's edited.
+
+`watch` polls the file, and on each change, compares its top-level
+forms to those of the previous version. Only the first changed form,
+and every form after it, gets compiled and executed again, in the
+module's persistent namespace. The earlier forms (and anything they
+loaded) are kept. The ``.py`` file is rewritten from the compiled
+forms, the same as `transpile` would write it.
+
+Definitions removed from the file stay in the namespace until restart.
+The module's qualified name comes from the package ``__init__`` files
+above it (see `module_name`), so templates and gensyms are qualified
+just as when transpiling the package.
+
+From the command line::
+
+    $ python -m hissp --watch foo.lissp
+"""
+
+import os
+import sys
+import time
+from itertools import count
+from pathlib import Path
+from traceback import print_exc
+from typing import List, NamedTuple, Optional, Tuple
+
+from hissp.reader import Lexer, Lissp, _write_pyc
+
+
+class Form(NamedTuple):
+    """A top-level form's source, its compiled Python, and the next gensym."""
+
+    source: str
+    python: Tuple[str, ...]
+    gensym: int
+
+
+def split(code: str) -> List[str]:
+    """The source of each top-level form (with its reader macros)."""
+    sources = []
+    depth = 0
+    needed = 1  # Forms still to read at depth 0 to complete this one.
+    start = None
+    for kind, token, end in Lexer(code):
+        if kind in {"whitespace", "comment"}:
+            continue
+        if start is None:
+            start = end - len(token)
+        elif kind == "macro" and token == "_#" and depth == 0:
+            needed += 1  # The discarded form doesn't count for the prefix.
+        depth += {"open": 1, "close": -1}.get(kind, 0)
+        if depth <= 0 and kind != "macro":
+            depth = 0
+            needed -= 1
+            if not needed:
+                sources.append(code[start:end])
+                needed = 1
+                start = None
+    if start is not None:
+        sources.append(code[start:])  # Incomplete. Let the reader complain.
+    return sources
+
+
+def module_name(file) -> str:
+    """The dotted name of the module, walking up the package ``__init__`` files."""
+    path = Path(file).resolve()
+    parts = [path.stem]
+    directory = path.parent
+    while any((directory / f"__init__{suffix}").exists() for suffix in [".py", ".lissp"]):
+        parts.append(directory.name)
+        directory = directory.parent
+    return ".".join(reversed(parts))
+
+
+class Watcher:
+    """Recompiles a Lissp module's changed forms, in a persistent namespace."""
+
+    def __init__(self, file, qualname: Optional[str] = None):
+        self.file = Path(file)
+        self.out = self.file.with_suffix(".py")
+        self.lissp = Lissp(
+            qualname or module_name(self.file), evaluate=True, filename=str(self.out)
+        )
+        self.forms: List[Form] = []
+
+    def reload(self) -> int:
+        """Recompile from the first changed form. Returns how many were."""
+        code = self.file.read_text()
+        if code.startswith("#!"):  # ignore shebang line
+            _, _, code = code.partition("\n")
+        sources = split(code)
+        kept = 0
+        for old, new in zip(self.forms, sources):
+            if old.source != new:
+                break
+            kept += 1
+        if kept == len(sources) == len(self.forms):
+            return 0
+        del self.forms[kept:]
+        gensym = self.forms[-1].gensym if self.forms else 1
+        for source in sources[kept:]:
+            # Numbered as if the whole file had been read in one go.
+            self.lissp.gensym_counter = count(gensym)
+            python = tuple(self.lissp.compile_iter(source))
+            gensym = next(self.lissp.gensym_counter)
+            self.forms.append(Form(source, python, gensym))
+        self.write()
+        return len(sources) - kept
+
+    def write(self):
+        """Atomically rewrite the .py file (and .pyc) from the forms."""
+        python = "\n\n".join(p for form in self.forms for p in form.python)
+        temp = self.out.with_suffix(f".{os.getpid()}.tmp")
+        temp.write_text(python)
+        os.replace(temp, self.out)
+        if not sys.dont_write_bytecode:
+            _write_pyc(self.out, python)
+
+
+def watch(file, qualname: Optional[str] = None, interval=0.1):
+    """Reload the module whenever the file changes. Runs until interrupted."""
+    watcher = Watcher(file, qualname)
+    seen = None
+    while True:
+        try:
+            stat = os.stat(file)
+            if (stat.st_mtime_ns, stat.st_size) != seen:
+                seen = stat.st_mtime_ns, stat.st_size
+                start = time.perf_counter()
+                n = watcher.reload()
+                ms = (time.perf_counter() - start) * 1000
+                print(f"reloaded {n} form(s) of {file} in {ms:.1f} ms", file=sys.stderr)
+        except Exception:
+            print_exc()
+        time.sleep(interval)
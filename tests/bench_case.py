@@ -0,0 +1,46 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+"""
+Benchmark of ``case`` against ``cond``, dispatching among N keys.
+
+Times the average over all the keys, and the miss (default) case.
+Run it directly::
+
+    $ python tests/bench_case.py
+"""
+
+import sys
+import timeit
+
+from hissp.reader import Lissp
+
+import hissp.basic  # noqa: F401
+
+
+def compiled(n, macro):
+    if macro == "case":
+        pairs = " ".join(f"{k} {k}" for k in range(n))
+        code = f"(lambda (x) (hissp.basic.._macro_.case x -1 {pairs}))"
+    else:
+        pairs = " ".join(f"(operator..eq x {k}) {k}" for k in range(n))
+        code = f"(lambda (x) (hissp.basic.._macro_.cond {pairs} :else -1))"
+    return eval(Lissp().compile(code))
+
+
+def bench(n, macro, number=20000):
+    f = compiled(n, macro)
+    keys = [*range(n), -1]
+    return min(
+        timeit.repeat(lambda: [f(k) for k in keys], number=number // len(keys), repeat=3)
+    ) / (number // len(keys) * len(keys)) * 1e9
+
+
+def main():
+    sys.setrecursionlimit(10000)  # cond expands recursively.
+    print(f"{'N':>4} {'cond ns':>8} {'case ns':>8}")
+    for n in [1, 2, 3, 4, 6, 8, 16, 32, 64, 128]:
+        print(f"{n:>4} {bench(n, 'cond'):8.0f} {bench(n, 'case'):8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+"""
+Benchmark of ``for-each`` and ``loop-while`` against recursive Lissp
+and Python's own loops, summing N numbers into a list cell.
+
+Run it directly::
+
+    $ python tests/bench_loops.py
+"""
+
+import sys
+import timeit
+
+from hissp.reader import Lissp
+
+import hissp.basic  # noqa: F401
+
+LISSP = {
+    "for-each": """
+    (lambda (n)
+      (hissp.basic.._macro_.let (acc [0])
+        (hissp.basic.._macro_.for-each i (range n)
+          (operator..setitem acc 0 (operator..add (operator..getitem acc 0) i)))
+        (operator..getitem acc 0)))
+    """,
+    "loop-while": """
+    (lambda (n)
+      (hissp.basic.._macro_.let (acc [0]
+                                 i [0])
+        (hissp.basic.._macro_.loop-while (operator..lt (operator..getitem i 0) n)
+          (operator..setitem acc 0 (operator..add (operator..getitem acc 0)
+                                                  (operator..getitem i 0)))
+          (operator..setitem i 0 (operator..add (operator..getitem i 0) 1)))
+        (operator..getitem acc 0)))
+    """,
+    "recursion": """
+    (lambda (n)
+      (hissp.basic.._macro_.let (loop [None])
+        (operator..setitem loop 0 (lambda (i acc)
+                                    (hissp.basic.._macro_.if-else (operator..lt i n)
+                                      ((operator..getitem loop 0) (operator..add i 1)
+                                                                  (operator..add acc i))
+                                      acc)))
+        ((operator..getitem loop 0) 0 0)))
+    """,
+}
+
+
+def python_for(n):
+    acc = [0]
+    for i in range(n):
+        acc[0] = acc[0] + i
+    return acc[0]
+
+
+def python_while(n):
+    acc = [0]
+    i = [0]
+    while i[0] < n:
+        acc[0] = acc[0] + i[0]
+        i[0] = i[0] + 1
+    return acc[0]
+
+
+def main():
+    sys.setrecursionlimit(100_000)  # For the recursive version.
+    loops = {k: eval(Lissp().compile(v)) for k, v in LISSP.items()}
+    loops.update({"python for": python_for, "python while": python_while})
+    print(f"{'N':>6}", *(f"{k + ' us':>15}" for k in loops))
+    for n in [10, 100, 1000, 10000]:
+        times = []
+        for f in loops.values():
+            assert f(n) == n * (n - 1) // 2
+            number = max(1, 20000 // n)
+            times.append(min(timeit.repeat(lambda: f(n), number=number, repeat=3)) / number)
+        print(f"{n:>6}", *(f"{t * 1e6:15.1f}" for t in times))
+
+
+if __name__ == "__main__":
+    main()
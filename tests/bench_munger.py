@@ -0,0 +1,39 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+"""
+Microbenchmarks of munge and demunge against the unoptimized reference
+versions in test_munger.py.
+
+Run it directly::
+
+    $ python tests/bench_munger.py
+"""
+
+import timeit
+
+from hissp import munger
+
+
+def best(f, data, number=200):
+    """Best time of one pass over the data."""
+    return min(timeit.repeat(lambda: [*map(f, data)], number=number, repeat=5)) / number
+
+
+def main():
+    munged = [*map(munger.munge, SYMBOLS)] * 2 + ["no quotes here"] * 5
+    munger.munge.cache_clear()
+    cases = {
+        "munge (cached)": (munger.munge, munge_reference, SYMBOLS),
+        "munge (tables)": (munger.munge.__wrapped__, munge_reference, SYMBOLS),
+        "demunge": (munger.demunge, demunge_reference, munged),
+    }
+    print(f"{'':<15}", *(f"{k:>15}" for k in ["us", "reference us", "speedup"]))
+    for name, (f, reference, data) in cases.items():
+        fast, slow = best(f, data), best(reference, data)
+        print(f"{name:<15} {fast * 1e6:15.1f} {slow * 1e6:15.1f} {slow / fast:14.2f}x")
+
+
+if __name__ == "__main__":
+    from test_munger import SYMBOLS, demunge_reference, munge_reference
+
+    main()
@@ -0,0 +1,73 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import importlib.util
+import sys
+import tempfile
+from contextlib import redirect_stderr
+from io import StringIO
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from hissp import aio, reader
+from hissp.compiler import CompileError
+
+
+class TestTranspile(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name) / "aiopkg"
+        self.root.mkdir()
+        (self.root / "__init__.py").touch()
+        for i in range(6):
+            (self.root / f"m{i}.lissp").write_text(
+                f"(hissp.basic.._macro_.define x `(,{i} $#y))"
+            )
+        (self.root / "bad.lissp").write_text("(nonesuch.._macro_.x)")
+        for p in [patch("sys.path", [directory.name, *sys.path]), patch.dict(sys.modules)]:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def events(self, *modules, **kwargs):
+        async def collect():
+            return [e async for e in aio.transpile("aiopkg", *modules, **kwargs)]
+
+        return asyncio.run(collect())
+
+    def test_transpile(self):
+        modules = [f"m{i}" for i in range(6)]
+        events = self.events(*modules, limit=2)
+        outputs = {m: (self.root / m).with_suffix(".py").read_text() for m in modules}
+        reader.transpile("aiopkg", *modules)
+        for m in modules:
+            self.assertEqual((self.root / m).with_suffix(".py").read_text(), outputs[m])
+        running = peak = 0
+        for event in events:
+            running += 1 if event.kind == "started" else -1
+            peak = max(peak, running)
+        self.assertEqual(2, peak)
+        finished = {(e.qualname, e.out) for e in events if e.kind == "finished"}
+        self.assertEqual({(f"aiopkg.{m}", self.root / f"{m}.py") for m in modules}, finished)
+
+    def test_failed(self):
+        events = self.events("bad", "m0")
+        self.assertEqual(2, sum(e.kind == "started" for e in events))
+        [m0] = [e for e in events if e.kind == "finished"]
+        [failed] = [e for e in events if e.kind == "failed"]
+        self.assertEqual(("failed", "aiopkg.bad"), failed[:2])
+        self.assertIsInstance(failed.error, CompileError)
+        self.assertEqual(("finished", "aiopkg.m0"), m0[:2])
+        self.assertFalse((self.root / "bad.py").exists())
+
+    @patch("sys.dont_write_bytecode", False)
+    def test_same_writer(self):
+        self.events("m0", incremental=True)
+        py = self.root / "m0.py"
+        self.assertTrue(Path(importlib.util.cache_from_source(str(py))).exists())
+        with redirect_stderr(StringIO()) as err:
+            [_, finished] = self.events("m0", incremental=True)
+        self.assertEqual("finished", finished.kind)
+        self.assertEqual("", err.getvalue())  # Fresh, so not compiled again.
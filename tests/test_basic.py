@@ -0,0 +1,825 @@
+# hissp.basic.._macro_.alias
+# hissp.basic.._macro_.defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda _GxAUTO54_3221665387_:(
+  'Aliases hissp.basic.._macro_. as xBANG_#',
+  '{}{}'.format(
+    'hissp.basic.._macro_.',
+    _GxAUTO54_3221665387_))[-1]):(
+  __import__('operator').setitem(
+    __import__('builtins').globals(),
+    '_macro_',
+    __import__('types').ModuleType(
+      '_macro_')),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'xBANG_'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'xBANG_',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# hissp.basic.._macro_.define
+__import__('operator').setitem(
+  __import__('builtins').globals(),
+  'enlist',
+  (lambda *a:
+    list(
+      a)))
+
+# hissp.basic.._macro_.defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda :
+  (lambda *xAUTO0_:xAUTO0_)(
+    'tests.test_basic..enlist',
+    (lambda *xAUTO0_:xAUTO0_)(
+      'quote',
+      'tests.test_basic..enlist'))):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'tqs'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'tqs',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# hissp.basic.._macro_.defmacro
+# hissp.basic.._macro_.let
+(lambda _fnxAUTO7_3221665387_=(lambda :(
+  'test qualified symbol, with docstring',
+  (lambda *xAUTO0_:xAUTO0_)(
+    'tests.test_basic..enlist',
+    (lambda *xAUTO0_:xAUTO0_)(
+      'quote',
+      'tests.test_basic..enlist')))[-1]):(
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__doc__',
+    'test qualified symbol, with docstring'),
+  __import__('builtins').setattr(
+    _fnxAUTO7_3221665387_,
+    '__qualname__',
+    '.'.join(
+      ('_macro_', 'tqs2'))),
+  __import__('builtins').setattr(
+    _macro_,
+    'tqs2',
+    _fnxAUTO7_3221665387_))[-1])()
+
+# hissp.basic.._macro_.deftype
+# hissp.basic.._macro_.define
+__import__('operator').setitem(
+  __import__('builtins').globals(),
+  'TestBasic',
+  __import__('builtins').type(
+    'TestBasic',
+    (lambda *xAUTO0_:xAUTO0_)(
+      __import__('unittest').TestCase),
+    __import__('builtins').dict(
+      test_same_gensym=(lambda self:
+        self.assertEqual(
+          *(lambda *xAUTO0_:xAUTO0_)(
+            '_testxAUTO3_2231731156_',
+            '_testxAUTO3_2231731156_'))),
+      test_qualified_symbol=(lambda self:
+        self.assertEqual(
+          # tqs
+          __import__('builtins').globals()['enlist'](
+            'tests.test_basic..enlist'),
+          ['tests.test_basic..enlist'])),
+      test_none_doc=(lambda self:
+        self.assertIsNone(
+          _macro_.tqs.__doc__)),
+      test_qualified_symbol2=(lambda self:
+        self.assertEqual(
+          # tqs2
+          __import__('builtins').globals()['enlist'](
+            'tests.test_basic..enlist'),
+          ['tests.test_basic..enlist'])),
+      test_doc=(lambda self:
+        self.assertEqual(
+          _macro_.tqs2.__doc__,
+          'test qualified symbol, with docstring')),
+      test_let=(lambda self:
+        # hissp.basic.._macro_.let
+        (lambda x=(1),y=(2):(
+          self.assertEqual(
+            x,
+            (1)),
+          self.assertEqual(
+            y,
+            (2)))[-1])()),
+      test_car=(lambda self:
+        self.assertEqual(
+          (1),
+          # hissp.basic.._macro_.car
+          __import__('operator').getitem(
+            [1, 2],
+            (0)))),
+      test_cdr=(lambda self:
+        self.assertEqual(
+          [2, 3],
+          # hissp.basic.._macro_.cdr
+          __import__('operator').getitem(
+            [1, 2, 3],
+            __import__('builtins').slice(
+              (1),
+              None)))),
+      test_caar=(lambda self:
+        self.assertEqual(
+          (1),
+          # hissp.basic.._macro_.caar
+          # hissp.basic.._macro_.car
+          __import__('operator').getitem(
+            # hissp.basic.._macro_.car
+            __import__('operator').getitem(
+              [[1, 2, 3]],
+              (0)),
+            (0)))),
+      test_cdar=(lambda self:
+        self.assertEqual(
+          [2, 3],
+          # hissp.basic.._macro_.cdar
+          # hissp.basic.._macro_.cdr
+          __import__('operator').getitem(
+            # hissp.basic.._macro_.car
+            __import__('operator').getitem(
+              [[1, 2, 3]],
+              (0)),
+            __import__('builtins').slice(
+              (1),
+              None)))),
+      test_cadr=(lambda self:
+        self.assertEqual(
+          (2),
+          # hissp.basic.._macro_.cadr
+          __import__('operator').getitem(
+            [1, 2, 3],
+            (1)))),
+      test_cddr=(lambda self:
+        self.assertEqual(
+          [2, 3],
+          # hissp.basic.._macro_.cddr
+          __import__('operator').getitem(
+            [0, 1, 2, 3],
+            __import__('builtins').slice(
+              (2),
+              None)))),
+      test_cascade=(lambda self:
+        self.assertEqual(
+          # hissp.basic.._macro_.cascade
+          (lambda _thingxAUTO26_3221665387_=[]:(
+            _thingxAUTO26_3221665387_.append(
+              (1)),
+            _thingxAUTO26_3221665387_.extend(
+              [2, 3]),
+            _thingxAUTO26_3221665387_)[-1])(),
+          [1, 2, 3])),
+      test_ifxH_else=(lambda self:(
+        self.assertEqual(
+          # hissp.basic.._macro_.ifxH_else
+          (':yes' if False else ':no'),
+          ':no'),
+        self.assertEqual(
+          # hissp.basic.._macro_.ifxH_else
+          (':yes' if True else ':no'),
+          ':yes'),
+        # hissp.basic.._macro_.let
+        (lambda xs=[]:(
+          # hissp.basic.._macro_.ifxH_else
+          (xs.append(
+              ':yes')
+           if False
+           else xs.append(
+              ':no')),
+          # hissp.basic.._macro_.ifxH_else
+          (xs.append(
+              ':yes')
+           if True
+           else xs.append(
+              ':no')),
+          self.assertEqual(
+            xs,
+            [':no', ':yes']))[-1])())[-1]),
+      test_cond=(lambda self:
+        # hissp.basic.._macro_.let
+        (lambda xs=[]:(
+          xs.append(
+            # hissp.basic.._macro_.cond
+            ()),
+          # hissp.basic.._macro_.cond
+          # hissp.basic.._macro_.ifxH_else
+          (xs.append(
+              ':oops')
+           if False
+           else ()),
+          # hissp.basic.._macro_.cond
+          # hissp.basic.._macro_.ifxH_else
+          (xs.append(
+              (1))
+           if ':else'
+           else ()),
+          # hissp.basic.._macro_.cond
+          # hissp.basic.._macro_.ifxH_else
+          (xs.append(
+              ':oops')
+           if False
+           else # hissp.basic.._macro_.ifxH_else
+            (xs.append(
+                (2))
+             if ':else'
+             else ())),
+          # hissp.basic.._macro_.cond
+          # hissp.basic.._macro_.ifxH_else
+          (xs.append(
+              (3))
+           if True
+           else # hissp.basic.._macro_.ifxH_else
+            (xs.append(
+                ':oops')
+             if ':else'
+             else ())),
+          # hissp.basic.._macro_.cond
+          # hissp.basic.._macro_.ifxH_else
+          (xs.append(
+              ':oops')
+           if False
+           else # hissp.basic.._macro_.ifxH_else
+            (xs.append(
+                ':oops')
+             if (0)
+             else # hissp.basic.._macro_.ifxH_else
+              (xs.append(
+                  (4))
+               if True
+               else # hissp.basic.._macro_.ifxH_else
+                (xs.append(
+                    ':oops')
+                 if ()
+                 else ())))),
+          self.assertEqual(
+            xs,
+            enlist(
+              (),
+              (1),
+              (2),
+              (3),
+              (4))))[-1])()),
+      test_anyxH_for=(lambda self:
+        # hissp.basic.._macro_.let
+        (lambda xs=[]:(
+          # hissp.basic.._macro_.anyxH_for
+          __import__('builtins').any(
+            __import__('builtins').map(
+              (lambda i:(
+                xs.append(
+                  i),
+                __import__('operator').not_(
+                  __import__('operator').mod(
+                    i,
+                    (7))))[-1]),
+              range(
+                (1),
+                (10)))),
+          self.assertEqual(
+            xs,
+            enlist(
+              (1),
+              (2),
+              (3),
+              (4),
+              (5),
+              (6),
+              (7))))[-1])()),
+      test_forxH_each=(lambda self:
+        # hissp.basic.._macro_.let
+        (lambda xs=[]:(
+          self.assertIsNone(
+            # hissp.basic.._macro_.forxH_each
+            __import__('collections').deque(
+              __import__('builtins').map(
+                (lambda i:(
+                  xs.append(
+                    i),
+                  xs.append(
+                    __import__('operator').neg(
+                      i)))[-1]),
+                range(
+                  (1),
+                  (4))),
+              maxlen=(0)).clear()),
+          self.assertEqual(
+            xs,
+            enlist(
+              (1),
+              (-1),
+              (2),
+              (-2),
+              (3),
+              (-3))),
+          # hissp.basic.._macro_.forxH_each
+          __import__('collections').deque(
+            __import__('builtins').map(
+              (lambda i:
+                xs.append(
+                  i)),
+              range(
+                __import__('operator').mul(
+                  (2),
+                  __import__('sys').getrecursionlimit()))),
+            maxlen=(0)).clear(),
+          self.assertEqual(
+            len(
+              xs),
+            __import__('operator').add(
+              (6),
+              __import__('operator').mul(
+                (2),
+                __import__('sys').getrecursionlimit()))))[-1])()),
+      test_loopxH_while=(lambda self:
+        # hissp.basic.._macro_.let
+        (lambda xs=[3, 2, 1],ys=[]:(
+          self.assertIsNone(
+            # hissp.basic.._macro_.loopxH_while
+            __import__('collections').deque(
+              __import__('builtins').map(
+                (lambda __xAUTO42_3221665387_:
+                  ys.append(
+                    xs.pop())),
+                __import__('builtins').iter(
+                  (lambda :
+                    # hissp.basic.._macro_.ifxH_else
+                    (True if xs else False)),
+                  False)),
+              maxlen=(0)).clear()),
+          self.assertEqual(
+            ys,
+            [1, 2, 3]),
+          # hissp.basic.._macro_.loopxH_while
+          __import__('collections').deque(
+            __import__('builtins').map(
+              (lambda __xAUTO42_3221665387_:(
+                ys.append(
+                  (0)),
+                False)[-1]),
+              __import__('builtins').iter(
+                (lambda :
+                  # hissp.basic.._macro_.ifxH_else
+                  (True
+                   if __import__('operator').lt(
+                      len(
+                        ys),
+                      (6))
+                   else False)),
+                False)),
+            maxlen=(0)).clear(),
+          self.assertEqual(
+            ys,
+            [1, 2, 3, 0, 0, 0]))[-1])()),
+      test_xET_xET_=(lambda self:
+        # hissp.basic.._macro_.let
+        (lambda xs=[]:(
+          # hissp.basic.._macro_.cascade
+          (lambda _thingxAUTO26_3221665387_=xs:(
+            _thingxAUTO26_3221665387_.append(
+              # hissp.basic.._macro_.xET_xET_
+              True),
+            _thingxAUTO26_3221665387_.append(
+              # hissp.basic.._macro_.xET_xET_
+              (0)),
+            _thingxAUTO26_3221665387_.append(
+              # hissp.basic.._macro_.xET_xET_
+              (1)),
+            _thingxAUTO26_3221665387_.append(
+              # hissp.basic.._macro_.xET_xET_
+              # hissp.basic.._macro_.let
+              ((0)
+               and xs.append(
+                  ':oops'))),
+            _thingxAUTO26_3221665387_.append(
+              # hissp.basic.._macro_.xET_xET_
+              # hissp.basic.._macro_.let
+              ((1)
+               and xs.append(
+                  (2)))),
+            _thingxAUTO26_3221665387_.append(
+              # hissp.basic.._macro_.xET_xET_
+              # hissp.basic.._macro_.let
+              (True
+               and # hissp.basic.._macro_.let
+                (xs.append(
+                    (3))
+                 and xs.append(
+                    ':oops')))),
+            _thingxAUTO26_3221665387_.append(
+              # hissp.basic.._macro_.xET_xET_
+              # hissp.basic.._macro_.let
+              (True
+               and # hissp.basic.._macro_.let
+                (# hissp.basic.._macro_.progn
+                  (lambda :(
+                    xs.append(
+                      (4)),
+                    ':oops')[-1])()
+                 and xs.append(
+                    (5))))),
+            _thingxAUTO26_3221665387_.append(
+              # hissp.basic.._macro_.xET_xET_
+              # hissp.basic.._macro_.let
+              ((1)
+               and # hissp.basic.._macro_.let
+                ((2)
+                 and # hissp.basic.._macro_.progn
+                  (lambda :(
+                    xs.append(
+                      (6)),
+                    (7))[-1])()))),
+            _thingxAUTO26_3221665387_)[-1])(),
+          self.assertEqual(
+            [True, 0, 1, 0, 2, None, 3, None, 4, 5, None, 6, 7],
+            xs))[-1])()),
+      test_xBAR_xBAR_=(lambda self:
+        # hissp.basic.._macro_.let
+        (lambda xs=[]:(
+          # hissp.basic.._macro_.cascade
+          (lambda _thingxAUTO26_3221665387_=xs:(
+            _thingxAUTO26_3221665387_.append(
+              # hissp.basic.._macro_.xBAR_xBAR_
+              ()),
+            _thingxAUTO26_3221665387_.append(
+              # hissp.basic.._macro_.xBAR_xBAR_
+              (0)),
+            _thingxAUTO26_3221665387_.append(
+              # hissp.basic.._macro_.xBAR_xBAR_
+              (1)),
+            _thingxAUTO26_3221665387_.append(
+              # hissp.basic.._macro_.xBAR_xBAR_
+              # hissp.basic.._macro_.let
+              ((2)
+               or xs.append(
+                  ':oops'))),
+            _thingxAUTO26_3221665387_.append(
+              # hissp.basic.._macro_.xBAR_xBAR_
+              # hissp.basic.._macro_.let
+              ((0)
+               or xs.append(
+                  (3)))),
+            _thingxAUTO26_3221665387_.append(
+              # hissp.basic.._macro_.xBAR_xBAR_
+              # hissp.basic.._macro_.let
+              ((0)
+               or # hissp.basic.._macro_.let
+                (xs.append(
+                    (5))
+                 or (6)))),
+            _thingxAUTO26_3221665387_)[-1])(),
+          self.assertEqual(
+            enlist(
+              (),
+              (0),
+              (1),
+              (2),
+              (3),
+              None,
+              (5),
+              (6)),
+            xs))[-1])()),
+      test_case=(lambda self:
+        # hissp.basic.._macro_.let
+        (lambda xs=[]:
+          # hissp.basic.._macro_.let
+          (lambda f=(lambda k:
+            # hissp.basic.._macro_.case
+            # hissp.basic.._macro_.let
+            (lambda _ixAUTO48_3221665387_=# hissp.basic.._macro_.xBAR_xBAR_
+            # hissp.basic.._macro_.let
+            (globals().get(
+                '_casexAUTOa0961f2d8703_')
+             or globals().setdefault(
+                '_casexAUTOa0961f2d8703_',
+                __import__('builtins').dict(
+                  ((0, 1), (2.5, 4), ('two', 3), ('one', 2))))).get(
+              k,
+              (0)):
+              # hissp.basic.._macro_.ifxH_else
+              (# hissp.basic.._macro_.ifxH_else
+                (# hissp.basic.._macro_.progn
+                  (lambda :(
+                    xs.append(
+                      ':default'),
+                    ':default')[-1])()
+                 if _ixAUTO48_3221665387_.__lt__(
+                    (1))
+                 else # hissp.basic.._macro_.ifxH_else
+                  (# hissp.basic.._macro_.progn
+                    (lambda :(
+                      xs.append(
+                        (0)),
+                      ':zero')[-1])()
+                   if _ixAUTO48_3221665387_.__lt__(
+                      (2))
+                   else # hissp.basic.._macro_.progn
+                    (lambda :(
+                      xs.append(
+                        (1)),
+                      ':one')[-1])()))
+               if _ixAUTO48_3221665387_.__lt__(
+                  (3))
+               else # hissp.basic.._macro_.ifxH_else
+                (# hissp.basic.._macro_.progn
+                  (lambda :(
+                    xs.append(
+                      (2)),
+                    ':two')[-1])()
+                 if _ixAUTO48_3221665387_.__lt__(
+                    (4))
+                 else # hissp.basic.._macro_.ifxH_else
+                  (':float'
+                   if _ixAUTO48_3221665387_.__lt__(
+                      (5))
+                   else ':oops'))))()):(
+            self.assertEqual(
+              list(
+                map(
+                  f,
+                  enlist(
+                    (0),
+                    'one',
+                    'two',
+                    (2.5),
+                    'oops',
+                    (1),
+                    ()))),
+              [':zero', ':one', ':two', ':float', ':default', ':default', ':default']),
+            self.assertEqual(
+              xs,
+              enlist(
+                (0),
+                (1),
+                (2),
+                ':default',
+                ':default',
+                ':default')),
+            self.assertEqual(
+              # hissp.basic.._macro_.case
+              # hissp.basic.._macro_.let
+              (lambda _ixAUTO48_3221665387_=# hissp.basic.._macro_.xBAR_xBAR_
+              # hissp.basic.._macro_.let
+              (globals().get(
+                  '_casexAUTObf21a9e8fbc5_')
+               or globals().setdefault(
+                  '_casexAUTObf21a9e8fbc5_',
+                  __import__('builtins').dict(
+                    ()))).get(
+                (1),
+                (0)):':default')(),
+              ':default'),
+            self.assertEqual(
+              list(
+                map(
+                  (lambda i:
+                    # hissp.basic.._macro_.case
+                    # hissp.basic.._macro_.let
+                    (lambda _ixAUTO48_3221665387_=# hissp.basic.._macro_.xBAR_xBAR_
+                    # hissp.basic.._macro_.let
+                    (globals().get(
+                        '_casexAUTOfa2575b9a086_')
+                     or globals().setdefault(
+                        '_casexAUTOfa2575b9a086_',
+                        __import__('builtins').dict(
+                          ((6, 7), (5, 6), (4, 5), (3, 4), (2, 3), (1, 2), (0, 1))))).get(
+                      i,
+                      (0)):
+                      # hissp.basic.._macro_.ifxH_else
+                      (# hissp.basic.._macro_.ifxH_else
+                        (# hissp.basic.._macro_.ifxH_else
+                          (':miss'
+                           if _ixAUTO48_3221665387_.__lt__(
+                              (1))
+                           else ':a')
+                         if _ixAUTO48_3221665387_.__lt__(
+                            (2))
+                         else # hissp.basic.._macro_.ifxH_else
+                          (':b'
+                           if _ixAUTO48_3221665387_.__lt__(
+                              (3))
+                           else ':c'))
+                       if _ixAUTO48_3221665387_.__lt__(
+                          (4))
+                       else # hissp.basic.._macro_.ifxH_else
+                        (# hissp.basic.._macro_.ifxH_else
+                          (':d'
+                           if _ixAUTO48_3221665387_.__lt__(
+                              (5))
+                           else ':e')
+                         if _ixAUTO48_3221665387_.__lt__(
+                            (6))
+                         else # hissp.basic.._macro_.ifxH_else
+                          (':f'
+                           if _ixAUTO48_3221665387_.__lt__(
+                              (7))
+                           else ':g'))))()),
+                  range(
+                    (-1),
+                    (8)))),
+              [':miss', ':a', ':b', ':c', ':d', ':e', ':f', ':g', ':miss']))[-1])())()),
+      test_progn=(lambda self:
+        self.assertEqual(
+          # hissp.basic.._macro_.let
+          (lambda xs=[]:
+            # hissp.basic.._macro_.progn
+            (lambda :(
+              xs.append(
+                (1)),
+              xs.extend(
+                'bc'),
+              xs)[-1])())(),
+          [1, 'b', 'c'])),
+      test_prog1=(lambda self:
+        # hissp.basic.._macro_.let
+        (lambda xs=[]:(
+          xs.append(
+            # hissp.basic.._macro_.prog1
+            # hissp.basic.._macro_.let
+            (lambda _value1xAUTO52_3221665387_=(3):(
+              xs.append(
+                (1)),
+              xs.append(
+                (2)),
+              _value1xAUTO52_3221665387_)[-1])()),
+          self.assertEqual(
+            [1, 2, 3],
+            xs))[-1])()),
+      test_attach=(lambda self:
+        # hissp.basic.._macro_.let
+        (lambda ns=__import__('types').SimpleNamespace(),x=(1),y=(2),z=(3):(
+          # hissp.basic.._macro_.attach
+          # hissp.basic.._macro_.let
+          (lambda _targetxAUTO22_3221665387_=ns:(
+            __import__('builtins').setattr(
+              _targetxAUTO22_3221665387_,
+              'x',
+              x),
+            __import__('builtins').setattr(
+              _targetxAUTO22_3221665387_,
+              'y',
+              y),
+            __import__('builtins').setattr(
+              _targetxAUTO22_3221665387_,
+              'z',
+              z),
+            __import__('builtins').setattr(
+              _targetxAUTO22_3221665387_,
+              'p',
+              (4)),
+            __import__('builtins').setattr(
+              _targetxAUTO22_3221665387_,
+              'q',
+              (5)),
+            __import__('builtins').setattr(
+              _targetxAUTO22_3221665387_,
+              'r',
+              (6)),
+            _targetxAUTO22_3221665387_)[-1])(),
+          self.assertEqual(
+            __import__('types').SimpleNamespace(
+              x=(1),
+              y=(2),
+              z=(3),
+              p=(4),
+              q=(5),
+              r=(6)),
+            ns))[-1])()),
+      test_when=(lambda self:
+        # hissp.basic.._macro_.let
+        (lambda xs=[]:(
+          # hissp.basic.._macro_.when
+          # hissp.basic.._macro_.ifxH_else
+          (# hissp.basic.._macro_.progn
+            (lambda :(
+              xs.append(
+                (1)),
+              xs.append(
+                (2)))[-1])()
+           if (1)
+           else ()),
+          # hissp.basic.._macro_.when
+          # hissp.basic.._macro_.ifxH_else
+          (# hissp.basic.._macro_.progn
+            (lambda :(
+              xs.append(
+                ':oops'),
+              xs.append(
+                ':oops'))[-1])()
+           if (0)
+           else ()),
+          self.assertEqual(
+            [1, 2],
+            xs))[-1])()),
+      test_unless=(lambda self:
+        # hissp.basic.._macro_.let
+        (lambda xs=[]:(
+          # hissp.basic.._macro_.unless
+          # hissp.basic.._macro_.ifxH_else
+          (()
+           if (0)
+           else # hissp.basic.._macro_.progn
+            (lambda :(
+              xs.append(
+                (1)),
+              xs.append(
+                (2)))[-1])()),
+          # hissp.basic.._macro_.unless
+          # hissp.basic.._macro_.ifxH_else
+          (()
+           if (1)
+           else # hissp.basic.._macro_.progn
+            (lambda :(
+              xs.append(
+                ':oops'),
+              xs.append(
+                ':oops'))[-1])()),
+          self.assertEqual(
+            [1, 2],
+            xs))[-1])()),
+      test_xH_xGT_=(lambda self:
+        self.assertEqual(
+          # hissp.basic.._macro_.xH_xGT_
+          '-x-'.replace(
+            'x',
+            'y').strip(
+            '-').upper(),
+          'Y')),
+      test_xH_xGT_xGT_=(lambda self:
+        self.assertEqual(
+          # hissp.basic.._macro_.xH_xGT_xGT_
+          list(
+            filter(
+              (lambda x:
+                __import__('operator').eq(
+                  (0),
+                  __import__('operator').mod(
+                    x,
+                    (2)))),
+              map(
+                (lambda x:
+                  __import__('operator').mul(
+                    x,
+                    x)),
+                range(
+                  (3))))),
+          [0, 4])),
+      test_prelude=(lambda self:
+        # hissp.basic.._macro_.let
+        (lambda ns={}:(
+          exec(
+            __import__('hissp.compiler',fromlist='?').readerless(
+              ('hissp.basic.._macro_.prelude',)),
+            ns),
+          self.assertEqual(
+            set(
+              __import__('operator').__all__),
+            set(
+              __import__('operator').__all__).intersection(
+              ns.keys())),
+          # hissp.basic.._macro_.let
+          (lambda members=set(
+            __import__('itertools').filterfalse(
+              (lambda x:
+                x.startswith(
+                  '_')),
+              dir(
+                __import__('itertools')))):
+            self.assertEqual(
+              members,
+              members.intersection(
+                ns.keys())))(),
+          self.assertIn(
+            '_macro_',
+            ns),
+          self.assertEqual(
+            set(
+              dir(
+                __import__('hissp.basic',fromlist='?')._macro_)),
+            vars(
+              ns.__getitem__(
+                '_macro_')).keys()))[-1])()),
+      test_string_newline=(lambda self:(
+        self.assertEqual(
+          'foobar\nbaz',
+          'foobar\nbaz'),
+        self.assertEqual(
+          '\n\nfoo\nbar\n',
+          '\n\nfoo\nbar\n'))[-1]),
+      test_string_reader_macro=(lambda self:
+        self.assertEqual(
+          __import__('pickle').loads(  # Fraction(1, 3)
+              b'cfractions\nFraction\n(I1\nI3\ntR.'
+          ),
+          __import__('pickle').loads(  # Fraction(1, 3)
+              b'cfractions\nFraction\n(I1\nI3\ntR.'
+          ))))))
\ No newline at end of file
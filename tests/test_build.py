@@ -0,0 +1,116 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+
+import importlib
+import os
+import sys
+import tempfile
+import warnings
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from hissp import build
+from hissp.compiler import PostCompileWarning
+
+SOURCES = {
+    "__init__.py": "",
+    "macros.lissp": """
+(hissp.basic.._macro_.defmacro twice (x)
+  `(operator..mul 2 ,x))
+""",
+    "a.lissp": """
+(hissp.basic.._macro_.define answer (buildpkg.macros.._macro_.twice 21))
+""",
+    "b.lissp": """
+(hissp.basic.._macro_.defmacro pair (x)
+  `(hissp.basic.._macro_.let ($#x ,x) (enlist $#x $#x)))
+(hissp.basic.._macro_.define enlist (lambda (: :* xs) (list xs)))
+(hissp.basic.._macro_.define both (pair buildpkg.a..answer))
+""",
+    "cycle1.lissp": "(hissp.basic.._macro_.define f (lambda () buildpkg.cycle2..g))",
+    "cycle2.lissp": "(hissp.basic.._macro_.define g (lambda () buildpkg.cycle1..f))",
+    "sub/__init__.py": "",
+    "sub/c.lissp": "(print buildpkg.b..both)",
+}
+
+
+class TestBuild(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name) / "buildpkg"
+        for name, code in SOURCES.items():
+            path = self.root / name
+            path.parent.mkdir(exist_ok=True, parents=True)
+            path.write_text(code)
+        for p in [patch("sys.path", [directory.name, *sys.path]), patch.dict(sys.modules)]:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def outputs(self):
+        outputs = {}
+        for path in sorted(self.root.glob("**/*.lissp")):
+            outputs[path.name] = path.with_suffix(".py").read_bytes()
+            os.remove(path.with_suffix(".py"))
+        return outputs
+
+    def test_graph(self):
+        graph = build.modules("buildpkg")
+        self.assertEqual({"buildpkg.macros"}, graph["buildpkg.a"].dependencies)
+        self.assertEqual({"buildpkg.a"}, graph["buildpkg.b"].dependencies)
+        self.assertEqual({"buildpkg.b"}, graph["buildpkg.sub.c"].dependencies)
+        self.assertEqual("buildpkg.sub", graph["buildpkg.sub.c"].package)
+        batches = [*build.order(graph)]
+        self.assertEqual(["buildpkg.macros"], batches[0])
+        self.assertEqual(["buildpkg.a"], batches[1])
+        self.assertEqual(["buildpkg.b"], batches[2])
+        self.assertEqual(["buildpkg.sub.c"], batches[3])
+        self.assertEqual([["buildpkg.cycle1"], ["buildpkg.cycle2"]], batches[4:])
+
+    def test_parallel_matches_sequential(self):
+        build.build("buildpkg", workers=3)
+        parallel = self.outputs()
+        build.build("buildpkg", workers=1)
+        self.assertEqual(parallel, self.outputs())
+        self.assertIn(b"_xxAUTO1_", parallel["b.lissp"])
+
+    def test_built_package_runs(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with redirect_stderr(StringIO()), redirect_stdout(StringIO()) as out:
+                build.build("buildpkg", workers=1)
+        compile_warnings = [w for w in caught if w.category is PostCompileWarning]
+        self.assertEqual([], [str(w.message) for w in compile_warnings])
+        self.assertEqual("[42, 42]\n", out.getvalue())  # From compiling c.
+        for name in [*sys.modules]:
+            if name.startswith("buildpkg"):
+                del sys.modules[name]
+        self.assertEqual([42, 42], importlib.import_module("buildpkg.b").both)
+        with redirect_stdout(StringIO()) as out:
+            importlib.import_module("buildpkg.sub.c")
+        self.assertEqual("[42, 42]\n", out.getvalue())
+
+    def compiled(self):
+        with redirect_stderr(StringIO()) as err:
+            build.build("buildpkg", workers=1, incremental=True)
+        lines = err.getvalue().splitlines()
+        return sorted(line.split()[1] for line in lines if line.startswith("compiling"))
+
+    def test_incremental(self):
+        everything = sorted(build.modules("buildpkg"))
+        self.assertEqual(everything, self.compiled())
+        self.assertEqual([], self.compiled())
+        macros = self.root / "macros.lissp"
+        macros.write_text(macros.read_text().replace("2", "3"))
+        # Only a uses the changed macro.
+        self.assertEqual(["buildpkg.a", "buildpkg.macros"], self.compiled())
+        self.assertIn("(3)", (self.root / "a.py").read_text())
+        self.assertEqual([], self.compiled())
+        (self.root / "sub/c.py").write_text("")
+        self.assertEqual(["buildpkg.sub.c"], self.compiled())
+        with redirect_stderr(StringIO()):
+            build.build("buildpkg", workers=1, incremental=True, fold=True)
+        self.assertEqual(["buildpkg.a", "buildpkg.b"], self.compiled()[:2])
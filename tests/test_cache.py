@@ -0,0 +1,96 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from hissp import cache
+
+SCRIPT = """\
+(hissp.basic.._macro_.defmacro greet (name)
+  `(print "hello" ',name))
+(greet world)
+(print (spam.._macro_.eggs))
+"""
+
+
+class TestCache(TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        for p in [
+            patch.dict(os.environ, HISSP_CACHE_DIR=self.dir.name + "/cache"),
+            patch("sys.dont_write_bytecode", False),
+            patch("sys.path", [self.dir.name, *sys.path]),
+            patch.dict(sys.modules),
+        ]:
+            p.start()
+            self.addCleanup(p.stop)
+        self.macros("1")
+
+    def macros(self, eggs):
+        sys.modules.pop("spam", None)
+        with open(os.path.join(self.dir.name, "spam.py"), "w") as f:
+            f.write(f"class _macro_:\n    eggs = lambda: {eggs!r}\n")
+
+    def run_script(self, script=SCRIPT):
+        with redirect_stdout(StringIO()) as out, patch.object(
+            cache, "replay", wraps=cache.replay
+        ) as replay:
+            cache.run(script)
+        return out.getvalue(), replay.called
+
+    def test_cached(self):
+        self.assertEqual(("hello world\n1\n", False), self.run_script())
+        self.assertEqual(("hello world\n1\n", True), self.run_script())
+
+    def test_script_changed(self):
+        self.run_script()
+        script = SCRIPT.replace("hello", "hi")
+        self.assertEqual(("hi world\n1\n", False), self.run_script(script))
+
+    def test_macro_module_changed(self):
+        self.run_script()
+        self.macros("42")
+        self.assertEqual(("hello world\n42\n", False), self.run_script())
+        self.assertEqual(("hello world\n42\n", True), self.run_script())
+
+    def test_failure_not_cached(self):
+        with self.assertRaises(SystemExit), redirect_stdout(StringIO()):
+            with patch("sys.stderr", StringIO()):
+                cache.run("(print 1)(operator..truediv 1 0)")
+        self.assertFalse(os.path.exists(self.dir.name + "/cache"))
+
+    def test_helper_changed(self):
+        with open(os.path.join(self.dir.name, "ham.py"), "w") as f:
+            f.write("def helper():\n    return 1\n")
+        with open(os.path.join(self.dir.name, "spam.py"), "a") as f:
+            f.write("from ham import helper\n_macro_.eggs = lambda: helper()\n")
+        self.assertEqual(("hello world\n1\n", False), self.run_script())
+        self.assertEqual(("hello world\n1\n", True), self.run_script())
+        for name in ["spam", "ham"]:
+            sys.modules.pop(name)
+        with open(os.path.join(self.dir.name, "ham.py"), "w") as f:
+            f.write("def helper():\n    return 42\n")
+        self.assertEqual(("hello world\n42\n", False), self.run_script())
+
+    def test_inject_not_cached(self):
+        script = '(print .#"print(\'read\') or 1")'
+        self.assertEqual(("read\n1\n", False), self.run_script(script))
+        self.assertEqual(("read\n1\n", False), self.run_script(script))
+
+    def test_disabled(self):
+        with patch.dict(os.environ, HISSP_CACHE_DIR=""):
+            self.assertIsNone(cache.entry(SCRIPT))
+            self.assertEqual(("hello world\n1\n", False), self.run_script())
+            self.assertEqual(("hello world\n1\n", False), self.run_script())
+
+    def test_off_by_default(self):
+        with patch.dict(os.environ):
+            del os.environ["HISSP_CACHE_DIR"]
+            self.assertIsNone(cache.entry(SCRIPT))
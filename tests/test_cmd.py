@@ -1,6 +1,7 @@
 # Copyright 2020 Matthew Egan Odendahl
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 import subprocess as sp
 
 
@@ -215,3 +216,29 @@ def test_repl_paren_continue():
 #> """,
         ">>> ()\n"*4 + ">>> (1, 2)\n"*3,
     )
+
+
+def test_macro_stats():
+    out, err = cmd(["lissp", "--macro-stats", "-c", "(print (when 1 (-> 2 (add 1))))"])
+    assert out == "3\n"
+    assert err.startswith("  calls        ms depth   size in  size out  macro\n")
+    assert "hissp.basic.._macro_.->\n" in err
+    assert "hissp.basic.._macro_.when\n" in err
+
+
+def test_profile():
+    out, err = cmd(["lissp", "--profile", "-", "-c", "(print (when 1 (-> 2 (add 1))))"])
+    assert out == "3\n"
+    profile = json.loads(err)
+    assert profile["memory"]
+    [form] = profile["modules"]["__main__"]["forms"]
+    assert [*form] == ["lex", "parse", "expand", "emit", "exec"]
+    assert form["expand"]["calls"] >= 2
+    assert form["exec"]["peak"] > 0
+
+
+def test_abort_shows_output_so_far():
+    out, err = cmd(["lissp", "-c", "(print 1)(operator..truediv 1 0)"])
+    assert out == "1\n"
+    assert err.startswith("print(\n  (1))\n\n__import__('operator').truediv(")
+    assert "ZeroDivisionError" in err
@@ -1,13 +1,17 @@
 # Copyright 2019, 2020 Matthew Egan Odendahl
 # SPDX-License-Identifier: Apache-2.0
 
+import ast
 import re
+import tracemalloc
+from types import SimpleNamespace
 from unittest import TestCase
+from unittest.mock import patch
 
 import hypothesis.strategies as st
 from hypothesis import given
 
-from hissp import compiler, munger
+from hissp import compiler, munger, reader
 
 quoted = (
     st.none()
@@ -57,3 +61,329 @@ class TestCompileGeneral(TestCase):
         match = re.fullmatch("x(.*?)_", x)
         if match:
             self.assertEqual(char, munger.un_x_quote(match))
+
+
+def expansion_stats(code):
+    """The macro statistics of compiling the code."""
+    lissp = reader.Lissp()
+    lissp.compiler.macro_stats = {}
+    lissp.compile(code)
+    return lissp.compiler.macro_stats
+
+
+def expansion_work(stats):
+    """The total size of the forms the macros took and made."""
+    return sum(s.size_in + s.size_out for s in stats.values())
+
+
+class TestCompileConditional(TestCase):
+    def test_native(self):
+        lissp = reader.Lissp(evaluate=True)
+        python = lissp.compile(
+            """
+            (hissp.basic.._macro_.define xs [])
+            (hissp.basic.._macro_.if-else (hissp.basic.._macro_.&& 1 (.append xs 1))
+                                          (.append xs :oops)
+                                          (hissp.basic.._macro_.|| 0 (.append xs 2) 3))
+            """
+        )
+        self.assertNotIn("lambda", python)
+        self.assertEqual([1, 2], lissp.ns["xs"])
+
+    @staticmethod
+    def cond(n):
+        pairs = " ".join(f"(operator..eq x {i}) {i}" for i in range(n))
+        return f"(lambda (x) (hissp.basic.._macro_.cond {pairs} :else :none))"
+
+    def test_long_cond(self):
+        f = eval(reader.Lissp().compile(self.cond(3000)))
+        self.assertEqual([*range(3000)], [*map(f, range(3000))])
+        self.assertEqual(":none", f(-1))
+        f = eval(reader.Lissp().compile("(lambda (x) (hissp.basic.._macro_.cond x 1))"))
+        self.assertEqual((), f(0))
+
+    def test_odd_cond(self):
+        for code in ["(cond False 1 :else)", "(cond x)", self.cond(40).replace(" :none", "")]:
+            with self.assertRaisesRegex(compiler.CompileError, "even number of arguments"):
+                reader.Lissp().compile(code.replace("(cond", "(hissp.basic.._macro_.cond"))
+
+    def test_odd_case(self):
+        for code in ["(case x :default 1 :one 2 :two 3)", "(case x :default 1)"]:
+            with self.assertRaisesRegex(compiler.CompileError, "even number of arguments"):
+                reader.Lissp().compile(code.replace("(case", "(hissp.basic.._macro_.case"))
+
+    def test_long_boolean(self):
+        xs = []
+        ors = " ".join(f"(.append xs {i})" for i in range(3000))
+        ands = " ".join(f"(.append xs {i}) 1" for i in range(3000))
+        self.assertEqual(1, eval(reader.Lissp().compile(f"(hissp.basic.._macro_.|| {ors} 1)")))
+        self.assertIsNone(eval(reader.Lissp().compile(f"(hissp.basic.._macro_.&& {ands})")))
+        self.assertEqual([*range(3000), 0], xs)
+
+    def test_linear_expansion(self):
+        small, large = expansion_stats(self.cond(500)), expansion_stats(self.cond(2000))
+        self.assertEqual(1, large["hissp.basic.._macro_.cond"].calls)  # Not recursive.
+        self.assertLess(max(s.depth for s in large.values()), 32)
+        self.assertLess(expansion_work(large) / expansion_work(small), 8)  # Quadratic: 16.
+
+
+class TestCompileThreading(TestCase):
+    @staticmethod
+    def pipeline(macro, n):
+        stages = " ".join(f"(operator..sub {i})" for i in range(n))
+        return f"(hissp.basic.._macro_.{macro} 0 {stages})"
+
+    def test_short(self):
+        python = reader.Lissp().compile(self.pipeline("->", 16))
+        self.assertNotIn("reduce", python)
+        self.assertEqual(-sum(range(16)), eval(python))
+
+    def test_long(self):
+        first = eval(reader.Lissp().compile(self.pipeline("->", 1000)))
+        last = eval(reader.Lissp().compile(self.pipeline("->>", 1000)))
+        self.assertEqual(-sum(range(1000)), first)
+        self.assertEqual(500, last)  # Each stage is i - x: 0, 1, 1, 2, 2, 3, ...
+
+    def test_linear_expansion(self):
+        small = expansion_stats(self.pipeline("->", 250))
+        large = expansion_stats(self.pipeline("->", 1000))
+        [(name, stats)] = large.items()
+        self.assertEqual("hissp.basic.._macro_.xH_xGT_", name)
+        self.assertEqual((1, 1), (stats.calls, stats.depth))  # One expansion, not nested.
+        self.assertLess(expansion_work(large) / expansion_work(small), 8)  # Quadratic: 16.
+
+
+class TestCompileFold(TestCase):
+    def test_fold(self):
+        python = reader.Lissp(fold=True).compile(
+            """
+            (operator..getitem '(1 2 3) (operator..add 1 1))
+            (operator..not_ True)
+            (builtins..len (.split (.upper "a b c")))
+            """
+        )
+        self.assertEqual("(3)\n\nFalse\n\n(3)", python)
+
+    def test_no_fold(self):
+        python = reader.Lissp(fold=True).compile(
+            """
+            (operator..add x 1)
+            (operator..floordiv 1 0)
+            (print 1)
+            """
+        )
+        self.assertEqual(3, python.count("__import__('operator')") + python.count("print"))
+        self.assertIn("add", reader.Lissp().compile("(operator..add 1 1)"))
+        for code in ["(builtins..frozenset '(1 2))", '(builtins..float "nan")']:
+            python = reader.Lissp(fold=True).compile(code)
+            self.assertNotIn("pickle", python)  # No literal, so not folded.
+            self.assertIn("builtins", python)
+        python = reader.Lissp(fold=True).compile("(builtins..len (builtins..frozenset '(1 2)))")
+        self.assertEqual("(2)", python)  # Only the result needs a literal.
+
+    def test_fold_limits(self):
+        lissp = reader.Lissp(fold=True)
+        for code in [
+            '(operator..mul "ab" 100000000)',
+            "(operator..mul 100000000 '(1 2))",
+            "(operator..lshift 1 100000000)",
+            "(operator..mul 340282366920938463463374607431768211456 2)",
+            '(.zfill "1" 100000000)',
+            '(.replace (operator..mul "a" 4000) "a" "bb")',
+            '(operator..add (operator..mul "a" 4000) (operator..mul "b" 4000))',
+        ]:
+            tracemalloc.start()
+            try:
+                python = lissp.compile(code)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            self.assertRegex(python, "mul|lshift|zfill|replace|add")  # Not folded.
+            self.assertLess(len(python), 10000)
+            self.assertLess(peak, 1 << 20)  # Nor computed, then thrown away.
+        self.assertEqual("'" + "ab" * 2048 + "'", lissp.compile('(operator..mul "ab" 2048)'))
+        self.assertNotIn("format", compiler.FOLDABLE_METHODS[str])
+
+
+class TestCompileCompact(TestCase):
+    CODE = """
+    (hissp.basic.._macro_.define answer
+      (hissp.basic.._macro_.let (x (list '(1 2 "three" [4] {5: 6})))
+        (.append x (hissp.basic.._macro_.if-else x (float "nan") 0))
+        (print x : sep ";")
+        (lambda (: a 1  :* args)
+          (hissp.basic.._macro_.&& a args (len args)))))
+    """
+
+    def test_compact(self):
+        pretty = reader.Lissp().compile(self.CODE)
+        compact = reader.Lissp(compact=True).compile(self.CODE)
+        self.assertLess(len(compact), len(pretty) / 2)
+        self.assertNotIn("\n", compact)
+        self.assertNotIn("#", compact)
+        self.assertEqual(
+            [*map(ast.dump, ast.walk(ast.parse(pretty)))],
+            [*map(ast.dump, ast.walk(ast.parse(compact)))],
+        )
+
+    @given(literals)
+    def test_compact_literal(self, form):
+        self.assertEqual(form, eval(compiler.Compiler(compact=True).quoted(form)))
+
+
+class TestMacroStats(TestCase):
+    CODE = "(hissp.basic.._macro_.cond a 1 b 2 c 3 :else (hissp.basic.._macro_.&& x y z))"
+
+    def test_stats(self):
+        lissp = reader.Lissp()
+        lissp.compiler.macro_stats = {}
+        lissp.compile(self.CODE)
+        stats = lissp.compiler.macro_stats
+        self.assertEqual(1, stats["hissp.basic.._macro_.cond"].calls)
+        self.assertEqual(1, stats["hissp.basic.._macro_.xET_xET_"].calls)
+        self.assertEqual(4, stats["hissp.basic.._macro_.ifxH_else"].calls)
+        self.assertEqual(1, stats["hissp.basic.._macro_.cond"].depth)
+        self.assertEqual(5, stats["hissp.basic.._macro_.ifxH_else"].depth)
+        self.assertLess(
+            stats["hissp.basic.._macro_.cond"].depth, stats["hissp.basic.._macro_.let"].depth
+        )
+        self.assertIn("hissp.basic.._macro_.&&", compiler.format_macro_stats(stats))
+
+    def test_size_limit(self):
+        lissp = reader.Lissp()
+        lissp.compiler.max_expansion_size = 20
+        with self.assertRaisesRegex(compiler.CompileError, "cond has size 2[0-9], over"):
+            lissp.compile(self.CODE)
+
+    def test_depth_limit(self):
+        lissp = reader.Lissp()
+        lissp.compiler.max_expansion_depth = 5
+        with self.assertRaisesRegex(compiler.CompileError, "nested 6 deep, over the limit of 5"):
+            lissp.compile(self.CODE)
+        lissp.compiler.max_expansion_depth = 20
+        lissp.compile(self.CODE)
+
+
+class TestProfile(TestCase):
+    CODE = """
+    (hissp.basic.._macro_.define x (hissp.basic.._macro_.cond 0 1 :else 2))
+    (print (hissp.basic.._macro_.when x x))
+    """
+
+    def test_phases(self):
+        with compiler.profiling() as profile:
+            lissp = reader.Lissp(evaluate=True)
+            lissp.compile(self.CODE)
+        self.assertIs(profile, lissp.compiler.profile)
+        self.assertIsNone(reader.Lissp().compiler.profile)
+        forms = profile.modules["__main__"]
+        self.assertEqual(2, len(forms))
+        for form in profile.to_json()["modules"]["__main__"]["forms"]:
+            self.assertEqual([*compiler.Profile.PHASES], [*form])
+            self.assertEqual(1, form["parse"]["calls"])
+            self.assertEqual(1, form["emit"]["calls"])
+            self.assertEqual(1, form["exec"]["calls"])
+        totals = profile.totals("__main__")
+        self.assertEqual(
+            forms[0]["expand"].calls + forms[1]["expand"].calls, totals["expand"].calls
+        )
+        self.assertEqual(0, totals["lex"].peak)  # Memory is off.
+
+    def test_exclusive(self):
+        clock = [0.0]
+        profile = compiler.Profile()
+        profile.form("m")
+        with patch("hissp.compiler.perf_counter", lambda: clock[0]):
+            with profile.phase("emit"):
+                clock[0] += 2
+                with profile.phase("expand"):
+                    clock[0] += 5
+                clock[0] += 1
+        stats = profile.current
+        self.assertEqual((3, 5), (stats["emit"].time, stats["expand"].time))
+        self.assertEqual((1, 1), (stats["emit"].calls, stats["expand"].calls))
+
+    def test_nested(self):
+        inner = reader.Lissp("inner", evaluate=True)
+        code = "(hissp.basic.._macro_.define y (.compile inner \"(print 1)\"))"
+        with compiler.profiling(memory=True) as profile:
+            inner.compiler.profile = profile
+            outer = reader.Lissp(ns=dict(inner=inner), evaluate=True)
+            outer.compile(code)
+        self.assertEqual(1, len(profile.modules["__main__"]))
+        self.assertEqual(1, len(profile.modules["inner"]))
+        self.assertEqual(1, profile.modules["__main__"][0]["exec"].calls)
+        self.assertGreater(profile.modules["__main__"][0]["exec"].peak, 0)
+
+
+LAZY = """
+(hissp.basic.._macro_.define _macro_ (hissp.compiler..LazyMacros))
+(hissp.basic.._macro_.defmacro twice (x)
+  "Doubles."
+  `(operator..mul 2 ,x))
+(hissp.basic.._macro_.defmacro quad (x)
+  `(twice (twice ,x)))
+(hissp.basic.._macro_.defmacro unused ()
+  (nonesuch))
+"""
+
+
+class TestLazyMacros(TestCase):
+    def setUp(self):
+        self.lissp = reader.Lissp("lazy", evaluate=True)
+        self.python = self.lissp.compile(LAZY)
+        self.macros = self.lissp.ns["_macro_"]
+
+    def test_deferred(self):
+        self.assertIn("_macro_.defer(", self.python)
+        self.assertEqual({"quad", "twice", "unused"}, vars(self.macros).deferred.keys())
+        self.assertEqual(["quad", "twice", "unused"], dir(self.macros))
+        self.assertIn("twice", vars(self.macros))
+
+    def test_unqualified(self):
+        self.assertIn("(3)))", self.lissp.compile("(quad 3)"))
+        self.assertEqual({"unused"}, vars(self.macros).deferred.keys())
+        self.assertEqual("Doubles.", self.macros.twice.__doc__)
+        self.assertEqual("_macro_.quad", self.macros.quad.__qualname__)
+        self.assertEqual("lazy", self.macros.quad.__module__)
+
+    def test_qualified(self):
+        other = reader.Lissp(evaluate=True)
+        with patch.dict("sys.modules", lazy=SimpleNamespace(_macro_=self.macros)):
+            self.assertEqual(
+                "__import__('operator').mul(\n  (2),\n  (21))",
+                other.compile("(lazy.._macro_.twice 21)").split("\n", 1)[1],
+            )
+
+    def test_redefine(self):
+        self.lissp.compile("(quad 1)")
+        self.lissp.compile("(hissp.basic.._macro_.defmacro twice (x) x)")
+        self.assertIn("twice", vars(self.macros).deferred)
+        self.assertNotIn("operator", self.lissp.compile("(twice 1)"))
+
+    def test_copied(self):
+        copy = SimpleNamespace(**vars(self.macros))
+        self.assertEqual({"quad", "twice", "unused"}, vars(copy).keys())
+        self.assertEqual("Doubles.", copy.twice.__doc__)
+        self.assertEqual({}, vars(self.macros).deferred)
+
+    def test_replaced(self):
+        self.lissp.compile(
+            "(hissp.basic.._macro_.let () (hissp.basic.._macro_.defmacro twice (x) x))"
+        )
+        self.assertEqual(["quad", "twice", "unused"], sorted([*vars(self.macros)]))
+        vars(self.macros)["quad"] = print
+        self.assertEqual({"unused"}, vars(self.macros).deferred.keys())
+        self.assertEqual("1", SimpleNamespace(**vars(self.macros)).twice("1"))
+
+    def test_not_top_level(self):
+        python = self.lissp.compile(
+            """
+            (hissp.basic.._macro_.let (k 3)
+              (hissp.basic.._macro_.defmacro triple (x)
+                `(operator..mul ,k ,x)))
+            """
+        )
+        self.assertNotIn("defer", python)  # Registered eagerly, closing over k.
+        self.assertNotIn("triple", vars(self.macros).deferred)
+        self.assertIn("(3)", self.lissp.compile("(triple 2)"))
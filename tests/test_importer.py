@@ -0,0 +1,126 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+import tempfile
+import traceback
+from contextlib import redirect_stdout
+from importlib import import_module, invalidate_caches
+from io import StringIO
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from hissp import importer
+
+MODULE = """
+(hissp.basic.._macro_.defmacro twice (x)
+  `(operator..mul 2 ,x))
+(hissp.basic.._macro_.define answer (twice 21))
+(print "running" __name__)
+"""
+
+
+class TestImporter(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name) / "lisspkg"
+        self.root.mkdir()
+        (self.root / "__init__.lissp").write_text("(hissp.basic.._macro_.define version 1)")
+        (self.root / "mod.lissp").write_text(MODULE)
+        for p in [
+            patch("sys.path", [directory.name, *sys.path]),
+            patch("sys.path_hooks", [*sys.path_hooks]),
+            patch.dict(sys.path_importer_cache),
+            patch("sys.dont_write_bytecode", False),
+            patch.dict(sys.modules),
+        ]:
+            p.start()
+            self.addCleanup(p.stop)
+        importer.install()
+
+    def load(self):
+        for name in ["lisspkg", "lisspkg.mod"]:
+            sys.modules.pop(name, None)
+        invalidate_caches()
+        with redirect_stdout(StringIO()) as out, patch.object(
+            importer, "Lissp", wraps=importer.Lissp
+        ) as compile:
+            mod = import_module("lisspkg.mod")
+        return mod, out.getvalue(), compile.call_count
+
+    def test_import(self):
+        mod, out, compiles = self.load()
+        self.assertEqual(42, mod.answer)
+        self.assertEqual(1, sys.modules["lisspkg"].version)
+        self.assertEqual("running lisspkg.mod\n", out)  # Only once.
+        self.assertEqual(2, compiles)
+        self.assertTrue(mod.__file__.endswith("mod.lissp"))
+
+    def test_cached(self):
+        self.load()
+        mod, out, compiles = self.load()
+        self.assertEqual((42, "running lisspkg.mod\n", 0), (mod.answer, out, compiles))
+        pycs = {p.name.split(".")[0] for p in self.root.glob("__pycache__/*.lissp.pyc")}
+        self.assertEqual({"__init__", "mod"}, pycs)
+
+    def test_source_changed(self):
+        self.load()
+        (self.root / "mod.lissp").write_text(MODULE.replace("21", "4"))
+        mod, _, compiles = self.load()
+        self.assertEqual((8, 1), (mod.answer, compiles))
+
+    def test_precedence(self):
+        (self.root / "mod.py").write_text("answer = 'stale'")
+        mod, _, _ = self.load()
+        self.assertEqual(42, mod.answer)
+
+    def test_earlier_path_wins(self):
+        earlier, later = self.root.parent / "earlier", self.root.parent / "later"
+        earlier.mkdir()
+        later.mkdir()
+        (earlier / "lisspmod.py").write_text("where = 'earlier'")
+        for name in ["lisspmod", "cmath"]:
+            (later / f"{name}.lissp").write_text("(hissp.basic.._macro_.define where 'later)")
+        sys.modules.pop("cmath", None)
+        with patch("sys.path", [str(earlier), *sys.path, str(later)]):
+            invalidate_caches()
+            self.assertEqual("earlier", import_module("lisspmod").where)
+            self.assertFalse(hasattr(import_module("cmath"), "where"))
+
+    def test_error(self):
+        (self.root / "bad.lissp").write_text("(print 1)\n(operator..truediv 1 0)\n(print 2)")
+        for _ in range(2):
+            with redirect_stdout(StringIO()) as out, self.assertRaises(ZeroDivisionError):
+                import_module("lisspkg.bad")
+            self.assertEqual("1\n", out.getvalue())
+            self.assertNotIn("lisspkg.bad", sys.modules)
+        self.assertEqual([], [*self.root.glob("__pycache__/bad.*")])
+
+    def test_traceback(self):
+        (self.root / "mod.lissp").write_text(
+            MODULE + "(hissp.basic.._macro_.define oops (lambda () (operator..truediv 1 0)))"
+        )
+        self.load()
+        mod, _, _ = self.load()  # Warm.
+        try:
+            mod.oops()
+        except ZeroDivisionError as e:
+            frame = traceback.extract_tb(e.__traceback__)[-1]
+        self.assertEqual(str(self.root / "mod.py"), frame.filename)
+        self.assertEqual("__import__('operator').truediv(", frame.line)
+
+    def test_get_code(self):
+        loader = import_module("lisspkg").__spec__.loader
+        with redirect_stdout(StringIO()):
+            code = loader.get_code("lisspkg")
+        ns = {}
+        exec(code, ns)
+        self.assertEqual(1, ns["version"])
+
+    def test_install(self):
+        self.assertIs(importer.install(), importer.install())
+        self.assertEqual(1, sys.path_hooks.count(importer.path_hook))
+        importer.uninstall()
+        self.assertNotIn(importer.path_hook, sys.path_hooks)
@@ -1,13 +1,18 @@
 # Copyright 2019, 2020 Matthew Egan Odendahl
 # SPDX-License-Identifier: Apache-2.0
 
+import io
+import re
+import subprocess
+import sys
 from unittest import TestCase
+from unittest.mock import patch
 
 import hypothesis.strategies as st
 import unicodedata
 from hypothesis import given
 
-from hissp import munger
+from hissp import munger, reader
 
 
 class TestMunger(TestCase):
@@ -29,3 +34,101 @@ class TestMunger(TestCase):
     @given(st.text(st.characters(["Sm"]), min_size=1))
     def test_munge_symbol(self, s):
         self.assertTrue(munger.munge(s).isidentifier())
+
+
+def munge_reference(s: str) -> str:
+    """munge without the cache or translation tables."""
+    if s.startswith(":"):
+        return s
+    s = unicodedata.normalize("NFKC", s)
+    if s.isidentifier():
+        return s
+    parts = []
+    for part in s.split("."):
+        if part:
+            part = "".join(map(munger.x_quote, part))
+            if not part.isidentifier():
+                part = munger.force_x_quote(part[0]) + part[1:]
+        parts.append(part)
+    return ".".join(parts)
+
+
+def demunge_reference(s: str) -> str:
+    """demunge with a regex callback per match."""
+    return re.sub("x([0-9A-Zhx]+?)_", munger.un_x_quote, s)
+
+
+SYMBOLS = [
+    "foo",
+    "*earmuffs*",
+    "hissp.basic.._macro_.if-else",
+    "->>",
+    "λx",
+    "_xAUTO12_",
+    "x2020_",
+    "a.b.c",
+    "1+",
+    "<=>",
+]
+
+
+class TestMungerTables(TestCase):
+    @given(st.text(min_size=1))
+    def test_munge_reference(self, s: str):
+        self.assertEqual(munge_reference(s), munger.munge(s))
+        self.assertEqual(munge_reference(s), munger.munge.__wrapped__(s))
+
+    @given(st.text())
+    def test_demunge_reference(self, s: str):
+        self.assertEqual(demunge_reference(s), munger.demunge(s))
+        munged = munger.munge(s or "x")
+        self.assertEqual(demunge_reference(munged), munger.demunge(munged))
+
+    def test_huge_number(self):
+        self.assertEqual("tx20231018123456_", munger.demunge("tx20231018123456_"))
+        self.assertEqual("x1114112_", munger.demunge("x1114112_"))  # Past chr()'s range.
+
+    def test_unquotes_limit(self):
+        munger.UNQUOTES.pop("xSNOWMAN_", None)
+        with patch.object(munger._Unquotes, "limit", len(munger.UNQUOTES)):
+            self.assertEqual("\N{SNOWMAN}", munger.demunge("xSNOWMAN_"))
+            self.assertNotIn("xSNOWMAN_", munger.UNQUOTES)
+
+
+class TestDemungeStream(TestCase):
+    @given(st.text("xH_ABCSNOWMAN1x. -"), st.lists(st.integers(0, 40)))
+    def test_chunks(self, s: str, cuts):
+        cuts = sorted({0, len(s), *(c % (len(s) + 1) for c in cuts)})
+        chunks = [s[a:b] for a, b in zip(cuts, cuts[1:])]
+        self.assertEqual(munger.demunge(s), "".join(munger.demunge_chunks(chunks)))
+
+    def test_held_bound(self):
+        chunks = munger.demunge_chunks(["x" * 1000, "_"])
+        self.assertEqual(1000 - munger.HOLD, len(next(chunks)))
+        self.assertEqual("x" * munger.HOLD + "_", "".join(chunks))
+
+    def test_file(self):
+        infile = io.StringIO("fooxH_bar xSNOW" + "MAN_ " * 3)
+        outfile = io.StringIO()
+        munger.demunge_file(infile, outfile, size=4)
+        self.assertEqual("foo-bar \N{SNOWMAN} MAN_ MAN_ ", outfile.getvalue())
+
+    def test_excepthook(self):
+        try:
+            eval(reader.Lissp().compile("((lambda (: a-b 0) (operator..truediv 1 a-b)))"))
+        except ZeroDivisionError as e:
+            error = e
+        with patch("sys.stderr", new_callable=io.StringIO) as stderr:
+            munger.excepthook(type(error), error, error.__traceback__)
+        self.assertIn("a-b", stderr.getvalue())
+        self.assertNotIn("axH_b", stderr.getvalue())
+        self.assertIn("ZeroDivisionError", stderr.getvalue())
+
+    def test_main(self):
+        result = subprocess.run(
+            [sys.executable, "-m", "hissp.munger"],
+            input=b"xLT_lambdaxGT_ \xff xH_\n",
+            capture_output=True,
+            check=True,
+        )
+        self.assertEqual(b"<lambda> \xff -\n", result.stdout)
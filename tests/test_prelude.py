@@ -0,0 +1,51 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from hissp import cache, prelude
+from hissp.reader import Lissp
+
+
+class TestPrelude(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        for p in [
+            patch.dict(os.environ, HISSP_CACHE_DIR=directory.name),
+            patch("sys.dont_write_bytecode", False),
+        ]:
+            p.start()
+            self.addCleanup(p.stop)
+        prelude.template.cache_clear()
+        self.addCleanup(prelude.template.cache_clear)
+
+    def test_namespace(self):
+        expected = Lissp(evaluate=True)
+        expected.compile(prelude.PRELUDE)
+        ns = prelude.namespace()
+        self.assertEqual(expected.ns.keys() - {"__builtins__"}, ns.keys() - {"__builtins__"})
+        self.assertEqual(vars(expected.ns["_macro_"]), vars(ns["_macro_"]))
+        self.assertEqual("__main__", ns["__name__"])
+
+    def test_clones(self):
+        ns = prelude.namespace()
+        Lissp(ns=ns, evaluate=True).compile("(defmacro foo ())")
+        self.assertIn("foo", vars(ns["_macro_"]))
+        self.assertNotIn("foo", vars(prelude.namespace()["_macro_"]))
+
+    def test_cached(self):
+        prelude.template()
+        self.assertTrue(cache.entry(prelude.PRELUDE).exists())
+        self.assertIs(prelude.template(), prelude.template())
+        prelude.template.cache_clear()
+        with patch.object(prelude, "Lissp") as lissp:
+            prelude.namespace()
+        lissp.assert_not_called()
+
+    def test_entry(self):
+        code = "(print (add 1 2))"
+        self.assertNotEqual(cache.entry(code), cache.entry(code, prelude.namespace()))
@@ -1,9 +1,17 @@
 # Copyright 2019, 2020 Matthew Egan Odendahl
 # SPDX-License-Identifier: Apache-2.0
 
+import importlib.util
 import math
+import os
+import sys
+import tempfile
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from fractions import Fraction
+from io import StringIO
+from importlib import resources
 from types import SimpleNamespace
 from unittest import TestCase
 from unittest.mock import ANY, patch
@@ -12,6 +20,7 @@ import hypothesis.strategies as st
 from hypothesis import given
 
 from hissp import reader
+from hissp.compiler import CompileError, PostCompileWarning
 
 STRING_ANY_ = [("string", ANY, ANY)]
 
@@ -184,3 +193,100 @@ r'''\b\u\i\l\t\i\n\s..\f\l\o\a\t#\i\n\f''': [math.inf],
 }
 
 
+class TestTranspile(TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.module = os.path.join(self.dir.name, "spam")
+        with open(self.module + ".lissp", "w") as f:
+            f.write("(hissp.basic.._macro_.define eggs (operator..add 40 2))")
+        sys.path.insert(0, self.dir.name)
+
+    def tearDown(self):
+        sys.path.remove(self.dir.name)
+        sys.modules.pop("spam", None)
+        self.dir.cleanup()
+
+    @patch("sys.dont_write_bytecode", False)
+    def test_pyc(self):
+        reader.transpile(None, self.module)
+        pyc = importlib.util.cache_from_source(self.module + ".py")
+        mtime = os.stat(pyc).st_mtime_ns
+        self.assertEqual(42, importlib.import_module("spam").eggs)
+        self.assertEqual(mtime, os.stat(pyc).st_mtime_ns)  # Import found it valid.
+
+    @patch("sys.dont_write_bytecode", False)
+    def test_pyc_skipped(self):
+        out = os.fsencode(self.module + ".py")  # Bytes paths work too.
+        pyc = importlib.util.cache_from_source(self.module + ".py")
+        with self.assertWarns(PostCompileWarning):
+            reader._write_py(out, "spam", '(print 1)\n.#"1 +"')
+        self.assertTrue(os.path.exists(self.module + ".py"))
+        self.assertFalse(os.path.exists(pyc))
+        reader._write_py(out, "spam", "(print 1)")
+        self.assertTrue(os.path.exists(pyc))
+        self.assertEqual(["spam.cpython"], [n[:12] for n in os.listdir(os.path.dirname(pyc))])
+
+    def test_gensyms_per_module(self):
+        a = os.path.join(self.dir.name, "a")
+        b = os.path.join(self.dir.name, "b")
+        with open(a + ".lissp", "w") as f:
+            f.write(
+                "(hissp.basic.._macro_.defmacro m (body)"
+                "  `(hissp.basic.._macro_.let ($#x 1) ,body))"
+            )
+        with open(b + ".lissp", "w") as f:
+            f.write(
+                "(hissp.basic.._macro_.defmacro n ()"
+                "  `(hissp.basic.._macro_.let ($#x 2) (a.._macro_.m $#x)))"
+                "(print (n))"
+            )
+        self.addCleanup(sys.modules.pop, "a", None)
+        with redirect_stdout(StringIO()) as out:
+            reader.transpile(None, a, b)
+        self.assertEqual("2\n", out.getvalue())
+
+    def test_failed_keeps_output(self):
+        reader.transpile(None, self.module)
+        with open(self.module + ".lissp", "a") as f:
+            f.write("\n(print 1)\n(spam.._macro_.nonesuch)")
+        with self.assertRaises(CompileError):
+            reader.transpile(None, self.module)
+        with open(self.module + ".py") as f:
+            self.assertNotIn("print", f.read())
+        self.assertEqual(["spam.lissp", "spam.py"], sorted(os.listdir(self.dir.name)))
+
+    def test_mode_kept(self):
+        reader.transpile(None, self.module)
+        os.chmod(self.module + ".py", 0o751)
+        reader.transpile(None, self.module)
+        self.assertEqual(0o751, os.stat(self.module + ".py").st_mode & 0o777)
+
+    def test_compile_iter(self):
+        forms = reader.Lissp(evaluate=True).compile_iter("(print 1) (print 2)")
+        with redirect_stdout(StringIO()) as out:
+            self.assertEqual("print(\n  (1))", next(forms))
+        self.assertEqual("1\n", out.getvalue())  # The rest isn't done yet.
+        with redirect_stdout(StringIO()) as out:
+            self.assertEqual(["print(\n  (2))"], [*forms])
+        self.assertEqual("2\n", out.getvalue())
+
+
+class TestConcurrency(TestCase):
+    def test_threads_match_sequential(self):
+        code = resources.read_text("hissp", "basic.lissp")
+
+        def compile(i):
+            return reader.Lissp(f"basic{i}", evaluate=True).compile(code)
+
+        sequential = [*map(compile, range(16))]
+        with ThreadPoolExecutor(8) as executor:
+            concurrent = [*executor.map(compile, range(16))]
+        self.assertEqual(sequential, concurrent)
+
+    def test_reentrant(self):
+        parser = reader.Lissp()
+        parser.ns["_macro_"] = SimpleNamespace(inner=lambda _: parser.compile("`$#x"))
+        [(_, _, _, first, _, inner, _, last)] = parser.reads("`($#x inner#y $#x)")
+        self.assertEqual(first, last)
+        self.assertEqual(("quote", "_xxAUTO1_"), first)
+        self.assertEqual("__main__..'_xxAUTO2_'", inner[1])
@@ -0,0 +1,118 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from hissp import client, server
+
+
+class TestServer(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.dir = Path(directory.name)
+        self.socket = str(self.dir / "hissp.sock")
+        for p in [patch("sys.path", [directory.name, *sys.path]), patch.dict(sys.modules)]:
+            p.start()
+            self.addCleanup(p.stop)
+        self.server = server.Server(self.socket)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(client.request, self.socket, op="stop")
+
+    def test_compile(self):
+        python = client.compile("(hissp.basic.._macro_.define x 1)", self.socket)
+        self.assertIn("'x'", python)
+        python = client.compile("(print 1 2)", self.socket, compact=True)
+        self.assertEqual("print((1),(2))", python)
+
+    def test_error(self):
+        with self.assertRaisesRegex(client.ServerError, "CompileError"):
+            client.compile("(nonesuch.._macro_.x)", self.socket)
+        with self.assertRaisesRegex(client.ServerError, "Unknown op"):
+            client.request(self.socket, op="nonesuch")
+
+    def test_transpile(self):
+        macros = self.dir / "spam.py"
+        macros.write_text("class _macro_:\n    eggs = lambda: 1\n")
+        module = self.dir / "ham.lissp"
+        module.write_text("(hissp.basic.._macro_.define x (spam.._macro_.eggs))")
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.dir.parent)  # Paths are relative to the client.
+        client.transpile(None, os.path.join(self.dir.name, "ham"), path=self.socket)
+        self.assertIn("(1)", module.with_suffix(".py").read_text())
+        macros.write_text("class _macro_:\n    eggs = lambda: 12\n")
+        client.transpile(None, str(self.dir / "ham"), path=self.socket)
+        self.assertIn("(12)", module.with_suffix(".py").read_text())  # Not stale.
+
+    def test_serialized(self):
+        active, most = [0], [0]
+        dispatch = self.server._dispatch
+
+        def tracked(message):
+            active[0] += 1
+            most[0] = max(most[0], active[0])
+            time.sleep(0.02)
+            try:
+                return dispatch(message)
+            finally:
+                active[0] -= 1
+
+        with patch.object(self.server, "_dispatch", tracked):
+            threads = [
+                threading.Thread(target=client.compile, args=("(print 1)", self.socket))
+                for _ in range(4)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertEqual(1, most[0])
+
+
+class TestSocketPath(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.dir = directory.name
+        for p in [
+            patch.dict(os.environ),
+            patch("tempfile.tempdir", self.dir),
+        ]:
+            p.start()
+            self.addCleanup(p.stop)
+        os.environ.pop("HISSP_SOCKET", None)
+        os.environ.pop("XDG_RUNTIME_DIR", None)
+
+    def test_default_path(self):
+        path = client.default_path()
+        self.assertEqual(os.path.join(self.dir, f"hissp-{os.getuid()}", "hissp.sock"), path)
+        client.private_dir(path)
+        self.assertEqual(0o700, os.stat(os.path.dirname(path)).st_mode & 0o777)
+        os.environ["XDG_RUNTIME_DIR"] = self.dir
+        self.assertEqual(os.path.join(self.dir, "hissp.sock"), client.default_path())
+
+    def test_shared_dir_refused(self):
+        path = client.default_path()
+        os.mkdir(os.path.dirname(path), 0o777)
+        os.chmod(os.path.dirname(path), 0o777)
+        with self.assertRaises(PermissionError):
+            client.private_dir(path)
+        with self.assertRaises(PermissionError):
+            server.Server()
+
+    def test_not_a_socket(self):
+        path = os.path.join(self.dir, "hissp.sock")
+        Path(path).write_text("")
+        with self.assertRaises(FileExistsError):
+            server.Server(path)
+        self.assertTrue(os.path.exists(path))
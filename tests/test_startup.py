@@ -0,0 +1,85 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+"""
+Startup tests. They check that the heavy modules aren't imported.
+
+Run this module directly to print the import times
+(from ``python -X importtime``).
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+# Only needed on error or fallback paths, or by other entry points.
+DEFERRED = {
+    "asyncio",
+    "hashlib",
+    "hissp.basic",
+    "hissp.cache",
+    "hissp.repl",
+    "hissp.server",
+    "importlib.resources",
+    "pathlib",
+    "pickle",
+    "pickletools",
+    "pprint",
+    "traceback",
+    "unittest.mock",
+}
+
+
+def loaded(code):
+    """The modules loaded after running the code in a fresh interpreter."""
+    out = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    ).stdout
+    return set(out.split())
+
+
+def import_times(*args):
+    """Cumulative import time of each module, in microseconds."""
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    for _ in range(2):  # The first run may write the .pyc files.
+        err = subprocess.run(
+            [sys.executable, "-X", "importtime", *args],
+            env=env,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        ).stderr
+    times = {}
+    for line in err.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestStartup(TestCase):
+    def test_import(self):
+        for code in ["import hissp", "import hissp.reader"]:
+            modules = loaded(code)
+            self.assertIn(code.split()[1], modules)
+            self.assertEqual(set(), DEFERRED & modules, code)
+
+    def test_script(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".lissp", delete=False) as f:
+            f.write("(print 1)")
+        self.addCleanup(os.remove, f.name)
+        with patch.dict(os.environ):
+            os.environ.pop("HISSP_CACHE_DIR", None)  # Off, by default.
+            times = import_times("-m", "hissp", f.name)
+        self.assertEqual(set(), DEFERRED & times.keys())
+
+
+if __name__ == "__main__":
+    for module, us in sorted(import_times("-c", "import hissp.reader").items()):
+        print(f"{us:>8} us  {module}")
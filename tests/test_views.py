@@ -0,0 +1,67 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import TestCase
+
+from hissp.reader import Lissp
+from hissp.views import View
+
+# Walks to the end of xs with cdr, without recursing. Returns each step.
+WALK = """
+(lambda (xs)
+  (hissp.basic.._macro_.let (cell [None]
+                             steps [])
+    (operator..setitem cell 0 xs)
+    (hissp.basic.._macro_.loop-while (operator..getitem cell 0)
+      (operator..setitem cell 0 (hissp.basic.._macro_.cdr (operator..getitem cell 0)))
+      (.append steps (operator..getitem cell 0)))
+    steps))
+"""
+
+
+class TestView(TestCase):
+    def test_sequence(self):
+        v = View((0, 1, 2, 3, 4, 5))
+        self.assertEqual((0, 1, 2, 3, 4, 5), v)
+        self.assertEqual((2, 3, 4, 5), v[2:])
+        self.assertEqual((5, 3), v[::-2][:2])
+        self.assertEqual((3, 4), v[1:][2:4])
+        self.assertEqual(5, v[1:][-1])
+        self.assertEqual([1, 2], [*v[1:3]])
+        self.assertFalse(v[6:])
+        self.assertIn(4, v[1:])
+        self.assertEqual(2, v.index(2))
+        with self.assertRaises(IndexError):
+            v[2:][4]
+
+    def test_shared(self):
+        xs = (1, 2, 3)
+        v = View(View(xs)[1:])[1:]
+        self.assertIs(xs, v._sequence)
+        self.assertEqual(range(2, 3), v._range)
+        self.assertEqual(hash((3,)), hash(v))
+
+    def test_macros(self):
+        v = View("abcd")
+        self.assertEqual(
+            ("a", ("b", "c", "d"), ("c", "d")),
+            eval(
+                Lissp().compile(
+                    """
+                    ((lambda (: :* xs) xs)
+                     (hissp.basic.._macro_.car v)
+                     (hissp.basic.._macro_.cdr v)
+                     (hissp.basic.._macro_.cddr v))
+                    """
+                )
+            ),
+        )
+
+    def test_linear(self):
+        walk = eval(Lissp().compile(WALK))
+        xs = tuple(range(1000))
+        steps = walk(View(xs))
+        self.assertEqual(1000, len(steps))
+        for i, step in enumerate(steps, 1):  # Each cdr is O(1): no copies.
+            self.assertIs(xs, step._sequence)
+            self.assertEqual(range(i, 1000), step._range)
@@ -0,0 +1,78 @@
+# Copyright 2020 Matthew Egan Odendahl
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from hissp import watch
+from hissp.reader import Lissp, transpile_module
+
+CODE = """\
+;; Expensive.
+(hissp.basic.._macro_.define data (print "loading"))
+'`$#a
+(print "answer" (operator..mul 6 7))
+'_#ignored `$#b
+"""
+
+
+class TestWatch(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.file = Path(directory.name) / "hot.lissp"
+        self.file.write_text(CODE)
+        self.watcher = watch.Watcher(self.file)
+
+    def reload(self, code=None):
+        if code is not None:
+            self.file.write_text(code)
+        with redirect_stdout(StringIO()) as out:
+            n = self.watcher.reload()
+        expected = Lissp("hot", evaluate=True).compile(self.file.read_text())
+        self.assertEqual(expected, self.file.with_suffix(".py").read_text())
+        return n, out.getvalue()
+
+    def test_split(self):
+        self.assertEqual(
+            [
+                '(hissp.basic.._macro_.define data (print "loading"))',
+                "'`$#a",
+                '(print "answer" (operator..mul 6 7))',
+                "'_#ignored `$#b",
+            ],
+            watch.split(CODE),
+        )
+
+    def test_reload(self):
+        self.assertEqual((4, "loading\nanswer 42\n"), self.reload())
+        self.assertEqual((0, ""), self.reload())
+        code = CODE.replace("7", "8")
+        self.assertEqual((2, "answer 48\n"), self.reload(code))
+        self.assertEqual((0, ""), self.reload(code.replace(";;", ";")))
+        self.assertEqual((1, ""), self.reload(code + "42"))
+        self.assertIn("data", self.watcher.lissp.ns)
+
+    def test_package(self):
+        root = self.file.parent / "hotpkg"
+        (root / "sub").mkdir(parents=True)
+        (root / "__init__.py").touch()
+        (root / "sub" / "__init__.lissp").touch()
+        module = root / "sub" / "mod.lissp"
+        module.write_text("(hissp.basic.._macro_.define x '`(helper $#y))")
+        self.assertEqual("hotpkg.sub.mod", watch.module_name(module))
+        for p in [patch("sys.path", [str(self.file.parent), *sys.path]), patch.dict(sys.modules)]:
+            p.start()
+            self.addCleanup(p.stop)
+        (root / "sub" / "__init__.py").touch()
+        with redirect_stderr(StringIO()):
+            transpile_module("hotpkg.sub", "mod.lissp")
+        expected = module.with_suffix(".py").read_text()
+        watch.Watcher(module).reload()
+        self.assertEqual(expected, module.with_suffix(".py").read_text())
+        self.assertIn("'hotpkg.sub.mod..xAUTO_.helper'", expected)